@@ -0,0 +1,73 @@
+"""
+benchmarks/_common.py
+
+Shared setup for the benchmark scripts: headless SDL, the game's code/
+directory on sys.path and a small timing helper.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+CODE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code")
+if CODE_PATH not in sys.path:
+    sys.path.insert(0, CODE_PATH)
+
+
+def init_display(window_size=None, scale_mode="integer", game_display=False):
+    """
+    Initialise pygame with a headless window.
+
+    A window the game's logical size is its own canvas, so it is opened
+    directly: importing core.display would import the whole core package,
+    which startup.py times separately. Other sizes go through core.display.
+
+    Args:
+        window_size: Window size; defaults to the game's logical size
+        scale_mode: How the logical canvas is scaled into the window
+        game_display: Open the window through core.display whatever its
+            size, for scripts that run main.run_frame, which draws on
+            display.canvas
+
+    Returns:
+        The logical canvas the game draws on
+    """
+    import pygame
+    from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    pygame.init()
+    logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    if window_size is None:
+        window_size = logical_size
+    if tuple(window_size) == logical_size and not game_display:
+        return pygame.display.set_mode(logical_size)
+
+    from core.display import display
+    return display.open(window_size, scale_mode, resizable=False)
+
+
+def time_call(func, repeat=200):
+    """
+    Time a callable.
+
+    Args:
+        func: Zero-argument callable to time
+        repeat: Number of calls
+
+    Returns:
+        (best, mean) duration of a single call in milliseconds
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return min(durations), sum(durations) / len(durations)
+
+
+def report(name, best, mean, unit="ms"):
+    """Print one benchmark result line."""
+    print(f"{name:<40} best {best:8.3f} {unit}   mean {mean:8.3f} {unit}")
@@ -0,0 +1,147 @@
+"""
+benchmarks/alloc_check.py
+
+Checks that the allocation tracker (core/alloc_tracker.py) counts Surfaces
+whatever made them: copies and conversions of Font.render, transform and
+image.load results included, with the copied Surfaces pixel for pixel the
+same as untracked ones. Then plays a little of a run with a fresh tracker
+and prints its report, to show where steady-state frames still allocate.
+
+Usage: python benchmarks/alloc_check.py [frames]
+
+Exits with status 1 when a check fails.
+"""
+
+import random
+import sys
+
+import _common
+
+WHITE = (255, 255, 255)
+GOLD = (230, 200, 120)
+
+
+def count_cases(pygame, font, image_path, image, destination):
+    """(name, Surfaces that should be counted, callable) for each count check."""
+    return (
+        ("Font.render", 1, lambda: font.render("Scoundrel", True, GOLD)),
+        ("Font.render().copy()", 2, lambda: font.render("Scoundrel", True, GOLD).copy()),
+        ("Font.render(background).convert()", 2, lambda: font.render("9/20", True, WHITE, (20, 20, 30)).convert()),
+        ("image.load().copy()", 2, lambda: pygame.image.load(image_path).copy()),
+        ("transform.scale().convert_alpha()", 2, lambda: pygame.transform.scale(image, (40, 56)).convert_alpha()),
+        ("transform.flip().subsurface()", 2, lambda: pygame.transform.flip(image, True, False).subsurface((0, 0, 8, 8))),
+        ("transform.scale into a destination", 0, lambda: pygame.transform.scale(image, destination.get_size(), destination)),
+    )
+
+
+def pixel_cases(pygame, font, image_path):
+    """(name, callable) for each Surface compared with an untracked one."""
+    return (
+        ("antialiased text", lambda: font.render("Dragon Egg, V", True, GOLD)),
+        ("plain text", lambda: font.render("Dragon Egg, V", False, GOLD)),
+        ("text on a background", lambda: font.render("12/20", True, WHITE, (10, 20, 30))),
+        ("loaded image", lambda: pygame.image.load(image_path)),
+        ("rotated image", lambda: pygame.transform.rotate(pygame.image.load(image_path), 30)),
+    )
+
+
+def check(image_path):
+    """
+    Run the count and pixel checks with a tracker of their own.
+
+    Returns:
+        Names of the checks that failed
+    """
+    import pygame
+    from core.alloc_tracker import AllocationTracker
+
+    image = pygame.image.load(image_path)
+    destination = pygame.Surface((64, 90))
+
+    tracker = AllocationTracker()
+    tracker.install()
+    font = pygame.font.Font(None, 24)
+
+    failures = []
+    try:
+        for name, expected, make in count_cases(pygame, font, image_path, image, destination):
+            tracker.end_frame()
+            make()
+            tracker.end_frame()
+            counted = tracker.window[-1][0]
+            print(f"{name:<40} {counted} counted, {expected} expected")
+            if counted != expected:
+                failures.append(name)
+
+        cases = pixel_cases(pygame, font, image_path)
+        tracked = [make() for _, make in cases]
+    finally:
+        tracker.uninstall()
+
+    plain_font = pygame.font.Font(None, 24)
+    for (name, _), ours, theirs in zip(cases, tracked, (make() for _, make in pixel_cases(pygame, plain_font, image_path))):
+        same = (
+            type(ours) is not pygame.Surface
+            and pygame.image.tobytes(ours, "RGBA") == pygame.image.tobytes(theirs, "RGBA")
+            and ours.get_masks() == theirs.get_masks()
+            and ours.get_colorkey() == theirs.get_colorkey()
+            and ours.get_alpha() == theirs.get_alpha()
+        )
+        print(f"{name:<40} {'same' if same else 'DIFFERENT'}")
+        if not same:
+            failures.append(name)
+
+    return failures
+
+
+def play(screen, frames):
+    """Play part of a run with a fresh tracker and print its report."""
+    import pygame
+    from core.alloc_tracker import AllocationTracker
+    from core.game_manager import GameManager
+
+    tracker = AllocationTracker()
+    tracker.install()
+    try:
+        random.seed(1)
+        game_manager = GameManager()
+        game_manager.has_shown_tutorial = True
+        game_manager.change_state_instant("playing")
+        playing_state = game_manager.current_state
+
+        for frame in range(frames):
+            if game_manager.current_state is not playing_state:
+                break
+            room = playing_state.session.room
+            if frame % 30 == 0 and room.cards and not playing_state.animation_manager.is_animating():
+                card = random.choice(room.cards)
+                game_manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=card.rect.center, button=1))
+            game_manager.update(1 / 60)
+            game_manager.draw(screen)
+            tracker.end_frame()
+
+        print("\n".join(tracker.report()))
+    finally:
+        tracker.uninstall()
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+
+    screen = _common.init_display()
+
+    from config import relative_to_assets
+
+    failures = check(str(relative_to_assets("cards/card_back.png")))
+    if failures:
+        print(f"FAIL  {', '.join(failures)}")
+        return 1
+    print("ok")
+
+    print()
+    play(screen, frames)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+benchmarks/asset_cold_start.py
+
+Compares cold start from loose PNGs against the packed asset archive.
+Each measurement runs in a fresh interpreter so no image cache carries over.
+It times building the GameManager (which enters the title screen) and
+composing every card face a floor can deal.
+
+Build the archive first with:  python code/pack_assets.py
+
+Usage: python benchmarks/asset_cold_start.py [runs]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import _common
+
+MODES = ("loose", "archive")
+
+
+def child(mode):
+    """Measure one cold start in this process and print the timings as JSON."""
+    import pygame
+
+    start = time.perf_counter()
+    _common.init_display()
+
+    from core.resource_loader import ResourceLoader
+    if mode == "loose":
+        ResourceLoader._archive_checked = True
+        ResourceLoader._archive = None
+    elif ResourceLoader.get_archive() is None:
+        raise SystemExit("No asset archive found; run code/pack_assets.py first")
+    imported = time.perf_counter()
+
+    from core.game_manager import GameManager
+    GameManager()
+    title_ready = time.perf_counter()
+
+    from entities.card_model import CardModel
+    from entities.card import CardTextures
+    for suit in ("spades", "clubs", "diamonds", "hearts"):
+        for value in range(2, 15):
+            CardTextures.face(CardModel(suit, value))
+    faces_ready = time.perf_counter()
+
+    print(json.dumps({
+        "startup_to_title_ms": (title_ready - imported) * 1000,
+        "card_faces_ms": (faces_ready - title_ready) * 1000,
+        "total_ms": (faces_ready - start) * 1000,
+    }))
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = {mode: [] for mode in MODES}
+
+    for _ in range(runs):
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", mode],
+                capture_output=True, text=True, check=True
+            ).stdout
+            results[mode].append(json.loads(output.strip().splitlines()[-1]))
+
+    for metric in ("startup_to_title_ms", "card_faces_ms", "total_ms"):
+        print(metric)
+        for mode in MODES:
+            values = [run[metric] for run in results[mode]]
+            _common.report(f"  {mode}", min(values), sum(values) / len(values))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main()
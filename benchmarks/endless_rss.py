@@ -0,0 +1,141 @@
+"""
+benchmarks/endless_rss.py
+
+Memory watermark for endless runs. Plays an endless run headlessly through
+the real GameManager, clearing floor after floor, and samples the process's
+resident set size as it goes. Once the warm-up floors have filled the
+texture and text caches, RSS should stay flat however many floors follow;
+the check fails when it grows by more than the tolerance.
+
+Cards are taken the simplest way (see scenarios.Harness.resolve_any) and
+life is topped up at each new floor, so the run never ends. To get through
+a thousand floors in reasonable time frames step the game by DRIVE_DELTA
+and only every DRAW_EVERY-th frame is drawn.
+
+Usage:
+    python benchmarks/endless_rss.py [--floors N] [--warmup N] [--sample N]
+                                     [--tolerance MB] [--seed N]
+
+Exits with status 1 when RSS grows past the tolerance.
+"""
+
+import argparse
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import _common
+from scenarios import Harness, ScenarioFailed
+
+# Seconds each frame advances the game by
+DRIVE_DELTA = 0.1
+
+# Draw one frame in this many
+DRAW_EVERY = 10
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unknown."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current, but still shows steady growth
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class EndlessHarness(Harness):
+    """A Harness stepped in coarse, mostly undrawn frames that keeps no per-frame records."""
+
+    def __init__(self, screen, seed, save_dir):
+        super().__init__(screen, seed, save_dir)
+        self.frame_count = 0
+
+    def frame(self, events=()):
+        for event in events:
+            self.game_manager.handle_event(event)
+        self.game_manager.update(DRIVE_DELTA)
+
+        self.frame_count += 1
+        if self.frame_count % DRAW_EVERY == 0:
+            self.game_manager.draw(self.screen)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--floors", type=int, default=1000, help="floors to clear")
+    parser.add_argument("--warmup", type=int, default=50, help="floors cleared before the baseline is taken")
+    parser.add_argument("--sample", type=int, default=50, help="floors between RSS samples")
+    parser.add_argument("--tolerance", type=float, default=16.0, help="RSS growth allowed after warm-up, in MB")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args()
+    if not 1 <= args.warmup <= args.floors:
+        parser.error("--warmup must be at least 1 and at most --floors: the baseline is taken after it")
+
+    if current_rss() is None:
+        print("RSS is not available on this platform")
+        return 0
+
+    screen = _common.init_display()
+
+    from entities.card_pool import card_pool
+
+    save_dir = tempfile.mkdtemp(prefix="scoundrel_endless_")
+    harness = EndlessHarness(screen, args.seed, save_dir)
+    try:
+        harness.start_run()
+        floor_manager = harness.game_manager.floor_manager
+        floor_manager.endless = True
+
+        baseline = None
+        start = time.perf_counter()
+        print(f"{'floor':>6} {'rss MB':>8} {'growth':>8} {'cards built':>12} {'reused':>8} {'s/floor':>8}")
+
+        while floor_manager.current_floor_index < args.floors:
+            floor_index = floor_manager.current_floor_index
+            session = harness.session
+            session.life_points = session.max_life
+
+            harness.step(f"floor {floor_index}")
+            while floor_manager.current_floor_index == floor_index:
+                harness.resolve_any()
+
+            cleared = floor_manager.current_floor_index
+            if cleared == args.warmup or (cleared % args.sample == 0 and cleared >= args.warmup):
+                gc.collect()
+                rss = current_rss()
+                if baseline is None:
+                    baseline = rss
+                print(
+                    f"{cleared:>6} {rss / 2**20:8.1f} {(rss - baseline) / 2**20:+8.1f} "
+                    f"{card_pool.created:>12} {card_pool.reused:>8} "
+                    f"{(time.perf_counter() - start) / cleared:8.2f}"
+                )
+    except ScenarioFailed as error:
+        print(f"FAIL  {error}")
+        return 1
+    finally:
+        harness.game_manager.autosaver.flush()
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+    gc.collect()
+    growth = (current_rss() - baseline) / 2**20
+    if growth > args.tolerance:
+        print(f"FAIL  RSS grew {growth:.1f} MB after floor {args.warmup} (tolerance {args.tolerance:.1f} MB)")
+        return 1
+    print(f"ok    RSS grew {growth:.1f} MB after floor {args.warmup} (tolerance {args.tolerance:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+benchmarks/hit_test.py
+
+Cost of resolving the cursor against the board: one MOUSEMOTION through the
+playing state's input handler and one inventory click lookup, with a long
+defeated-monster stack on the weapon (stress decks make these stacks grow
+far past a normal run).
+
+Usage: python benchmarks/hit_test.py [stack size] [repeat]
+"""
+
+import random
+import sys
+
+import _common
+
+
+def main():
+    stack_size = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    screen = _common.init_display()
+
+    import pygame
+    from pygame.locals import MOUSEMOTION
+
+    from config import SCREEN_WIDTH, SCREEN_HEIGHT
+    from core.game_manager import GameManager
+    from entities.card import Card
+
+    def settle(frames=120):
+        for _ in range(frames):
+            game_manager.update(1 / 60)
+            game_manager.draw(screen)
+
+    random.seed(1)
+    game_manager = GameManager()
+    game_manager.has_shown_tutorial = True
+    game_manager.change_state("playing")
+    settle()
+
+    playing = game_manager.current_state
+    session = playing.session
+
+    weapon = Card("diamonds", 10)
+    weapon.face_up = True
+    session.add_to_room(weapon)
+    playing.card_action_manager.equip_weapon(weapon)
+    settle()
+
+    for index in range(stack_size):
+        monster = Card("clubs", 2 + index % 13)
+        monster.face_up = True
+        monster.update_position(weapon.rect.topleft)
+        session.add_defeated_monster(monster)
+    playing.animation_controller.position_monster_stack()
+    settle()
+
+    positions = [(random.randrange(SCREEN_WIDTH), random.randrange(SCREEN_HEIGHT)) for _ in range(repeat)]
+    events = iter([pygame.event.Event(MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)) for pos in positions] * 2)
+    clicks = iter(positions * 2)
+
+    handler = playing.input_handler
+    best, mean = _common.time_call(lambda: handler.handle_event(next(events), playing.animation_manager), repeat)
+    _common.report(f"hover ({stack_size} defeated)", best * 1000, mean * 1000, "us")
+
+    inventory = playing.inventory_manager
+    best, mean = _common.time_call(lambda: inventory.get_inventory_card_at_position(next(clicks)), repeat)
+    _common.report("inventory click lookup", best * 1000, mean * 1000, "us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+benchmarks/idle_cpu.py
+
+CPU used by the main loop while the playing screen sits idle, with idle
+throttling off, on, and on with the card bob frozen. Each mode runs
+main.run_frame on a settled board; once the throttle has had time to
+engage, process CPU time is measured as a share of wall-clock time over
+a stretch of frames, along with frames run and drawn.
+
+A mouse event is then posted from another thread, and the time until the
+loop hands it to the game is reported, to check that a throttled loop
+wakes straight away.
+
+Usage: python benchmarks/idle_cpu.py [seconds per mode]
+"""
+
+import random
+import sys
+import threading
+import time
+
+import _common
+
+
+def run_mode(screen, name, seconds, enabled, freeze_float):
+    """Run one pacing mode on a fresh idle board and print its line."""
+    import pygame
+
+    import main
+    from config import IDLE_THROTTLE_DELAY
+    from core.frame_pacer import FramePacer
+    from core.game_manager import GameManager
+
+    random.seed(1)
+    game_manager = GameManager()
+    game_manager.has_shown_tutorial = True
+    game_manager.change_state_instant("playing")
+    for _ in range(150):
+        game_manager.update(1 / 60)
+        game_manager.draw(screen)
+    pygame.event.clear()
+
+    pacer = FramePacer(pygame.time.Clock(), enabled=enabled, freeze_float=freeze_float)
+
+    # Note when the posted event reaches the game
+    wake = {}
+    handle_event = game_manager.handle_event
+
+    def recording_handle_event(event):
+        if getattr(event, "probe", False) and "handled" not in wake:
+            wake["handled"] = time.perf_counter()
+        handle_event(event)
+
+    game_manager.handle_event = recording_handle_event
+
+    def post_probe():
+        wake["posted"] = time.perf_counter()
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(2, 2), rel=(0, 0), buttons=(0, 0, 0), probe=True))
+
+    def run_for(duration):
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            main.run_frame(game_manager, pacer)
+
+    # Give the throttle time to engage
+    run_for(IDLE_THROTTLE_DELAY + 0.5)
+
+    frames, drawn_frames = pacer.frames, pacer.drawn_frames
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    run_for(seconds)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    frames = pacer.frames - frames
+    drawn_frames = pacer.drawn_frames - drawn_frames
+
+    # Sleep in the loop, or not, until the event arrives
+    timer = threading.Timer(0.1, post_probe)
+    timer.start()
+    run_for(0.5)
+    timer.cancel()
+
+    wake_ms = (wake["handled"] - wake["posted"]) * 1000 if "handled" in wake else float("nan")
+    print(
+        f"{name:<18} cpu {cpu / wall * 100:6.1f}%   "
+        f"frames {frames / wall:6.1f}/s   drawn {drawn_frames / wall:6.1f}/s   "
+        f"input wake {wake_ms:6.1f} ms"
+    )
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    screen = _common.init_display(game_display=True)
+
+    run_mode(screen, "full rate", seconds, enabled=False, freeze_float=False)
+    run_mode(screen, "throttled", seconds, enabled=True, freeze_float=False)
+    run_mode(screen, "throttled, frozen", seconds, enabled=True, freeze_float=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+benchmarks/input_flood.py
+
+Per-frame input cost under a mouse-motion flood: a high-rate mouse delivers
+many MOUSEMOTION events between frames. Each timed frame dispatches a batch
+of motion events across the room and runs one update, the way main.py's
+loop does.
+
+Usage: python benchmarks/input_flood.py [events per frame] [frames]
+"""
+
+import random
+import sys
+
+import _common
+
+
+def main():
+    per_frame = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    screen = _common.init_display()
+
+    import pygame
+    from pygame.locals import MOUSEMOTION
+
+    from core.game_manager import GameManager
+
+    random.seed(1)
+    game_manager = GameManager()
+    game_manager.has_shown_tutorial = True
+    game_manager.change_state("playing")
+    for _ in range(120):
+        game_manager.update(1 / 60)
+        game_manager.draw(screen)
+
+    room = game_manager.current_state.session.room
+    left = min(card.rect.left for card in room.cards)
+    right = max(card.rect.right for card in room.cards)
+    top = min(card.rect.top for card in room.cards)
+    bottom = max(card.rect.bottom for card in room.cards)
+
+    def frame():
+        for _ in range(per_frame):
+            pos = (random.randrange(left, right), random.randrange(top, bottom))
+            game_manager.handle_event(pygame.event.Event(MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)))
+        game_manager.update(1 / 60)
+
+    best, mean = _common.time_call(frame, frames)
+    _common.report(f"{per_frame} motion events + update", best, mean)
+
+
+if __name__ == "__main__":
+    main()
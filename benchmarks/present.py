@@ -0,0 +1,81 @@
+"""
+benchmarks/present.py
+
+Cost of a frame at reduced internal resolution against the native one.
+
+For each window size and internal scale the playing frame is drawn onto the
+canvas and present() scales it into the window. At scale 1 the canvas is
+the logical size (or the window itself, when they match); below 1 it is a
+ReducedCanvas and every layer the frame fills is that much smaller. The
+"saved" column is the drop in draw plus present against scale 1 in the same
+window, which is what a weak machine gets back from INTERNAL_SCALE.
+
+The scales of each window are timed in turn over several rounds and each
+keeps its best, so slow drift in the machine's speed does not favour one.
+
+Usage: python benchmarks/present.py [repeat] [scale mode]
+"""
+
+import random
+import sys
+
+import _common
+
+WINDOW_SIZES = ((1222, 686), (1920, 1080), (2560, 1440))
+INTERNAL_SCALES = (1.0, 0.75, 0.5)
+
+# Untimed frames after each switch, so scaled copies of shared surfaces exist
+WARMUP_FRAMES = 10
+
+# Rounds the timed frames of each configuration are spread over
+ROUNDS = 5
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+
+    import pygame
+    from config import PRESENT_SCALE_MODE
+    from core.display import display
+    from core.game_manager import GameManager
+
+    mode = sys.argv[2] if len(sys.argv) > 2 else PRESENT_SCALE_MODE
+
+    canvas = _common.init_display()
+    random.seed(1)
+    game_manager = GameManager()
+    game_manager.has_shown_tutorial = True
+    game_manager.change_state_instant("playing")
+    for _ in range(120):
+        game_manager.update(1 / 60)
+        game_manager.draw(canvas)
+
+    print(f"{'window':<11} {'scale':>5} {'canvas':>9} {'draw':>8} {'present':>9} {'total':>8} {'saved':>8}   ({mode}, ms, best of {repeat})")
+    for window_size in WINDOW_SIZES:
+        best = {internal_scale: [float("inf"), float("inf")] for internal_scale in INTERNAL_SCALES}
+        canvas_sizes = {}
+        for _ in range(ROUNDS):
+            for internal_scale in INTERNAL_SCALES:
+                canvas = display.open(window_size, mode, resizable=False, internal_scale=internal_scale)
+                canvas_sizes[internal_scale] = pygame.Surface.get_size(canvas)
+                for _ in range(WARMUP_FRAMES):
+                    game_manager.draw(canvas)
+
+                draw, _ = _common.time_call(lambda: game_manager.draw(canvas), max(1, repeat // ROUNDS))
+                present, _ = _common.time_call(display.present, max(1, repeat // ROUNDS))
+                best[internal_scale][0] = min(best[internal_scale][0], draw)
+                best[internal_scale][1] = min(best[internal_scale][1], present)
+
+        native_total = sum(best[INTERNAL_SCALES[0]])
+        for internal_scale in INTERNAL_SCALES:
+            draw, present = best[internal_scale]
+            total = draw + present
+            width, height = canvas_sizes[internal_scale]
+            print(
+                f"{window_size[0]}x{window_size[1]:<6} {internal_scale:5.2f} {width:>4}x{height:<4} "
+                f"{draw:8.3f} {present:9.3f} {total:8.3f} {(native_total - total) / native_total:+8.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
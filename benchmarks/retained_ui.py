@@ -0,0 +1,37 @@
+"""
+benchmarks/retained_ui.py
+
+Per-frame draw cost of the rules screen and of the playing state's floor
+status bar, measured after a warm-up frame so one-off loading is excluded.
+
+Usage: python benchmarks/retained_ui.py [frames]
+"""
+
+import sys
+
+import _common
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    screen = _common.init_display()
+
+    from core.game_manager import GameManager
+    from ui.status_ui import StatusUI
+
+    game_manager = GameManager()
+
+    rules = game_manager.states["rules"]
+    rules.enter()
+    rules.draw(screen)
+    best, mean = _common.time_call(lambda: rules.draw(screen), frames)
+    _common.report("RulesState.draw", best, mean)
+
+    status_ui = StatusUI(game_manager)
+    status_ui.draw(screen)
+    best, mean = _common.time_call(lambda: status_ui.draw(screen), frames)
+    _common.report("StatusUI.draw", best, mean)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+benchmarks/rules_fork.py
+
+Measures how fast the rules-level session can branch: bare forks, fork plus
+one action, and full random playouts of the rest of a floor from a
+mid-floor position.
+
+Usage: python benchmarks/rules_fork.py
+"""
+
+import random
+import time
+
+import _common
+
+_common.init_display()
+
+import core
+from entities.deck import Deck
+from core.rules_session import RulesSession
+
+
+def mid_floor_session(seed=11, actions=25):
+    """Deal a floor and play random actions until mid-floor."""
+    random.seed(seed)
+    deck = Deck("dungeon")
+    deck.initialise_deck()
+
+    session = RulesSession.new_floor([(card["suit"], card["value"]) for card in deck.cards], life=200, max_life=200)
+    for _ in range(actions):
+        session.apply(random.choice(session.legal_actions()))
+    return session
+
+
+def per_second(func, seconds=1.0):
+    """Run func repeatedly for about `seconds` and return calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            func()
+        calls += 1000
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    session = mid_floor_session()
+    state = session.state
+    print(f"mid-floor position: life {state.life}, deck {len(state.deck) - state.deck_top}, "
+          f"room {len(state.room)}, discard {state.discard_count}, history {len(session._undo)}")
+
+    actions = session.legal_actions()
+    rng = random.Random(1)
+
+    def fork_and_apply():
+        session.fork().apply(rng.choice(actions))
+
+    def playout():
+        branch = session.fork()
+        while not branch.is_over:
+            branch.apply(rng.choice(branch.legal_actions()))
+
+    forks = per_second(session.fork)
+    print(f"{'fork':<30} {forks:>12,.0f} /s   {1e6 / forks:6.2f} us")
+
+    clones = per_second(session.clone)
+    print(f"{'clone (with history)':<30} {clones:>12,.0f} /s   {1e6 / clones:6.2f} us")
+
+    steps = per_second(fork_and_apply)
+    print(f"{'fork + apply':<30} {steps:>12,.0f} /s   {1e6 / steps:6.2f} us")
+
+    playouts = per_second(playout, seconds=2.0)
+    print(f"{'random playout to floor end':<30} {playouts:>12,.0f} /s   {1e6 / playouts:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
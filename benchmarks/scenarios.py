@@ -0,0 +1,449 @@
+"""
+benchmarks/scenarios.py
+
+End-to-end scenario regression harness. Each scenario is a scripted run
+driven through the real GameManager under SDL's dummy video driver: the
+random seed and the frame delta are fixed, and the script plays through
+mouse events, exactly as main.py's loop would deliver them.
+
+The script waits for the board to settle before each action, so a run
+plays out the same way every time for a given seed. Every frame (events,
+update and draw) is timed; the report lists p50, p95 and max frame time and
+the slowest frames with the step that was running. With SCOUNDREL_ALLOC set
+the Surface allocation tracker (core/alloc_tracker.py) is installed and each
+frame's Surface count is recorded too; the tracker copies what it wraps, so
+frame times run slower while it is on. A scenario fails when its p95 frame time is over
+its budget, or when a step cannot complete within its frame limit.
+
+Autosaves go to a temporary directory, never the player's save.
+
+Usage:
+    python benchmarks/scenarios.py [--filter TEXT] [--seed N]
+                                   [--budget MS] [--slowest N]
+                                   [--output results.json]
+
+Exits with status 1 when any scenario fails.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import _common
+
+# Fixed frame delta, the game's 60 fps target
+FRAME_DELTA = 1 / 60
+
+# Frames a single step may take before the scenario is abandoned
+STEP_FRAME_LIMIT = 3000
+
+# Life given to the player so a scripted run cannot die partway through
+SCENARIO_LIFE = 999
+
+SCENARIOS = {}
+
+
+def scenario(name, budget_ms):
+    """
+    Register a scenario script.
+
+    Args:
+        name: Scenario name
+        budget_ms: Largest acceptable p95 frame time
+    """
+    def register(script):
+        SCENARIOS[name] = (script, budget_ms)
+        return script
+    return register
+
+
+class ScenarioFailed(Exception):
+    """A scripted step could not be completed."""
+
+
+# ============================================================================
+# Harness
+# ============================================================================
+
+class Harness:
+    """Drives a GameManager frame by frame and records every frame."""
+
+    def __init__(self, screen, seed, save_dir):
+        """
+        Create a game for a scenario.
+
+        Args:
+            screen: Display surface to draw to
+            seed: Random seed for the run
+            save_dir: Directory the autosaver writes to
+        """
+        from core.autosave import Autosaver
+        from core.game_manager import GameManager
+
+        random.seed(seed)
+        self.screen = screen
+        self.game_manager = GameManager()
+        self.game_manager.autosaver = Autosaver(os.path.join(save_dir, "autosave.scd"))
+
+        # (step, milliseconds, Surfaces allocated or None) per frame
+        self.frames = []
+        self.step_name = "setup"
+
+    # ========================================================================
+    # Frames
+    # ========================================================================
+
+    def frame(self, events=()):
+        """Run one frame: dispatch events, update and draw."""
+        from core.alloc_tracker import tracker
+
+        # Anything the script did between frames is not this frame's
+        tracker.end_frame()
+        start = time.perf_counter()
+
+        for event in events:
+            self.game_manager.handle_event(event)
+        self.game_manager.update(FRAME_DELTA)
+        self.game_manager.draw(self.screen)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        surfaces = None
+        if tracker.enabled:
+            tracker.end_frame()
+            surfaces = tracker.window[-1][0]
+        self.frames.append((self.step_name, elapsed, surfaces))
+
+    def step(self, name):
+        """Label the frames that follow in the report."""
+        self.step_name = name
+
+    def wait(self, frames):
+        """Run a number of frames with no input."""
+        for _ in range(frames):
+            self.frame()
+
+    def wait_until(self, condition, what, limit=STEP_FRAME_LIMIT):
+        """Run frames until condition() is true."""
+        for _ in range(limit):
+            if condition():
+                return
+            self.frame()
+        raise ScenarioFailed(f"{self.step_name}: gave up waiting for {what}")
+
+    # ========================================================================
+    # Game state
+    # ========================================================================
+
+    @property
+    def playing(self):
+        """The playing state if it is the current state, else None."""
+        state = self.game_manager.current_state
+        return state if state is self.game_manager.states["playing"] else None
+
+    @property
+    def session(self):
+        return self.game_manager.states["playing"].session
+
+    def is_settled(self):
+        """Whether the board is waiting for the player."""
+        playing = self.playing
+        if playing is None or self.game_manager.fade_direction != 0:
+            return False
+        if playing.animation_manager.is_animating() or playing.input_handler.action_queue:
+            return False
+        cards = playing.session.room.cards
+        return bool(cards) and all(card.face_up and not card.is_flipping for card in cards)
+
+    def settle(self):
+        """Run frames until the board is waiting for the player."""
+        self.wait_until(self.is_settled, "the board to settle")
+
+    def start_run(self):
+        """Start a new run from the title screen and wait for the first room."""
+        self.game_manager.has_shown_tutorial = True
+        self.game_manager.start_new_run()
+        self.wait_until(lambda: self.playing is not None, "the playing state")
+
+        session = self.session
+        session.life_points = session.max_life = SCENARIO_LIFE
+        self.settle()
+
+    # ========================================================================
+    # Input
+    # ========================================================================
+
+    def move(self, pos):
+        """Move the mouse to a position and run a frame."""
+        import pygame
+
+        self.frame([pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))])
+
+    def click(self, pos):
+        """Move the mouse to a position, click and run a frame."""
+        import pygame
+
+        self.frame([
+            pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+        ])
+
+    @staticmethod
+    def point_on(card, half="bottom"):
+        """A point on the top or bottom half of a card as it is drawn."""
+        centre_y = card.rect.centery - (card.idle_float_offset + card.hover_float_offset)
+        offset = card.rect.height // 4
+        return (card.rect.centerx, int(centre_y - offset if half == "top" else centre_y + offset))
+
+    def resolve(self, card, half="bottom"):
+        """Click a room card and wait for the result to play out."""
+        from core.card_registry import CardLocation
+
+        self.click(self.point_on(card, half))
+        self.wait_until(lambda: self.session.location_of(card) != CardLocation.ROOM, "the card to leave the room")
+        self.settle()
+
+    def resolve_any(self):
+        """
+        Take the next room card the simplest way: monsters barehanded,
+        weapons equipped and potions drunk.
+        """
+        self.resolve(self.session.room.cards[0])
+
+
+# ============================================================================
+# Scenarios
+# ============================================================================
+
+@scenario("room_weapon_monsters_run_floor", budget_ms=16.7)
+def room_weapon_monsters_run_floor(harness):
+    """Open a room, equip a weapon, defeat three monsters, run, cross the floor."""
+    harness.step("open room")
+    harness.start_run()
+    session = harness.session
+
+    harness.step("equip weapon")
+    for _ in range(200):
+        if session.equipped_weapon is not None:
+            break
+        weapons = [card for card in session.room.cards if card.type == "weapon"]
+        if weapons:
+            harness.resolve(weapons[0])
+        else:
+            harness.resolve_any()
+    else:
+        raise ScenarioFailed("equip weapon: no weapon came up")
+
+    harness.step("defeat monsters")
+    defeated = 0
+    for _ in range(200):
+        if defeated >= 3:
+            break
+        monsters = [card for card in session.room.cards if card.type == "monster"]
+        if not monsters:
+            harness.resolve_any()
+            continue
+        # The top half attacks with the weapon when it is able to
+        harness.resolve(monsters[0], half="top")
+        defeated += 1
+    else:
+        raise ScenarioFailed("defeat monsters: not enough monsters came up")
+
+    harness.step("run")
+    input_handler = harness.playing.input_handler
+    for _ in range(50):
+        if input_handler._can_run():
+            break
+        harness.resolve_any()
+    else:
+        raise ScenarioFailed("run: the room never allowed running")
+    rooms_before = session.completed_rooms
+    harness.click(harness.playing.run_button.rect.center)
+    harness.wait_until(lambda: not input_handler._can_run() or session.completed_rooms != rooms_before, "the run to start")
+    harness.settle()
+
+    harness.step("cross floor")
+    floor_manager = harness.game_manager.floor_manager
+    floor_index = floor_manager.current_floor_index
+    for _ in range(200):
+        if floor_manager.current_floor_index != floor_index:
+            break
+        harness.resolve_any()
+    else:
+        raise ScenarioFailed("cross floor: the floor never ended")
+    harness.settle()
+
+
+@scenario("hover_every_card_type", budget_ms=16.7)
+def hover_every_card_type(harness):
+    """Sweep the cursor over room, inventory, equipped and defeated cards."""
+    harness.step("setup")
+    harness.start_run()
+    session = harness.session
+
+    # Fill every location the board can show: a weapon with a monster
+    # beneath it, and a card held in the inventory
+    for _ in range(200):
+        room = session.room.cards
+        if session.equipped_weapon is None:
+            weapons = [card for card in room if card.type == "weapon"]
+            if weapons:
+                harness.resolve(weapons[0])
+                continue
+        elif not session.defeated_monsters:
+            monsters = [card for card in room if card.type == "monster" and harness.playing.card_action_manager._can_defeat_with_weapon(card)]
+            if monsters:
+                harness.resolve(monsters[0], half="top")
+                continue
+        if not session.inventory:
+            storable = [card for card in room if card.can_add_to_inventory]
+            if storable and session.can_add_to_inventory():
+                harness.resolve(storable[0], half="top")
+                continue
+        if session.equipped_weapon and session.defeated_monsters and session.inventory:
+            break
+        harness.resolve_any()
+    else:
+        raise ScenarioFailed("setup: could not fill the board")
+
+    # Sweep each card top to bottom, then move off it
+    seen_types = set()
+    for _ in range(50):
+        harness.step("hover")
+        cards = list(session.room.cards) + list(session.inventory) + [session.equipped_weapon] + list(session.defeated_monsters)
+        for card in cards:
+            top = card.rect.top + 4
+            for y in range(top, card.rect.bottom - 4, 12):
+                harness.move((card.rect.centerx, y))
+            harness.move((card.rect.centerx, 4))
+        seen_types.update(card.type for card in session.room.cards)
+        if {"monster", "weapon", "potion"} <= seen_types:
+            break
+        harness.step("next room")
+        harness.resolve_any()
+    else:
+        raise ScenarioFailed("hover: not every card type reached the room")
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list."""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run_scenario(screen, script, seed, budget_ms, slowest):
+    """
+    Play a scenario and summarise its frames.
+
+    Returns:
+        Result dictionary, with "passed" and, on failure, "failure"
+    """
+    save_dir = tempfile.mkdtemp(prefix="scoundrel-scenario-")
+    harness = Harness(screen, seed, save_dir)
+    failure = None
+    try:
+        script(harness)
+    except ScenarioFailed as error:
+        failure = str(error)
+    finally:
+        harness.game_manager.autosaver.flush()
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+    times = sorted(ms for _, ms, _ in harness.frames)
+    surfaces = [count for _, _, count in harness.frames if count is not None]
+    result = {
+        "frames": len(times),
+        "p50_ms": percentile(times, 0.50),
+        "p95_ms": percentile(times, 0.95),
+        "max_ms": times[-1],
+        "budget_ms": budget_ms,
+        "surfaces": sum(surfaces) if surfaces else None,
+        "max_frame_surfaces": max(surfaces) if surfaces else None,
+        "slowest": [
+            {"frame": index, "step": step, "ms": ms, "surfaces": count}
+            for index, (step, ms, count) in sorted(enumerate(harness.frames), key=lambda item: -item[1][1])[:slowest]
+        ],
+    }
+    if failure is None and result["p95_ms"] > budget_ms:
+        failure = f"p95 frame time {result['p95_ms']:.2f} ms is over the {budget_ms:.2f} ms budget"
+    result["passed"] = failure is None
+    if failure:
+        result["failure"] = failure
+    return result
+
+
+def print_result(name, result):
+    """Print one scenario's summary."""
+    status = "ok" if result["passed"] else "FAIL"
+    print(
+        f"{name:<34} {status:<4} {result['frames']:6d} frames   "
+        f"p50 {result['p50_ms']:7.2f}   p95 {result['p95_ms']:7.2f}   "
+        f"max {result['max_ms']:7.2f} ms   (budget {result['budget_ms']:.1f})"
+    )
+    if result["surfaces"] is None:
+        print(f"{'':<34}      Surfaces not tracked (set SCOUNDREL_ALLOC=1)")
+    else:
+        print(f"{'':<34}      {result['surfaces']} Surfaces allocated, largest frame {result['max_frame_surfaces']}")
+    for frame in result["slowest"]:
+        surfaces = "" if frame["surfaces"] is None else f"{frame['surfaces']:5d} Surfaces  "
+        print(f"{'':<34}      frame {frame['frame']:6d}  {frame['ms']:8.2f} ms  {surfaces}{frame['step']}")
+    if not result["passed"]:
+        print(f"{'':<34}      {result['failure']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scripted scenario regression harness")
+    parser.add_argument("--filter", default="", help="only run scenarios whose name contains this")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for every run")
+    parser.add_argument("--budget", type=float, help="p95 frame budget in ms for every scenario")
+    parser.add_argument("--slowest", type=int, default=5, help="slowest frames to list per scenario")
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    from core.alloc_tracker import tracker
+
+    # Installed before the display so every Surface the game makes is tracked
+    tracker.configure_from_environment()
+    screen = _common.init_display()
+
+    results = {}
+    for name, (script, budget_ms) in SCENARIOS.items():
+        if args.filter not in name:
+            continue
+        budget = args.budget if args.budget is not None else budget_ms
+        results[name] = run_scenario(screen, script, args.seed, budget, args.slowest)
+        print_result(name, results[name])
+
+    if args.output:
+        import pygame
+
+        document = {
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "machine": platform.machine(),
+                "seed": args.seed,
+                "frame_delta": FRAME_DELTA,
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(document, output_file, indent=2)
+
+    failed = [name for name, result in results.items() if not result["passed"]]
+    if failed:
+        print(f"\n{len(failed)} scenario(s) failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+benchmarks/snapshot_load.py
+
+Measures snapshot size, encode time and the time to restore a run from
+snapshot bytes (decode + rebuilding the GameSession). The restore target is
+under 5 ms.
+
+Usage: python benchmarks/snapshot_load.py
+"""
+
+import os
+import random
+
+import _common
+
+screen = _common.init_display()
+
+from core.game_manager import GameManager
+from core.game_session import GameSession
+from core.snapshot import encode_snapshot, decode_snapshot
+
+RESTORE_BUDGET_MS = 5.0
+
+
+def build_mid_run(seed=7, rooms=10):
+    """Play a session forward to a busy mid-floor state without rendering."""
+    random.seed(seed)
+    game_manager = GameManager()
+    game_manager.autosaver.threaded = False
+    game_manager.autosaver.path = os.devnull
+    game_manager.change_state_instant("playing")
+    playing_state = game_manager.current_state
+    session = playing_state.session
+    session.life_points = session.max_life = 999
+
+    def settle():
+        for _ in range(600):
+            playing_state.update(1 / 60)
+            if not playing_state.animation_manager.is_animating():
+                return
+
+    settle()
+    for _ in range(rooms):
+        for card in list(session.room.cards)[:3]:
+            card.face_up = True
+            playing_state.card_action_manager.resolve_card(card)
+            settle()
+
+    return game_manager, session
+
+
+def main():
+    game_manager, session = build_mid_run()
+    floor_manager = game_manager.floor_manager
+
+    data = encode_snapshot(session, floor_manager)
+    print(f"snapshot size: {len(data)} bytes "
+          f"(deck {len(session.deck.cards)}, discard {session.discard_pile.get_card_count()}, "
+          f"inventory {len(session.inventory)}, defeated {len(session.defeated_monsters)})")
+
+    restored = GameSession(session.current_floor)
+    restored.restore_from_snapshot(decode_snapshot(data))
+    assert encode_snapshot(restored, floor_manager) == data, "snapshot round trip changed the run"
+
+    _common.report("encode", *_common.time_call(lambda: encode_snapshot(session, floor_manager)))
+    _common.report("decode", *_common.time_call(lambda: decode_snapshot(data)))
+
+    def restore():
+        snapshot = decode_snapshot(data)
+        GameSession(snapshot.current_floor).restore_from_snapshot(snapshot)
+
+    best, mean = _common.time_call(restore)
+    _common.report("restore (decode + session)", best, mean)
+    print(f"restore budget {RESTORE_BUDGET_MS} ms: {'OK' if mean < RESTORE_BUDGET_MS else 'OVER'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+benchmarks/startup.py
+
+Time to first frame: from launching a fresh interpreter to the title screen's
+first frame being drawn and flipped, the way main.py starts the game.
+Each run is a separate process so nothing is cached between runs; the split
+shows where the time goes (importing the game, building the GameManager,
+the first update/draw).
+
+Usage: python benchmarks/startup.py [runs]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import _common
+
+
+def child(launched_at):
+    """Start the game in this process and print the timings as JSON."""
+    import pygame
+
+    started = time.time()
+    screen = _common.init_display()
+    display_ready = time.perf_counter()
+
+    from core.game_manager import GameManager
+    imported = time.perf_counter()
+
+    game_manager = GameManager()
+    constructed = time.perf_counter()
+
+    game_manager.update(1 / 60)
+    game_manager.draw(screen)
+    pygame.display.flip()
+    first_frame = time.perf_counter()
+
+    print(json.dumps({
+        "interpreter_ms": (started - launched_at) * 1000,
+        "import_ms": (imported - display_ready) * 1000,
+        "game_manager_ms": (constructed - imported) * 1000,
+        "first_frame_ms": (first_frame - constructed) * 1000,
+        "time_to_first_frame_ms": (time.time() - launched_at) * 1000,
+        "modules": len(sys.modules),
+        "states_built": sum(game_manager.states.is_loaded(name) for name in game_manager.states),
+    }))
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", repr(time.time())],
+            capture_output=True, text=True, check=True
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    for metric in ("interpreter_ms", "import_ms", "game_manager_ms", "first_frame_ms", "time_to_first_frame_ms"):
+        values = [run[metric] for run in results]
+        _common.report(metric, min(values), sum(values) / len(values))
+
+    print(f"modules loaded: {results[-1]['modules']}   states built: {results[-1]['states_built']}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(float(sys.argv[2]))
+    else:
+        main()
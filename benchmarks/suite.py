@@ -0,0 +1,319 @@
+"""
+benchmarks/suite.py
+
+Headless rendering benchmark suite. Times the hot drawing paths in isolation
+under SDL's dummy video driver and writes the results as JSON; a comparison
+mode checks a run against an earlier one and flags regressions.
+
+Every case is a setup function that builds what it needs and returns the
+callable to time, so setup cost is never measured. Each callable is run
+`warmup` times untimed, then `repeat` times timed.
+
+Usage:
+    python benchmarks/suite.py [--warmup N] [--repeat N] [--filter TEXT]
+                               [--output results.json]
+                               [--compare baseline.json] [--threshold PERCENT]
+
+Exits with status 1 when --compare finds a case whose median is slower than
+the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import _common
+
+CASES = {}
+
+
+def case(name):
+    """Register a setup function under a case name."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# ============================================================================
+# Shared fixtures
+# ============================================================================
+
+_fixtures = {}
+
+
+def screen():
+    """The headless display surface."""
+    if "screen" not in _fixtures:
+        _fixtures["screen"] = _common.init_display()
+    return _fixtures["screen"]
+
+
+def game_manager():
+    """A GameManager sitting on the title screen."""
+    if "game_manager" not in _fixtures:
+        screen()
+        from core.game_manager import GameManager
+
+        random.seed(1)
+        _fixtures["game_manager"] = GameManager()
+    return _fixtures["game_manager"]
+
+
+def playing_state():
+    """The playing state with its first room dealt and settled."""
+    if "playing" not in _fixtures:
+        manager = game_manager()
+        manager.has_shown_tutorial = True
+        manager.change_state_instant("playing")
+        for _ in range(120):
+            manager.update(1 / 60)
+            manager.draw(screen())
+        _fixtures["playing"] = manager.current_state
+    return _fixtures["playing"]
+
+
+def face_up_card(suit="clubs", value=10, position=(400, 250)):
+    """A face-up card at a fixed position."""
+    screen()
+    import core
+    from entities.card import Card
+
+    card = Card(suit, value)
+    card.face_up = True
+    card.update_position(position)
+    return card
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+@case("card.init")
+def card_init():
+    screen()
+    import core
+    from entities.card import Card
+
+    return lambda: Card("spades", 12)
+
+
+@case("card.draw.idle")
+def card_draw_idle():
+    surface = screen()
+    card = face_up_card()
+    return lambda: card.draw(surface)
+
+
+@case("card.draw.hovered")
+def card_draw_hovered():
+    surface = screen()
+    card = face_up_card()
+    card.is_hovered = True
+    for _ in range(60):
+        card.update(1 / 60)
+    card.check_hover(card.rect.midtop)
+    return lambda: card.draw(surface)
+
+
+@case("card.draw.flipping")
+def card_draw_flipping():
+    surface = screen()
+    card = face_up_card()
+    card.face_up = False
+    card.start_flip()
+    card.flip_progress = 0.25
+    return lambda: card.draw(surface)
+
+
+@case("card.draw_hover_text")
+def card_draw_hover_text():
+    surface = screen()
+    card = face_up_card()
+    card.is_hovered = True
+    card.weapon_available = True
+    card.check_hover(card.rect.midtop)
+    return lambda: card.draw_hover_text(surface)
+
+
+@case("panel.init")
+def panel_init():
+    screen()
+    from ui.panel import Panel
+
+    return lambda: Panel((300, 200), (0, 0))
+
+
+@case("button.hover_toggle")
+def button_hover_toggle():
+    import pygame
+    from core.resource_loader import ResourceLoader
+    from ui.button import Button
+
+    screen()
+    font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 28)
+    button = Button(pygame.Rect(100, 100, 200, 50), "START", font, dungeon_style=True)
+    positions = [button.rect.center, (0, 0)]
+    state = {"index": 0}
+
+    def toggle():
+        state["index"] ^= 1
+        button.check_hover(positions[state["index"]])
+
+    return toggle
+
+
+@case("ui.health_display")
+def ui_health_display():
+    surface = screen()
+    playing = playing_state()
+    return lambda: playing.ui_renderer.draw_health_display(surface)
+
+
+def _destruction_case(effect_type):
+    def setup():
+        surface = screen()
+        from animations.specific_animations import DestructionAnimation
+
+        card = face_up_card()
+        random.seed(1)
+        animation = DestructionAnimation(card, effect_type, duration=1.0)
+        # Time the middle of the effect, where each type does its real work
+        progress_steps = [0.15, 0.35, 0.55, 0.75]
+        state = {"index": 0}
+
+        def draw():
+            animation.elapsed_time = progress_steps[state["index"]]
+            state["index"] = (state["index"] + 1) % len(progress_steps)
+            animation.draw(surface)
+
+        return draw
+    return setup
+
+
+for _effect_type in ("slash", "burn", "shatter"):
+    case(f"animation.destruction.{_effect_type}")(_destruction_case(_effect_type))
+
+
+@case("title.draw")
+def title_draw():
+    surface = screen()
+    manager = game_manager()
+    title = manager.states["title"]
+    return lambda: title.draw(surface)
+
+
+@case("playing.frame")
+def playing_frame():
+    surface = screen()
+    playing = playing_state()
+
+    def frame():
+        playing.update(1 / 60)
+        playing.draw(surface)
+
+    return frame
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def run_case(setup, warmup, repeat):
+    """Set up a case, warm it up and time it."""
+    func = setup()
+    for _ in range(warmup):
+        func()
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    durations.sort()
+    return {
+        "min_ms": durations[0],
+        "median_ms": durations[len(durations) // 2],
+        "mean_ms": sum(durations) / len(durations),
+        "p95_ms": durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+        "repeat": repeat,
+        "warmup": warmup,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Print a comparison against a baseline run.
+
+    Returns:
+        Names of cases whose median regressed by more than threshold percent
+    """
+    regressions = []
+    print(f"\n{'case':<34} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"{name:<34} {'-':>10} {result['median_ms']:10.3f}      new")
+            continue
+
+        change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] * 100 if before["median_ms"] else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<34} {before['median_ms']:10.3f} {result['median_ms']:10.3f} {change:+7.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless rendering benchmark suite")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed calls before timing")
+    parser.add_argument("--repeat", type=int, default=100, help="timed calls per case")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args()
+
+    results = {}
+    for name, setup in CASES.items():
+        if args.filter not in name:
+            continue
+        result = run_case(setup, args.warmup, args.repeat)
+        results[name] = result
+        _common.report(name, result["min_ms"], result["mean_ms"])
+
+    import pygame
+
+    document = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+            "machine": platform.machine(),
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(document, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0f}%: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -80,7 +80,7 @@ class AnimationController:
 
         for i, monster in enumerate(self.session.defeated_monsters):
 
-            has_valid_position = hasattr(monster, 'rect') and monster.rect.x > 0 and monster.rect.y > 0
+            has_valid_position = monster.rect.x > 0 and monster.rect.y > 0
 
             new_stack_position = (
                 start_x + i * MONSTER_STACK_OFFSET[0],
@@ -134,8 +134,6 @@ class AnimationController:
 
         card.update_scale(card_scale)
 
-        card.in_inventory = True
-
         scaled_card_width = int(CARD_WIDTH * card_scale)
         scaled_card_height = int(CARD_HEIGHT * card_scale)
 
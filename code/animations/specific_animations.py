@@ -3,6 +3,8 @@ import pygame
 import random
 
 from animations.animation_base import Animation, EasingFunctions
+from core.display import canvas_draw
+from core.text_cache import TextCache
 
 class MoveAnimation(Animation):
     """Animation for moving an object from one position to another."""
@@ -92,7 +94,7 @@ class DestructionAnimation(Animation):
                 end_x = center_x + slash_length/2 * math.cos(math.radians(self.slash_angle)) + offset * self.slash_direction
                 end_y = center_y + slash_length/2 * math.sin(math.radians(self.slash_angle)) + offset * self.slash_direction * 0.3
 
-                pygame.draw.line(
+                canvas_draw.line(
                     surface,
                     (255, 255, 255),
                     (start_x, start_y),
@@ -100,7 +102,7 @@ class DestructionAnimation(Animation):
                     self.slash_width + 2
                 )
 
-                pygame.draw.line(
+                canvas_draw.line(
                     surface,
                     self.slash_colour,
                     (start_x, start_y),
@@ -112,7 +114,7 @@ class DestructionAnimation(Animation):
                     spark_pos_x = start_x + (end_x - start_x) * (i / 4)
                     spark_pos_y = start_y + (end_y - start_y) * (i / 4)
                     spark_size = random.randint(1, 3)
-                    pygame.draw.circle(
+                    canvas_draw.circle(
                         surface,
                         (255, 255, 255),
                         (int(spark_pos_x), int(spark_pos_y)),
@@ -133,7 +135,7 @@ class DestructionAnimation(Animation):
                 end_x = center_x + cut_length/2 * math.cos(math.radians(self.slash_angle))
                 end_y = center_y + cut_length/2 * math.sin(math.radians(self.slash_angle))
 
-                pygame.draw.line(
+                canvas_draw.line(
                     surface,
                     (255, 255, 255),
                     (start_x, start_y),
@@ -190,7 +192,7 @@ class DestructionAnimation(Animation):
                         particle_y = center_y + (random.random() - 0.5) * 10
                         particle_size = random.randint(1, 3)
 
-                        pygame.draw.circle(
+                        canvas_draw.circle(
                             surface,
                             (220, 220, 220),
                             (int(particle_x), int(particle_y)),
@@ -207,7 +209,7 @@ class DestructionAnimation(Animation):
                 for particle in self.particles:
                     size = int(particle['size'] * (1 - progress * 2))
                     if size > 0:
-                        pygame.draw.circle(
+                        canvas_draw.circle(
                             surface,
                             particle['colour'],
                             (
@@ -229,7 +231,7 @@ class DestructionAnimation(Animation):
                 for particle in self.particles:
                     size = int(particle['size'] * (1 - burn_progress))
                     if size > 0:
-                        pygame.draw.circle(
+                        canvas_draw.circle(
                             surface,
                             particle['colour'],
                             (
@@ -383,7 +385,7 @@ class MaterialiseAnimation(Animation):
                     size = particle['size'] * (1 - (progress - 0.5) * 2)
 
                 if size > 0:
-                    pygame.draw.circle(
+                    canvas_draw.circle(
                         surface,
                         particle['colour'],
                         (int(x), int(y)),
@@ -444,7 +446,7 @@ class HealthChangeAnimation(Animation):
             colour = (80, 255, 80)
             text_prefix = "+"
 
-        text = self.font.render(f"{text_prefix}{abs(self.amount)}", True, colour)
+        text = TextCache.render(self.font, f"{text_prefix}{abs(self.amount)}", True, colour)
 
         if scale != 1.0:
             orig_size = text.get_size()
@@ -454,6 +456,9 @@ class HealthChangeAnimation(Animation):
             )
 
         if alpha < 255:
+            # Unscaled, this is the text cache's shared surface
+            if scale == 1.0:
+                text = text.copy()
             text.set_alpha(alpha)
 
         text_rect = text.get_rect(center=(
@@ -12,6 +12,24 @@ FLOOR_WIDTH = 750
 FLOOR_HEIGHT = 617
 FPS = 60
 
+# The game always draws at SCREEN_WIDTH x SCREEN_HEIGHT; a window of any
+# other size shows that frame scaled in one pass. PRESENT_SCALE_MODE is
+# "integer" (whole-number nearest-neighbour), "nearest" or "smooth"
+WINDOW_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+WINDOW_RESIZABLE = False
+PRESENT_SCALE_MODE = "integer"
+
+# Fraction of the logical resolution frames are drawn at. Below 1 the game
+# still lays out at SCREEN_WIDTH x SCREEN_HEIGHT but fills fewer pixels, and
+# the scale pass brings the frame up to the window: softer, and cheaper only
+# where the drawing saved outweighs that pass. By benchmarks/present.py
+# (integer mode), 0.5 saves about 40% in 1222x686 and 1920x1080 windows and
+# 0.75 about 20% at 1920x1080. 0.75 is slower in a window the logical size,
+# which otherwise needs no scale pass at all, and both are slower at
+# 2560x1440, where scale 1 presents at an exact 2x that pygame scales far
+# faster. Measure the target window before setting this
+INTERNAL_SCALE = 1.0
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -91,6 +109,20 @@ INVENTORY_PANEL_HEIGHT = 400
 INVENTORY_PANEL_X = (1.5 * SCREEN_WIDTH + FLOOR_WIDTH // 2) // 2 - (INVENTORY_PANEL_WIDTH // 2)
 INVENTORY_PANEL_Y = SCREEN_HEIGHT // 2 - INVENTORY_PANEL_HEIGHT // 2
 
+# Playing screen panels: floor status bar, health display, deck counter
+# and run button. The title screen preloads their noise textures too
+STATUS_PANEL_WIDTH = 650
+STATUS_PANEL_HEIGHT = 90
+
+HEALTH_PANEL_WIDTH = 160
+HEALTH_PANEL_HEIGHT = 60
+
+DECK_COUNT_PANEL_WIDTH = 80
+DECK_COUNT_PANEL_HEIGHT = 40
+
+RUN_BUTTON_WIDTH = 90
+RUN_BUTTON_HEIGHT = 45
+
 HEALTH_BAR_WIDTH = 200
 HEALTH_BAR_HEIGHT = 24
 HEALTH_BAR_POSITION = (20, SCREEN_HEIGHT - 30)
@@ -145,16 +177,66 @@ DECK_DIAMONDS_VALUE_RANGE = (2, 10)
 # Asset paths
 OUTPUT_PATH = Path(__file__).parent.parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"./assets")
+ASSET_ARCHIVE_PATH = ASSETS_PATH / Path("assets.pak")
+
+# Pixel memory the image cache may hold before evicting least recently used images
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024
+
+# Pixel memory the rendered-text cache may hold
+TEXT_CACHE_BUDGET = 4 * 1024 * 1024
+
+# Pixel memory the composed card-face cache may hold (a face is ~53 KB)
+CARD_FACE_CACHE_BUDGET = 16 * 1024 * 1024
+
+# Pixel memory the card effect cache (hover tints, shadows, info panels) may hold
+CARD_EFFECT_CACHE_BUDGET = 4 * 1024 * 1024
+
+# Grid cell size, in pixels, of the index used to find cards under the cursor
+HIT_GRID_CELL = 64
+
+# Clicks held while cards animate; any beyond this are ignored
+INPUT_ACTION_QUEUE_LIMIT = 3
+
+# Discarded cards kept as live Card objects; the rest are drawn once into
+# the pile's composite and kept only as their models
+DISCARD_LIVE_CARDS = 3
+
+# Card views kept for reuse once their cards have left play
+CARD_POOL_SIZE = 16
+
+# Endless runs never end on the last floor; they go round the run's floors
+# again, so nothing grows with the number of floors cleared
+ENDLESS_RUN = False
+
+# Idle throttling: once the board has been still for IDLE_THROTTLE_DELAY
+# seconds the loop drops to IDLE_FPS, sleeping until input arrives.
+# With IDLE_FREEZE_FLOAT the card bob is held too, so nothing moves and
+# frames are only redrawn when input wakes the loop
+IDLE_THROTTLE = True
+IDLE_FPS = 15
+IDLE_THROTTLE_DELAY = 1.0
+IDLE_FREEZE_FLOAT = False
+
+# Longest sleep while frozen, in milliseconds, so background work
+# (asset preloading, autosaves) still gets pumped
+IDLE_FROZEN_WAKE_MS = 250
 
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
+# Save paths
+SAVES_PATH = OUTPUT_PATH / Path(r"./saves")
+AUTOSAVE_PATH = SAVES_PATH / Path("autosave.scd")
+
 # Font sizes
 TITLE_FONT_SIZE = 64
 HEADER_FONT_SIZE = 36
 BODY_FONT_SIZE = 28
 NORMAL_FONT_SIZE = 20
 
+# Fonts the playing screen's UI components load, preloaded by the title screen
+PLAYING_FONT_SIZES = {"title": 60, "header": 36, "body": 28, "caption": 24, "normal": 20}
+
 # Game constants
 SUITS = ["diamonds", "hearts", "spades", "clubs"]
 FLOOR_TOTAL = 20
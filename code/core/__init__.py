@@ -6,5 +6,7 @@ from .game_state import GameState
 from .game_manager import GameManager
 from .resource_loader import ResourceLoader
 from .game_session import GameSession
+from .card_registry import CardLocation, CardRegistry
+from .rules_session import RulesSession, RulesState
 
-__all__ = ['GameState', 'GameManager', 'ResourceLoader', 'GameSession']
+__all__ = ['GameState', 'GameManager', 'ResourceLoader', 'GameSession', 'CardLocation', 'CardRegistry', 'RulesSession', 'RulesState']
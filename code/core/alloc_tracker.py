@@ -0,0 +1,453 @@
+"""
+core/alloc_tracker.py
+
+Per-frame Surface allocation tracker, switched on by setting the
+SCOUNDREL_ALLOC environment variable.
+
+While on, Surface creation (pygame.Surface, Surface.copy, convert,
+convert_alpha and subsurface), the pygame.transform functions, image loads
+and Font.render are wrapped. Every new Surface is counted with its size in
+bytes against the line of game code that asked for it, and per-frame totals
+feed a rolling window. F5 toggles an overlay of the worst call sites and F6
+writes a report (to SCOUNDREL_ALLOC_DUMP, or scoundrel_allocations.txt);
+the report is also written on exit.
+
+Setting SCOUNDREL_ALLOC_TRACEMALLOC as well starts tracemalloc, and each
+report then lists the Python allocations that grew since the last one.
+
+The wrappers replace attributes on the pygame modules, so they only see
+calls made through them (pygame.Surface(...), pygame.transform.scale(...)),
+and only Surfaces and Fonts created after install() have the wrapped
+methods. pygame's own Surface type cannot be patched, so the Surfaces that
+image loads, transforms and Font.render return are copied into the tracked
+type; their copy(), convert() and the rest are then counted like any other.
+The copy itself is not counted, and costs one blit per wrapped call while
+the tracker is on. The tracker is installed before the display is opened.
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import pygame
+
+ENV_VAR = "SCOUNDREL_ALLOC"
+DUMP_ENV_VAR = "SCOUNDREL_ALLOC_DUMP"
+TRACEMALLOC_ENV_VAR = "SCOUNDREL_ALLOC_TRACEMALLOC"
+DEFAULT_DUMP_PATH = "scoundrel_allocations.txt"
+
+# Frames kept in the rolling window
+HISTORY_FRAMES = 240
+
+# Call sites shown in the overlay and in each section of the report
+TOP_SITES = 12
+
+# Stack depth tracemalloc records for each Python allocation
+TRACEMALLOC_FRAMES = 8
+
+# How often the overlay is re-rendered, in seconds
+OVERLAY_REFRESH = 0.25
+
+OVERLAY_TOGGLE_KEY = pygame.K_F5
+REPORT_DUMP_KEY = pygame.K_F6
+
+CODE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TRANSFORM_FUNCTIONS = ("scale", "smoothscale", "scale_by", "smoothscale_by", "rotate", "rotozoom", "flip", "scale2x")
+
+
+class AllocationTracker:
+    """Counts Surface allocations per frame and per call site."""
+
+    def __init__(self):
+        self.enabled = False
+        self.overlay_visible = False
+
+        self._main_thread = threading.get_ident()
+        self._paused = False
+
+        # (code, line) -> "file:line function", so sites are formatted once
+        self._site_names = {}
+
+        # site -> [count, bytes] for the frame in progress
+        self._frame = {}
+
+        # One (count, bytes, {site: [count, bytes]}) per finished frame
+        self.window = deque(maxlen=HISTORY_FRAMES)
+
+        # site -> [count, bytes] since the tracker was installed
+        self.totals = {}
+        self.frames = 0
+        self.clean_frames = 0
+
+        self._originals = {}
+        self._tracemalloc_baseline = None
+
+        # pygame.Surface as it was before install(), and the tracked type
+        self._plain_surface = None
+        self._tracked_surface = None
+
+        self._overlay = None
+        self._overlay_built = 0.0
+        self._font = None
+
+    def configure_from_environment(self):
+        """Install the tracker when SCOUNDREL_ALLOC is set."""
+        if os.environ.get(ENV_VAR, "") not in ("", "0"):
+            self.install(tracemalloc_enabled=os.environ.get(TRACEMALLOC_ENV_VAR, "") not in ("", "0"))
+        return self.enabled
+
+    # ========================================================================
+    # Wrapping
+    # ========================================================================
+
+    def install(self, tracemalloc_enabled=False):
+        """
+        Wrap pygame's allocating calls.
+
+        Args:
+            tracemalloc_enabled: Also trace Python allocations
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+
+        tracker = self
+        original_surface = pygame.Surface
+        original_font = pygame.font.Font
+
+        class TrackedSurface(original_surface):
+            """pygame.Surface that records itself and the Surfaces it makes."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                tracker._record(self)
+
+            def copy(self):
+                return tracker._record(original_surface.copy(self))
+
+            def convert(self, *args):
+                return tracker._record(original_surface.convert(self, *args))
+
+            def convert_alpha(self, *args):
+                return tracker._record(original_surface.convert_alpha(self, *args))
+
+            def subsurface(self, *args):
+                return tracker._record(original_surface.subsurface(self, *args), 0)
+
+        class TrackedFont(original_font):
+            """pygame.font.Font that records the text Surfaces it renders."""
+
+            def render(self, *args, **kwargs):
+                return tracker._record(tracker._adopt(original_font.render(self, *args, **kwargs)))
+
+        self._plain_surface = original_surface
+        self._tracked_surface = TrackedSurface
+        self._replace(pygame, "Surface", TrackedSurface)
+        self._replace(pygame.font, "Font", TrackedFont)
+        self._replace(pygame.image, "load", self._wrap(pygame.image.load))
+        for name in TRANSFORM_FUNCTIONS:
+            if hasattr(pygame.transform, name):
+                self._replace(pygame.transform, name, self._wrap(getattr(pygame.transform, name)))
+
+        if tracemalloc_enabled:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._tracemalloc_baseline = tracemalloc.take_snapshot()
+
+    def uninstall(self):
+        """Put pygame's own functions back."""
+        for (module, name), original in self._originals.items():
+            setattr(module, name, original)
+        self._originals.clear()
+        self._plain_surface = None
+        self._tracked_surface = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = False
+
+    def _replace(self, module, name, replacement):
+        self._originals[(module, name)] = getattr(module, name)
+        setattr(module, name, replacement)
+
+    def _wrap(self, function):
+        """Wrap a module function that returns a new Surface."""
+        def tracked(*args, **kwargs):
+            surface = function(*args, **kwargs)
+            # Scaling into a destination Surface returns it; nothing new was made
+            if any(surface is arg for arg in args) or any(surface is arg for arg in kwargs.values()):
+                return surface
+            return self._record(self._adopt(surface))
+        tracked.__name__ = function.__name__
+        tracked.__doc__ = function.__doc__
+        return tracked
+
+    def _adopt(self, surface):
+        """
+        Copy a plain Surface into the tracked type, so the Surfaces later
+        made from it are counted too. The copy itself is not counted.
+
+        Args:
+            surface: A new Surface nothing else refers to yet
+
+        Returns:
+            A tracked Surface with the same format, pixels, colorkey and alpha
+        """
+        if self._tracked_surface is None or isinstance(surface, self._tracked_surface):
+            return surface
+
+        per_pixel_alpha = surface.get_flags() & pygame.SRCALPHA
+        # Made without TrackedSurface.__init__, which would record it
+        tracked = self._tracked_surface.__new__(self._tracked_surface)
+        self._plain_surface.__init__(
+            tracked, surface.get_size(), per_pixel_alpha, surface.get_bitsize(), surface.get_masks()
+        )
+        if surface.get_bitsize() <= 8:
+            tracked.set_palette(surface.get_palette())
+
+        # Lift the colorkey and surface alpha so the blit copies every pixel
+        # as it is; the source is thrown away afterwards
+        colorkey = surface.get_colorkey()
+        alpha = surface.get_alpha()
+        surface.set_colorkey(None)
+        if per_pixel_alpha:
+            surface.set_alpha(255)
+            # Onto transparent black, taking the maximum copies exactly
+            tracked.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            surface.set_alpha(None)
+            tracked.blit(surface, (0, 0))
+
+        tracked.set_colorkey(colorkey)
+        tracked.set_alpha(alpha)
+        return tracked
+
+    def _record(self, surface, size=None):
+        """
+        Count a new Surface against the game code that created it.
+
+        Args:
+            surface: The new Surface
+            size: Bytes to count; defaults to the Surface's pixel data
+
+        Returns:
+            The surface, so wrappers can return through this
+        """
+        if self._paused:
+            return surface
+
+        if size is None:
+            width, height = surface.get_size()
+            size = width * height * surface.get_bytesize()
+
+        site = self._call_site()
+        counts = self._frame.get(site)
+        if counts is None:
+            counts = self._frame[site] = [0, 0]
+        counts[0] += 1
+        counts[1] += size
+        return surface
+
+    def _call_site(self):
+        """Name the first frame on the stack outside this module."""
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_globals.get("__name__") == __name__:
+            frame = frame.f_back
+        if frame is None:
+            return "?"
+
+        key = (frame.f_code, frame.f_lineno)
+        name = self._site_names.get(key)
+        if name is None:
+            path = os.path.relpath(frame.f_code.co_filename, CODE_ROOT)
+            name = self._site_names[key] = f"{path}:{frame.f_lineno} {frame.f_code.co_name}"
+
+        # The asset preloader allocates off the main thread
+        if threading.get_ident() != self._main_thread:
+            return "[thread] " + name
+        return name
+
+    # ========================================================================
+    # Frames
+    # ========================================================================
+
+    def end_frame(self):
+        """Close the frame's counts into the window and the totals."""
+        if not self.enabled:
+            return
+
+        site_counts = self._frame
+        self._frame = {}
+
+        count = 0
+        size = 0
+        for site, (site_count, site_size) in site_counts.items():
+            count += site_count
+            size += site_size
+            totals = self.totals.get(site)
+            if totals is None:
+                totals = self.totals[site] = [0, 0]
+            totals[0] += site_count
+            totals[1] += site_size
+
+        self.frames += 1
+        if count == 0:
+            self.clean_frames += 1
+        self.window.append((count, size, site_counts))
+
+    # ========================================================================
+    # Input
+    # ========================================================================
+
+    def handle_key(self, event):
+        """
+        Handle the tracker's hotkeys.
+
+        Returns:
+            True if the event was used by the tracker
+        """
+        if not self.enabled or event.type != pygame.KEYDOWN:
+            return False
+
+        if event.key == OVERLAY_TOGGLE_KEY:
+            self.overlay_visible = not self.overlay_visible
+            return True
+        if event.key == REPORT_DUMP_KEY:
+            self.dump()
+            return True
+        return False
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def window_summary(self):
+        """
+        Allocations over the rolling window.
+
+        Returns:
+            (frames, per-frame counts, per-frame bytes, [(site, count, bytes)]
+            worst first, by bytes)
+        """
+        sites = {}
+        for _, _, site_counts in self.window:
+            for site, (count, size) in site_counts.items():
+                totals = sites.get(site)
+                if totals is None:
+                    totals = sites[site] = [0, 0]
+                totals[0] += count
+                totals[1] += size
+
+        ranked = sorted(((site, count, size) for site, (count, size) in sites.items()), key=lambda item: -item[2])
+        return (
+            len(self.window),
+            [count for count, _, _ in self.window],
+            [size for _, size, _ in self.window],
+            ranked,
+        )
+
+    def report(self):
+        """The tracker's findings as printable lines."""
+        frames, counts, sizes, ranked = self.window_summary()
+        lines = [
+            f"Surface allocations over {self.frames} frames "
+            f"({self.clean_frames} with none)",
+            "",
+            f"Last {frames} frames: "
+            f"{sum(counts) / max(1, frames):.1f} surfaces, "
+            f"{sum(sizes) / max(1, frames) / 1024:.1f} KiB per frame, "
+            f"worst frame {max(counts, default=0)} surfaces / {max(sizes, default=0) / 1024:.1f} KiB",
+        ]
+        for site, count, size in ranked[:TOP_SITES]:
+            lines.append(f"  {count / max(1, frames):8.2f}/frame  {size / max(1, frames) / 1024:9.1f} KiB/frame  {site}")
+
+        lines.append("")
+        lines.append("Since start:")
+        ranked_totals = sorted(self.totals.items(), key=lambda item: -item[1][1])
+        for site, (count, size) in ranked_totals[:TOP_SITES]:
+            lines.append(f"  {count:8d} surfaces  {size / 1024:11.1f} KiB  {site}")
+
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib.*>"),
+            ))
+            lines.append("")
+            lines.append("Python allocation growth since the last report (tracemalloc):")
+            for stat in snapshot.compare_to(self._tracemalloc_baseline, "lineno")[:TOP_SITES]:
+                lines.append(f"  {stat.size_diff / 1024:+10.1f} KiB  {stat.count_diff:+8d} blocks  {stat.traceback}")
+            self._tracemalloc_baseline = snapshot
+
+        return lines
+
+    def dump(self, path=None):
+        """
+        Write the report to a text file.
+
+        Args:
+            path: Output file; defaults to SCOUNDREL_ALLOC_DUMP or
+                scoundrel_allocations.txt in the working directory
+
+        Returns:
+            The path written
+        """
+        path = path or os.environ.get(DUMP_ENV_VAR) or DEFAULT_DUMP_PATH
+        self._paused = True
+        try:
+            lines = self.report()
+        finally:
+            self._paused = False
+        with open(path, "w") as dump_file:
+            dump_file.write("\n".join(lines) + "\n")
+        return path
+
+    def draw_overlay(self, surface):
+        """Draw the worst call sites in the bottom-left corner if shown."""
+        if not (self.enabled and self.overlay_visible):
+            return
+
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_built >= OVERLAY_REFRESH:
+            # The overlay's own Surfaces are not counted
+            self._paused = True
+            try:
+                self._overlay = self._build_overlay()
+            finally:
+                self._paused = False
+            self._overlay_built = now
+        surface.blit(self._overlay, (8, surface.get_height() - self._overlay.get_height() - 8))
+
+    def _build_overlay(self):
+        """Render the window summary onto a translucent box."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+
+        frames, counts, sizes, ranked = self.window_summary()
+        frames = max(1, frames)
+        lines = [(
+            f"surfaces/frame {sum(counts) / frames:.1f}   "
+            f"KiB/frame {sum(sizes) / frames / 1024:.1f}   "
+            f"clean {self.clean_frames}/{self.frames}",
+            (255, 220, 120),
+        )]
+        for site, count, size in ranked[:TOP_SITES]:
+            lines.append((f"{count / frames:6.2f}  {size / frames / 1024:8.1f} KiB  {site}", (230, 230, 230)))
+
+        rendered = [self._font.render(text, True, colour) for text, colour in lines]
+        width = max(text.get_width() for text in rendered) + 12
+        height = sum(text.get_height() for text in rendered) + 10
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        y = 5
+        for text in rendered:
+            overlay.blit(text, (6, y))
+            y += text.get_height()
+        return overlay
+
+
+# The game's single allocation tracker
+tracker = AllocationTracker()
@@ -0,0 +1,270 @@
+"""
+core/asset_archive.py
+
+Packed asset archive: every PNG under assets/ decoded once, offline, into raw
+pixels in the display's pixel format, plus pre-scaled copies at the sizes the
+game draws them. At runtime the archive is memory-mapped and surfaces are
+built straight over its bytes with pygame.image.frombuffer, so nothing is
+decoded, scaled or converted while the game starts.
+
+Layout: header (magic, version, manifest length), a JSON manifest mapping
+asset keys to offsets and sizes, then 16-byte aligned pixel blocks.
+
+The manifest also records each source PNG's modification time and size.
+An image whose PNG has changed since packing is not served from the
+archive: a warning names it and the loader falls back to the loose file.
+Each source is checked once, the first time it is loaded.
+
+Build with:  python pack_assets.py
+"""
+
+import json
+import mmap
+import os
+import struct
+import warnings
+
+import pygame
+
+from config import (
+    ASSETS_PATH,
+    CARD_WIDTH,
+    CARD_HEIGHT,
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    FLOOR_WIDTH,
+    FLOOR_HEIGHT
+)
+
+ARCHIVE_MAGIC = b"SCPK"
+ARCHIVE_VERSION = 2
+ALIGNMENT = 16
+
+_HEADER = struct.Struct("<4sHI")
+
+# Extra sizes to store per asset folder (or top-level file), matching the
+# sizes the game scales them to
+PACKED_VARIANTS = {
+    "cards": [(CARD_WIDTH, CARD_HEIGHT)],
+    "monsters": [(96, 96)],
+    "weapons": [(120, 120), (96, 96)],
+    "potions": [(120, 120), (96, 96)],
+    "torch_anim": [(128, 128)],
+    "floors": [(FLOOR_WIDTH, FLOOR_HEIGHT)],
+    "floor.png": [(FLOOR_WIDTH, FLOOR_HEIGHT)],
+    "bg.png": [(SCREEN_WIDTH, SCREEN_HEIGHT)],
+}
+
+# Byte order of each 32-bit ARGB-style mask layout on a little-endian machine
+_MASK_FORMATS = {
+    (0xFF0000, 0xFF00, 0xFF, 0xFF000000): "BGRA",
+    (0xFF, 0xFF00, 0xFF0000, 0xFF000000): "RGBA",
+}
+
+
+def variant_key(name, size=None):
+    """Archive key for an asset, optionally at a pre-scaled size."""
+    if size is None:
+        return name
+    return f"{name}@{size[0]}x{size[1]}"
+
+
+def source_stamp(path):
+    """
+    What the archive remembers of a source file: [mtime in ns, size], or
+    None if the file is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def display_pixel_format():
+    """
+    The raw pixel format matching the display's preferred alpha surface.
+    Needs a display mode to be set; falls back to RGBA otherwise.
+    """
+    try:
+        probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    except pygame.error:
+        return "RGBA"
+    return _MASK_FORMATS.get(tuple(probe.get_masks()), "RGBA")
+
+
+# ============================================================================
+# Packer
+# ============================================================================
+
+def _variants_for(name):
+    """Pre-scaled sizes to store for an asset name."""
+    return PACKED_VARIANTS.get(name.split("/")[0], [])
+
+
+def pack_assets(archive_path, assets_path=ASSETS_PATH, pixel_format=None):
+    """
+    Decode every PNG under assets_path and write them to one archive.
+
+    Args:
+        archive_path: File to write
+        assets_path: Asset directory to pack
+        pixel_format: Raw format to store; defaults to the display's
+
+    Returns:
+        (image count, archive size in bytes)
+    """
+    pixel_format = pixel_format or display_pixel_format()
+    assets_path = str(assets_path)
+
+    names = []
+    for root, _, files in os.walk(assets_path):
+        for file_name in files:
+            if file_name.lower().endswith(".png"):
+                path = os.path.join(root, file_name)
+                names.append(os.path.relpath(path, assets_path).replace(os.sep, "/"))
+    names.sort()
+
+    entries = {}
+    sources = {}
+    blocks = []
+    offset = 0
+
+    for name in names:
+        sources[name] = source_stamp(os.path.join(assets_path, name))
+        image = pygame.image.load(os.path.join(assets_path, name))
+        surfaces = [(None, image)]
+        for size in _variants_for(name):
+            if size != image.get_size():
+                surfaces.append((size, pygame.transform.scale(image, size)))
+
+        for size, surface in surfaces:
+            pixels = pygame.image.tobytes(surface, pixel_format)
+            entries[variant_key(name, size)] = {
+                "offset": offset,
+                "size": list(surface.get_size()),
+            }
+            padding = -len(pixels) % ALIGNMENT
+            blocks.append(pixels + b"\0" * padding)
+            offset += len(pixels) + padding
+
+    manifest = json.dumps(
+        {"format": pixel_format, "sources": sources, "images": entries}, separators=(",", ":")
+    ).encode("utf-8")
+    header = _HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(manifest))
+    data_start = len(header) + len(manifest)
+    header_padding = b"\0" * (-data_start % ALIGNMENT)
+
+    temp_path = str(archive_path) + ".tmp"
+    with open(temp_path, "wb") as archive_file:
+        archive_file.write(header)
+        archive_file.write(manifest)
+        archive_file.write(header_padding)
+        for block in blocks:
+            archive_file.write(block)
+    os.replace(temp_path, archive_path)
+
+    return len(entries), os.path.getsize(archive_path)
+
+
+# ============================================================================
+# Reader
+# ============================================================================
+
+class AssetArchive:
+    """Read-only view of a packed archive, memory-mapped."""
+
+    def __init__(self, path, assets_path=ASSETS_PATH):
+        """
+        Open and map an archive.
+
+        Args:
+            path: Archive file
+            assets_path: Directory of the loose files it was packed from
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a valid archive
+        """
+        with open(path, "rb") as archive_file:
+            # Copy-on-write so a caller drawing onto a loaded surface can
+            # never touch the file
+            self._map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, manifest_length = _HEADER.unpack_from(self._map, 0)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported asset archive: {path}")
+
+        manifest_start = _HEADER.size
+        manifest = json.loads(self._map[manifest_start:manifest_start + manifest_length])
+        data_start = manifest_start + manifest_length
+        self._data_start = data_start + (-data_start % ALIGNMENT)
+
+        self.pixel_format = manifest["format"]
+        self._images = manifest["images"]
+        self._sources = manifest["sources"]
+        self._view = memoryview(self._map)
+        self._needs_convert = None
+
+        self._assets_path = str(assets_path)
+
+        # name -> whether its loose file is unchanged since packing
+        self._fresh = {}
+
+    @classmethod
+    def open(cls, path, assets_path=ASSETS_PATH):
+        """Open an archive, or return None if it is missing or unreadable."""
+        try:
+            return cls(path, assets_path)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+
+    def is_fresh(self, name):
+        """
+        Whether an asset's loose file is unchanged since the archive was
+        packed. A loose file that is missing is not a change: the archive
+        may be shipped without them.
+        """
+        fresh = self._fresh.get(name)
+        if fresh is None:
+            stamp = source_stamp(os.path.join(self._assets_path, name))
+            fresh = self._fresh[name] = stamp is None or stamp == self._sources.get(name)
+            if not fresh:
+                warnings.warn(f"{name} has changed since the asset archive was packed; loading the loose file "
+                              f"(re-run pack_assets.py)", stacklevel=2)
+        return fresh
+
+    def __contains__(self, key):
+        return key in self._images
+
+    def __len__(self):
+        return len(self._images)
+
+    def load(self, name, size=None):
+        """
+        Build a surface for an asset straight over the archive's bytes.
+
+        Args:
+            name: Asset path relative to assets/, e.g. "cards/spades_2.png"
+            size: Optional pre-scaled (width, height) variant
+
+        Returns:
+            A Surface, or None if the archive does not hold that asset or
+            its loose file has changed since packing
+        """
+        entry = self._images.get(variant_key(name, size))
+        if entry is None or not self.is_fresh(name):
+            return None
+
+        width, height = entry["size"]
+        start = self._data_start + entry["offset"]
+        pixels = self._view[start:start + width * height * 4]
+        surface = pygame.image.frombuffer(pixels, (width, height), self.pixel_format)
+
+        # Only pay for a conversion when packed on a display with another layout
+        if self._needs_convert is None:
+            self._needs_convert = self.pixel_format != display_pixel_format()
+        if self._needs_convert:
+            surface = surface.convert_alpha()
+
+        return surface
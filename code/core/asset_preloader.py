@@ -0,0 +1,261 @@
+"""
+core/asset_preloader.py
+
+Warms the resource caches in the background while the title screen is up.
+Jobs sit in a priority queue and are decoded by a small pool of worker
+threads; finished work is handed back to the main thread, which converts
+surfaces to the display format and installs them, a few milliseconds' worth
+per frame, from pump().
+
+Each job is a pair of callables:
+- decode() runs on a worker and must not touch the display or shared caches
+- install(result) runs on the main thread inside pump()
+
+Jobs without a decode step (fonts, archive-backed images) run entirely on
+the main thread. Browser builds have no threads, so there every job runs
+inside pump().
+
+Pure-Python work (panel noise) would hold the GIL against the frame loop
+on a worker, so it is queued as steps instead: a generator pump() advances
+a slice at a time within its budget, whose return value is installed.
+"""
+
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+import types
+from collections import deque
+
+import pygame
+
+from core.resource_loader import ResourceLoader
+
+# Priorities: lower runs sooner
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+# Main-thread time pump() may spend per frame, in milliseconds
+PUMP_BUDGET_MS = 4
+
+
+class AssetPreloader:
+    """Priority-ordered, worker-pool asset preloader."""
+
+    def __init__(self, workers=None, threaded=None):
+        """
+        Create a preloader.
+
+        Args:
+            workers: Number of decode threads; defaults to the CPU count, up to 4
+            threaded: Decode on worker threads; defaults to True
+                everywhere except browser builds
+        """
+        self.threaded = sys.platform != "emscripten" if threaded is None else threaded
+        self.workers = workers or min(4, os.cpu_count() or 1)
+
+        self._condition = threading.Condition()
+        self._decode_queue = []
+        self._main_queue = []
+        self._ready = deque()
+        self._stepping = None
+        self._sequence = itertools.count()
+        self._threads = []
+
+        self.total = 0
+        self.completed = 0
+
+    # ========================================================================
+    # Queueing
+    # ========================================================================
+
+    def add_task(self, install, decode=None, priority=PRIORITY_NORMAL):
+        """
+        Queue a job.
+
+        Args:
+            install: Called on the main thread with decode's result
+                (or with no arguments when there is no decode step)
+            decode: Optional callable run on a worker thread
+            priority: Lower values run sooner
+        """
+        job = (priority, next(self._sequence), decode, install)
+        self.total += 1
+
+        if decode is None or not self.threaded:
+            heapq.heappush(self._main_queue, job)
+            return
+
+        with self._condition:
+            heapq.heappush(self._decode_queue, job)
+            self._ensure_workers()
+            self._condition.notify()
+
+    def add_steps(self, install, steps, priority=PRIORITY_NORMAL):
+        """
+        Queue a job the main thread runs a slice at a time.
+
+        Args:
+            install: Called on the main thread with the value steps returns
+            steps: Generator that yields between slices and returns its result
+            priority: Lower values run sooner
+        """
+        self.total += 1
+        heapq.heappush(self._main_queue, (priority, next(self._sequence), steps, install))
+
+    def add_image(self, name, size=None, priority=PRIORITY_NORMAL):
+        """
+        Queue an image for the ResourceLoader cache.
+
+        Args:
+            name: Asset path relative to assets/
+            size: Optional (width, height) it will be loaded at
+            priority: Lower values run sooner
+        """
+        if ResourceLoader.is_cached(name, size):
+            return
+
+        # Archive images are not decoded at all, so only the loose files
+        # are worth a trip to a worker
+        if ResourceLoader.in_archive(name, size):
+            if size is None:
+                self.add_task(lambda: ResourceLoader.load_image(name), priority=priority)
+            else:
+                self.add_task(lambda: ResourceLoader.load_scaled(name, size), priority=priority)
+            return
+
+        def install(image):
+            if not ResourceLoader.is_cached(name, size):
+                ResourceLoader.store(name, ResourceLoader.to_display_format(image), size)
+
+        self.add_task(install, lambda: ResourceLoader.decode(name, size), priority)
+
+    def add_font(self, name, size, priority=PRIORITY_NORMAL):
+        """Queue a font for the ResourceLoader cache."""
+        self.add_task(lambda: ResourceLoader.load_font(name, size), priority=priority)
+
+    # ========================================================================
+    # Progress
+    # ========================================================================
+
+    @property
+    def progress(self):
+        """Fraction of queued jobs finished, from 0.0 to 1.0."""
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    @property
+    def is_done(self):
+        return self.completed >= self.total
+
+    # ========================================================================
+    # Main Thread
+    # ========================================================================
+
+    def pump(self, budget_ms=PUMP_BUDGET_MS):
+        """
+        Install finished work on the main thread. Call once per frame.
+
+        Args:
+            budget_ms: Time to spend before returning; at least one job
+                (or one slice of a stepped job) is always handled so the
+                queue keeps moving
+
+        Returns:
+            Number of jobs finished during this call
+        """
+        if self.is_done:
+            return 0
+
+        deadline = time.perf_counter() + budget_ms / 1000
+        finished = 0
+
+        while self._ready or self._stepping or self._main_queue:
+            if self._ready:
+                install, result = self._ready.popleft()
+                self._finish(install, result, has_result=True)
+            elif self._stepping:
+                if not self._step():
+                    if time.perf_counter() >= deadline:
+                        break
+                    continue
+            else:
+                _, _, decode, install = heapq.heappop(self._main_queue)
+                if decode is None:
+                    self._finish(install)
+                elif isinstance(decode, types.GeneratorType):
+                    self._stepping = (decode, install)
+                    continue
+                else:
+                    try:
+                        result = decode()
+                    except Exception:
+                        self.completed += 1
+                    else:
+                        self._finish(install, result, has_result=True)
+
+            finished += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        return finished
+
+    def _step(self):
+        """Run one slice of the stepped job; returns True once it has finished."""
+        steps, install = self._stepping
+        try:
+            next(steps)
+        except StopIteration as stop:
+            self._stepping = None
+            self._finish(install, stop.value, has_result=True)
+            return True
+        except Exception:
+            self._stepping = None
+            self.completed += 1
+            return True
+        return False
+
+    def _finish(self, install, result=None, has_result=False):
+        """Run a job's install step; a failed job is simply left to load lazily."""
+        try:
+            if has_result:
+                install(result)
+            else:
+                install()
+        except (pygame.error, OSError, ValueError):
+            pass
+        self.completed += 1
+
+    # ========================================================================
+    # Workers
+    # ========================================================================
+
+    def _ensure_workers(self):
+        """Start the worker threads on first use."""
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"preload-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _run(self):
+        """Worker loop: decode the most urgent job, hand it to the main thread."""
+        while True:
+            with self._condition:
+                while not self._decode_queue:
+                    self._condition.wait()
+                _, _, decode, install = heapq.heappop(self._decode_queue)
+
+            try:
+                result = decode()
+            except Exception:
+                # Count it as done; the game will load it lazily instead
+                self._ready.append((lambda _: None, None))
+                continue
+
+            self._ready.append((install, result))
@@ -0,0 +1,144 @@
+"""
+core/autosave.py
+
+Writes snapshot bytes to disk without blocking the frame.
+Saves are handed to a background writer thread; if several arrive while a
+write is in progress only the newest is kept. Each write goes to a temporary
+file that is then renamed over the save, so a crash mid-write leaves the
+previous save intact.
+
+Browser builds have no threads, so there the write happens inline.
+"""
+
+import os
+import sys
+import threading
+
+from config import AUTOSAVE_PATH
+
+
+class Autosaver:
+    """Background, atomic writer for a single save file."""
+
+    def __init__(self, path=AUTOSAVE_PATH, threaded=None):
+        """
+        Create an autosaver.
+
+        Args:
+            path: File to save to
+            threaded: Write on a background thread; defaults to True
+                everywhere except browser builds
+        """
+        self.path = str(path)
+        self.threaded = sys.platform != "emscripten" if threaded is None else threaded
+
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._generation = 0
+        self._busy = False
+        self._thread = None
+
+    # ========================================================================
+    # Public API
+    # ========================================================================
+
+    def save(self, data):
+        """
+        Queue snapshot bytes to be written.
+
+        Args:
+            data: Bytes to write
+        """
+        if not self.threaded:
+            self._write(data, self._generation)
+            return
+
+        with self._condition:
+            self._pending = data
+            self._ensure_thread()
+            self._condition.notify_all()
+
+    def load(self):
+        """
+        Read the saved bytes.
+
+        Returns:
+            The saved bytes, or None if there is no save
+        """
+        self.flush()
+        try:
+            with open(self.path, "rb") as save_file:
+                return save_file.read()
+        except OSError:
+            return None
+
+    def exists(self):
+        """Check whether a save is on disk or about to be."""
+        return self._pending is not None or os.path.exists(self.path)
+
+    def clear(self):
+        """Drop any queued save and delete the save file."""
+        with self._condition:
+            self._pending = None
+            self._generation += 1
+            self._condition.notify_all()
+
+        with self._write_lock:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def flush(self):
+        """Block until queued saves have been written."""
+        with self._condition:
+            while self._pending is not None or self._busy:
+                self._condition.wait()
+
+    # ========================================================================
+    # Writer
+    # ========================================================================
+
+    def _ensure_thread(self):
+        """Start the writer thread on first use."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Writer thread loop."""
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                data = self._pending
+                generation = self._generation
+                self._pending = None
+                self._busy = True
+
+            try:
+                self._write(data, generation)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _write(self, data, generation):
+        """Atomically replace the save file, unless it was cleared meanwhile."""
+        with self._write_lock:
+            if generation != self._generation:
+                return
+
+            temp_path = self.path + ".tmp"
+
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(temp_path, "wb") as save_file:
+                    save_file.write(data)
+                    save_file.flush()
+                    os.fsync(save_file.fileno())
+                os.replace(temp_path, self.path)
+            except OSError:
+                # Saving is best effort; the next action will try again
+                pass
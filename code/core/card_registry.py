@@ -0,0 +1,161 @@
+"""
+core/card_registry.py
+
+Index of where every live card is during a session.
+GameSession moves cards through it on every transition, so "where is this
+card?" is a dictionary lookup instead of a scan over the room, inventory,
+weapon stack and discard pile.
+
+Cards on the board (room, inventory, weapon stack) are also kept in a
+HitIndex, so hover and click resolution only test the cards under the
+cursor. Cards report their own moves to the index.
+"""
+
+from core.hit_index import HitIndex
+
+
+class CardLocation:
+    """The places a card can be during a session."""
+
+    DECK = "deck"
+    ROOM = "room"
+    INVENTORY = "inventory"
+    EQUIPPED = "equipped"
+    DEFEATED = "defeated"
+    DISCARD = "discard"
+
+    ALL = (DECK, ROOM, INVENTORY, EQUIPPED, DEFEATED, DISCARD)
+
+    # Locations the player can point at, ranked for overlapping hits the
+    # way clicks resolve: room cards, then inventory, then the weapon stack
+    ON_BOARD = {ROOM: 3, INVENTORY: 2, EQUIPPED: 1, DEFEATED: 0}
+
+
+class CardRegistry:
+    """
+    Maps cards to their current CardLocation.
+    Keeps the card's in_inventory / is_equipped / is_defeated flags in step
+    with its location so rendering can read them without any lookups.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._locations = {}
+        self.hit_index = HitIndex()
+
+        # Stacking order within a location, for cards without a z_index
+        self._placed = 0
+
+    def move(self, card, location):
+        """
+        Record that a card is now at a location.
+
+        Args:
+            card: Card being moved
+            location: One of the CardLocation values
+        """
+        self._locations[card] = location
+
+        model = card.model
+        model.in_inventory = location == CardLocation.INVENTORY
+        model.is_equipped = location == CardLocation.EQUIPPED
+        model.is_defeated = location == CardLocation.DEFEATED
+
+        rank = CardLocation.ON_BOARD.get(location)
+        if rank is None:
+            self._unindex(card)
+            return
+
+        if location == CardLocation.ROOM:
+            order = card.z_index
+        else:
+            self._placed += 1
+            order = self._placed
+
+        self.hit_index.insert(card, card.rect, (rank, order))
+        card.hit_index = self.hit_index
+
+    def location_of(self, card):
+        """
+        Get the location of a card.
+
+        Args:
+            card: Card to look up
+
+        Returns:
+            The card's CardLocation value, or None if it is not tracked
+        """
+        return self._locations.get(card)
+
+    def is_at(self, card, location):
+        """Check whether a card is at the given location."""
+        return self._locations.get(card) == location
+
+    def cards_at(self, point):
+        """
+        Get the on-board cards under a point.
+
+        Args:
+            point: (x, y) position
+
+        Returns:
+            List of cards, topmost first
+        """
+        return self.hit_index.query(point)
+
+    def card_at(self, point, *locations):
+        """
+        Get the topmost on-board card under a point.
+
+        Args:
+            point: (x, y) position
+            locations: Only consider cards at these CardLocation values
+
+        Returns:
+            The card, or None
+        """
+        if not locations:
+            return self.hit_index.top(point)
+        return self.hit_index.top(point, lambda card: self._locations.get(card) in locations)
+
+    def forget(self, card):
+        """Stop tracking a card that has left play."""
+        self._locations.pop(card, None)
+        self._unindex(card)
+
+    def forget_location(self, *locations):
+        """
+        Stop tracking every card at any of the given locations.
+
+        Returns:
+            The cards no longer tracked
+        """
+        kept = {}
+        forgotten = []
+        for card, location in self._locations.items():
+            if location in locations:
+                self._unindex(card)
+                forgotten.append(card)
+            else:
+                kept[card] = location
+        self._locations = kept
+        return forgotten
+
+    def clear(self):
+        """Stop tracking all cards."""
+        for card in self._locations:
+            card.hit_index = None
+        self._locations.clear()
+        self.hit_index.clear()
+
+    def _unindex(self, card):
+        """Take a card off the hit index."""
+        if card.hit_index is self.hit_index:
+            self.hit_index.remove(card)
+            card.hit_index = None
+
+    def __len__(self):
+        return len(self._locations)
+
+    def __contains__(self, card):
+        return card in self._locations
@@ -0,0 +1,133 @@
+"""
+core/deck_odds.py
+
+Probability queries about the next cards out of a deck, for UI hints and bots.
+Works off the deck's running composition, so each query is constant time no
+matter how many cards are left.
+
+Cards put back under the deck after running are known to the player, so they
+are kept out of the random pool: the next room draws from the unseen cards
+first and only then from the known ones, in order.
+"""
+
+from math import comb
+
+from entities.card_model import card_type_for_suit
+
+
+class DeckOdds:
+    """Odds engine over a Deck's composition."""
+
+    def __init__(self, deck):
+        """
+        Create an odds engine.
+
+        Args:
+            deck: Deck to answer questions about
+        """
+        self.deck = deck
+
+    @property
+    def unseen_count(self):
+        """Number of cards whose order is unknown to the player."""
+        return len(self.deck.composition) - len(self.deck.known_composition)
+
+    def _unseen_at_least(self, card_type, value):
+        """Unseen cards of a type with a value of at least `value`."""
+        return (self.deck.composition.count_at_least(card_type, value)
+                - self.deck.known_composition.count_at_least(card_type, value))
+
+    def _split_draws(self, draws):
+        """Split a draw count into (random unseen draws, known cards drawn after them)."""
+        unseen = self.unseen_count
+        from_unseen = min(draws, unseen)
+        from_known = min(draws - from_unseen, len(self.deck.known_composition))
+        known_cards = [self.deck.cards[unseen + i] for i in range(from_known)]
+        return unseen, from_unseen, known_cards
+
+    def _p_any(self, card_type, value, draws):
+        """P(at least one drawn card is of a type with a value of at least `value`)."""
+        unseen, from_unseen, known_cards = self._split_draws(draws)
+
+        for card_data in known_cards:
+            if self._matches(card_data, card_type, value):
+                return 1.0
+
+        if from_unseen == 0:
+            return 0.0
+
+        hits = self._unseen_at_least(card_type, value)
+        p_none = comb(unseen - hits, from_unseen) / comb(unseen, from_unseen)
+        return 1.0 - p_none
+
+    @staticmethod
+    def _matches(card_data, card_type, value):
+        """Check a known card against a type/value query."""
+        return card_type_for_suit(card_data["suit"]) == card_type and card_data["value"] >= value
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def p_next_card_type(self, card_type):
+        """
+        Probability that the next card drawn is of a type.
+
+        Args:
+            card_type: "monster", "weapon" or "potion"
+
+        Returns:
+            Probability between 0 and 1
+        """
+        return self._p_any(card_type, 0, 1)
+
+    def p_room_has_type(self, card_type, draws=4):
+        """
+        Probability that the next `draws` cards contain at least one card of a type.
+
+        Args:
+            card_type: "monster", "weapon" or "potion"
+            draws: Number of cards the next room will draw
+
+        Returns:
+            Probability between 0 and 1
+        """
+        return self._p_any(card_type, 0, draws)
+
+    def p_room_has_monster_at_least(self, threshold, draws=4):
+        """
+        Probability that the next `draws` cards contain a monster of at least
+        `threshold`. Pass the equipped weapon's value + 1 to ask whether the
+        room holds a monster the weapon cannot fully block.
+
+        Args:
+            threshold: Minimum monster value
+            draws: Number of cards the next room will draw
+
+        Returns:
+            Probability between 0 and 1
+        """
+        return self._p_any("monster", threshold, draws)
+
+    def expected_monster_hp(self, draws=4):
+        """
+        Expected total monster value in the next `draws` cards.
+
+        Args:
+            draws: Number of cards the next room will draw
+
+        Returns:
+            Expected monster HP as a float
+        """
+        unseen, from_unseen, known_cards = self._split_draws(draws)
+
+        expected = sum(card["value"] for card in known_cards
+                       if self._matches(card, "monster", 0))
+
+        if from_unseen:
+            composition = self.deck.composition
+            known = self.deck.known_composition
+            unseen_hp = composition.monster_hp - known.monster_hp
+            expected += unseen_hp * from_unseen / unseen
+
+        return expected
@@ -0,0 +1,420 @@
+"""
+core/display.py
+
+The window and the logical render target.
+The game draws everything in logical coordinates, SCREEN_WIDTH x
+SCREEN_HEIGHT, onto one canvas. present() puts the canvas in the window with
+a single scale pass, letterboxed to keep its shape:
+
+    "integer"  nearest-neighbour at the largest whole-number scale of the
+               logical size that fits, so pixels stay square (falls back to
+               "nearest" in a window smaller than the canvas)
+    "nearest"  nearest-neighbour, filling as much of the window as fits
+    "smooth"   smoothscale, filling as much of the window as fits
+
+When the window is the logical size the canvas is the window itself and
+presenting is just a flip. Mouse positions from the window are mapped back
+to logical coordinates with remap_event() and mouse_pos().
+
+With an internal scale below 1 (INTERNAL_SCALE, for weak machines) the
+canvas is a ReducedCanvas: a smaller surface that is still drawn on in
+logical coordinates, so every pixel the frame fills costs less and the one
+scale pass in present() brings it back up to the window. Positions in the
+window still map to logical coordinates, whatever the canvas's real size.
+Shapes that may land on the canvas are drawn with canvas_draw, a stand-in
+for pygame.draw that scales them onto a ReducedCanvas; pygame.draw itself is
+left alone.
+"""
+
+import math
+import types
+import weakref
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_SIZE, WINDOW_RESIZABLE, PRESENT_SCALE_MODE, INTERNAL_SCALE
+from core.surface_cache import SurfaceCache
+
+SCALE_MODES = ("integer", "nearest", "smooth")
+
+# Events whose positions are in window coordinates
+POSITIONED_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+# How the arguments after the colour of each pygame.draw function are scaled
+# onto a ReducedCanvas, positional first, then by keyword
+DRAW_POSITIONAL = {
+    "rect": ("rect", "length", "length", "length", "length", "length", "length"),
+    "line": ("point", "point", "length"),
+    "aaline": ("point", "point"),
+    "lines": (None, "points", "length"),
+    "aalines": (None, "points"),
+    "polygon": ("points", "length"),
+    "circle": ("point", "length", "length"),
+    "ellipse": ("rect", "length"),
+    "arc": ("rect", None, None, "length"),
+}
+DRAW_KEYWORDS = {
+    "rect": "rect",
+    "start_pos": "point",
+    "end_pos": "point",
+    "center": "point",
+    "points": "points",
+    "width": "length",
+    "radius": "length",
+    "border_radius": "length",
+    "border_top_left_radius": "length",
+    "border_top_right_radius": "length",
+    "border_bottom_left_radius": "length",
+    "border_bottom_right_radius": "length",
+}
+
+
+class ReducedCanvas(pygame.Surface):
+    """
+    A canvas smaller than the logical size that is drawn on in logical
+    coordinates. blit() and fill() scale positions and sources down to it,
+    and canvas_draw does the same for shapes drawn on it. It reports the
+    logical size, so layout code that measures the screen is unaffected.
+
+    Surfaces handed out by a SurfaceCache never change, so their scaled
+    copies are kept for as long as they live. Surfaces retained with the
+    display keep theirs too, scaled again whenever they have changed since;
+    anything else is scaled as it is blitted.
+    """
+
+    def __init__(self, logical_size, scale, display_surface, revisions):
+        """
+        Create the canvas in the display's pixel format.
+
+        Args:
+            logical_size: Size the game lays frames out at
+            scale: Fraction of the logical size actually drawn, below 1
+            display_surface: Surface whose pixel format to use
+            revisions: The display's retained surfaces, mapped to how many
+                times each has changed
+        """
+        size = (max(1, round(logical_size[0] * scale)), max(1, round(logical_size[1] * scale)))
+        super().__init__(size, 0, display_surface)
+        self.logical_size = logical_size
+        self.scale = scale
+
+        # Shared source surface -> its scaled copy
+        self._scaled = weakref.WeakKeyDictionary()
+
+        # Retained source surface -> (its scaled copy, the revision scaled)
+        self._revisions = revisions
+        self._retained = weakref.WeakKeyDictionary()
+
+    # ========================================================================
+    # Logical size
+    # ========================================================================
+
+    def get_size(self):
+        return self.logical_size
+
+    def get_width(self):
+        return self.logical_size[0]
+
+    def get_height(self):
+        return self.logical_size[1]
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.logical_size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    # ========================================================================
+    # Drawing
+    # ========================================================================
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Surface.blit in logical coordinates."""
+        scaled = self._scaled_source(source)
+        if area is not None:
+            area = self.scale_rect(pygame.Rect(area).clip(source.get_rect()))
+        position = (math.floor(dest[0] * self.scale), math.floor(dest[1] * self.scale))
+        return self.logical_rect(pygame.Surface.blit(self, scaled, position, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=1):
+        """Surface.blits in logical coordinates."""
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, colour, rect=None, special_flags=0):
+        """Surface.fill in logical coordinates."""
+        if rect is not None:
+            rect = self.scale_rect(rect)
+        return self.logical_rect(pygame.Surface.fill(self, colour, rect, special_flags))
+
+    def _scaled_source(self, source):
+        """A source surface at the canvas's scale."""
+        width, height = source.get_size()
+        size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+
+        if not SurfaceCache.is_shared(source):
+            revision = self._revisions.get(source)
+            if revision is None:
+                return pygame.transform.scale(source, size)
+            return self._scaled_retained(source, size, revision)
+
+        scaled = self._scaled.get(source)
+        if scaled is None:
+            # Made once, so it can afford to be filtered; smoothscale needs
+            # 24 or 32 bits and would bleed a colorkey into the edges
+            if source.get_bitsize() >= 24 and source.get_colorkey() is None:
+                scaled = pygame.transform.smoothscale(source, size)
+            else:
+                scaled = pygame.transform.scale(source, size)
+            self._scaled[source] = scaled
+        elif scaled.get_alpha() != source.get_alpha():
+            # Surface alpha can change on a shared surface; its pixels cannot
+            scaled.set_alpha(source.get_alpha())
+        return scaled
+
+    def _scaled_retained(self, source, size, revision):
+        """A retained source at the canvas's scale, scaled again only when it has changed."""
+        scaled, scaled_revision = self._retained.get(source, (None, None))
+        if scaled is None or scaled.get_size() != size:
+            scaled = pygame.transform.scale(source, size)
+            self._retained[source] = (scaled, revision)
+        elif scaled_revision != revision:
+            # Into the old copy, so a surface that changes often makes no new ones
+            pygame.transform.scale(source, size, scaled)
+            self._retained[source] = (scaled, revision)
+
+        if scaled.get_alpha() != source.get_alpha():
+            scaled.set_alpha(source.get_alpha())
+        return scaled
+
+    # ========================================================================
+    # Coordinates
+    # ========================================================================
+
+    def scale_length(self, length):
+        """A logical distance on the canvas; zero and negative flags are kept."""
+        if length <= 0:
+            return length
+        return max(1, round(length * self.scale))
+
+    def scale_point(self, point):
+        return (math.floor(point[0] * self.scale), math.floor(point[1] * self.scale))
+
+    def scale_rect(self, rect):
+        """A logical rect on the canvas, by its edges so neighbours still meet."""
+        rect = pygame.Rect(rect)
+        left = math.floor(rect.left * self.scale)
+        top = math.floor(rect.top * self.scale)
+        right = math.floor(rect.right * self.scale)
+        bottom = math.floor(rect.bottom * self.scale)
+        width = max(1, right - left) if rect.width > 0 else 0
+        height = max(1, bottom - top) if rect.height > 0 else 0
+        return pygame.Rect(left, top, width, height)
+
+    def logical_rect(self, rect):
+        """A rect on the canvas in logical coordinates."""
+        scale = self.scale
+        left = math.floor(rect.left / scale)
+        top = math.floor(rect.top / scale)
+        return pygame.Rect(left, top, math.ceil(rect.right / scale) - left, math.ceil(rect.bottom / scale) - top)
+
+    def scale_argument(self, kind, value):
+        """Scale one pygame.draw argument of a kind from DRAW_POSITIONAL."""
+        if kind == "length":
+            return self.scale_length(value)
+        if kind == "point":
+            return self.scale_point(value)
+        if kind == "points":
+            return [self.scale_point(point) for point in value]
+        if kind == "rect":
+            return self.scale_rect(value)
+        return value
+
+
+def _scaling_draw_function(name, function):
+    """Wrap a pygame.draw function to scale shapes drawn on a ReducedCanvas."""
+    positional = DRAW_POSITIONAL[name]
+
+    def draw(surface, colour, *args, **kwargs):
+        if not isinstance(surface, ReducedCanvas):
+            return function(surface, colour, *args, **kwargs)
+
+        args = [surface.scale_argument(kind, value) for kind, value in zip(positional, args)] + list(args[len(positional):])
+        for key, value in kwargs.items():
+            kwargs[key] = surface.scale_argument(DRAW_KEYWORDS.get(key), value)
+        return surface.logical_rect(function(surface, colour, *args, **kwargs))
+
+    draw.__name__ = function.__name__
+    draw.__doc__ = function.__doc__
+    return draw
+
+
+# pygame.draw for surfaces that may be the canvas: canvas_draw.rect(surface,
+# ...) and so on scale onto a ReducedCanvas and draw anything else as is.
+# Surfaces a caller made itself can keep using pygame.draw
+canvas_draw = types.SimpleNamespace(**{
+    name: _scaling_draw_function(name, getattr(pygame.draw, name)) for name in DRAW_POSITIONAL
+})
+
+
+class Display:
+    """Owns the window, the logical canvas and the pass between them."""
+
+    def __init__(self, logical_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.logical_size = logical_size
+        self.scale_mode = PRESENT_SCALE_MODE
+        self.internal_scale = INTERNAL_SCALE
+
+        self.window = None
+        self.canvas = None
+
+        # Where in the window the canvas is shown, and the window area
+        # it is scaled into
+        self.viewport = pygame.Rect((0, 0), logical_size)
+        self._target = None
+
+        # Retained surface -> how many times it has changed
+        self._revisions = weakref.WeakKeyDictionary()
+
+    def open(self, window_size=WINDOW_SIZE, scale_mode=PRESENT_SCALE_MODE, resizable=WINDOW_RESIZABLE,
+             internal_scale=INTERNAL_SCALE):
+        """
+        Create the window.
+
+        Args:
+            window_size: Window size in pixels
+            scale_mode: One of SCALE_MODES
+            resizable: Let the player resize the window
+            internal_scale: Fraction of the logical resolution to draw at,
+                above 0 and at most 1
+
+        Returns:
+            The canvas to draw frames on
+        """
+        if scale_mode not in SCALE_MODES:
+            raise ValueError(f"Unknown scale mode {scale_mode!r}, expected one of {SCALE_MODES}")
+        if not 0 < internal_scale <= 1:
+            raise ValueError(f"Internal scale must be above 0 and at most 1, not {internal_scale!r}")
+        self.scale_mode = scale_mode
+        if internal_scale != self.internal_scale:
+            self.canvas = None
+        self.internal_scale = internal_scale
+
+        flags = pygame.RESIZABLE if resizable else 0
+        self.window = pygame.display.set_mode(window_size, flags)
+        self._layout()
+        return self.canvas
+
+    def resize(self):
+        """Lay the canvas out again after the window has been resized."""
+        self.window = pygame.display.get_surface()
+        self._layout()
+        return self.canvas
+
+    def _layout(self):
+        """Work out the viewport and make the canvas for the current window."""
+        window_width, window_height = self.window.get_size()
+        logical_width, logical_height = self.logical_size
+        reduced = self.internal_scale < 1
+
+        if (window_width, window_height) == self.logical_size and not reduced:
+            self.canvas = self.window
+            self.viewport = self.window.get_rect()
+            self._target = None
+            return
+
+        scale = min(window_width / logical_width, window_height / logical_height)
+        if self.scale_mode == "integer" and scale >= 1:
+            scale = int(scale)
+
+        size = (max(1, int(logical_width * scale)), max(1, int(logical_height * scale)))
+        self.viewport = pygame.Rect((0, 0), size)
+        self.viewport.center = (window_width // 2, window_height // 2)
+
+        # Keep the canvas across resizes unless it was the window itself
+        if self.canvas is None or self._target is None:
+            if reduced:
+                self.canvas = ReducedCanvas(self.logical_size, self.internal_scale, self.window, self._revisions)
+            else:
+                self.canvas = pygame.Surface(self.logical_size).convert()
+
+        # The letterbox bars are never drawn over, so fill them once
+        self.window.fill((0, 0, 0))
+        self._target = self.window.subsurface(self.viewport)
+
+    # ========================================================================
+    # Retained surfaces
+    # ========================================================================
+
+    def retain(self, surface):
+        """
+        Mark a surface the game keeps and blits to the canvas frame after
+        frame (a backdrop, a composite, a text buffer). A ReducedCanvas keeps
+        its scaled copy instead of scaling it on every blit, so call
+        changed() whenever it is drawn on.
+
+        Returns:
+            The surface
+        """
+        self._revisions.setdefault(surface, 0)
+        return surface
+
+    def changed(self, surface):
+        """Note that a retained surface has been drawn on since it was last shown."""
+        revision = self._revisions.get(surface)
+        if revision is not None:
+            self._revisions[surface] = revision + 1
+
+    # ========================================================================
+    # Frames
+    # ========================================================================
+
+    def present(self):
+        """Scale the canvas into the window and flip."""
+        if self._target is not None:
+            if self.scale_mode == "smooth":
+                pygame.transform.smoothscale(self.canvas, self.viewport.size, self._target)
+            else:
+                pygame.transform.scale(self.canvas, self.viewport.size, self._target)
+        pygame.display.flip()
+
+    # ========================================================================
+    # Input
+    # ========================================================================
+
+    def to_logical(self, pos):
+        """Map a window position to logical coordinates."""
+        if self._target is None:
+            return pos
+        x = (pos[0] - self.viewport.x) * self.logical_size[0] // self.viewport.width
+        y = (pos[1] - self.viewport.y) * self.logical_size[1] // self.viewport.height
+        return (x, y)
+
+    def remap_event(self, event):
+        """
+        Put a mouse event's position in logical coordinates. The viewport
+        always stands for the logical size, so this holds however small the
+        canvas really is.
+
+        Returns:
+            The event, or a remapped copy of it
+        """
+        if self._target is None or event.type not in POSITIONED_EVENTS:
+            return event
+
+        attributes = dict(event.dict)
+        attributes["pos"] = self.to_logical(event.pos)
+        if "rel" in attributes:
+            attributes["rel"] = (
+                event.rel[0] * self.logical_size[0] // self.viewport.width,
+                event.rel[1] * self.logical_size[1] // self.viewport.height,
+            )
+        return pygame.event.Event(event.type, attributes)
+
+    def mouse_pos(self):
+        """The mouse position in logical coordinates."""
+        return self.to_logical(pygame.mouse.get_pos())
+
+
+# The game's single display
+display = Display()
@@ -0,0 +1,119 @@
+"""
+core/frame_pacer.py
+
+Frame pacing for the main loop, with idle throttling.
+While the current state is busy the loop runs at FPS as before. Once the
+state reports itself idle for IDLE_THROTTLE_DELAY seconds, the pacer drops
+to IDLE_FPS and sleeps in pygame.event.wait between frames, so the first
+input event wakes it straight back to full rate.
+
+With IDLE_FREEZE_FLOAT the state's ambient motion (the card bob) is held
+as well. Nothing on screen then changes between inputs, so the pacer sleeps
+up to IDLE_FROZEN_WAKE_MS at a time and asks the loop to skip drawing until
+something happens.
+
+Browser builds can't block on the event queue, so there the pacer never
+throttles.
+"""
+
+import sys
+
+import pygame
+
+from config import FPS, IDLE_THROTTLE, IDLE_FPS, IDLE_THROTTLE_DELAY, IDLE_FREEZE_FLOAT, IDLE_FROZEN_WAKE_MS
+
+
+class FramePacer:
+    """Ticks the loop at full rate, or slower while the game is idle."""
+
+    def __init__(self, clock, enabled=None, freeze_float=IDLE_FREEZE_FLOAT):
+        """
+        Create a pacer.
+
+        Args:
+            clock: The loop's pygame Clock
+            enabled: Throttle while idle; defaults to IDLE_THROTTLE
+                everywhere except browser builds
+            freeze_float: Hold ambient motion while throttled
+        """
+        self.clock = clock
+        self.enabled = IDLE_THROTTLE and sys.platform != "emscripten" if enabled is None else enabled
+        self.freeze_float = freeze_float
+
+        self.throttled = False
+        self.idle_seconds = 0.0
+
+        # Frames run and frames drawn, for reporting
+        self.frames = 0
+        self.drawn_frames = 0
+
+        self._held_state = None
+
+    def next_frame(self, game_manager):
+        """
+        Wait for the next frame.
+
+        Args:
+            game_manager: Asked whether its current state is idle
+
+        Returns:
+            (delta_time, events, redraw): seconds since the last frame, the
+            input events to handle and whether the frame needs drawing
+        """
+        self.frames += 1
+
+        if not self.throttled:
+            delta_time = self.clock.tick(FPS) / 1000.0
+            events = pygame.event.get()
+            self._track_idle(game_manager, delta_time, events)
+            self.drawn_frames += 1
+            return delta_time, events, True
+
+        # Throttled: sleep until input or the next slow frame is due
+        frozen = self._held_state is not None
+        first = pygame.event.wait(IDLE_FROZEN_WAKE_MS if frozen else 1000 // IDLE_FPS)
+        delta_time = min(self.clock.tick() / 1000.0, 1.0 / IDLE_FPS)
+
+        events = []
+        if first.type != pygame.NOEVENT:
+            events.append(first)
+            events.extend(pygame.event.get())
+
+        if events or not self._is_idle(game_manager):
+            self.wake()
+            self.drawn_frames += 1
+            return delta_time, events, True
+
+        redraw = not frozen
+        if redraw:
+            self.drawn_frames += 1
+        return delta_time, events, redraw
+
+    def wake(self):
+        """Return to full rate."""
+        self.throttled = False
+        self.idle_seconds = 0.0
+        if self._held_state is not None:
+            self._held_state.hold_idle_motion(False)
+            self._held_state = None
+
+    def _track_idle(self, game_manager, delta_time, events):
+        """Count idle time at full rate and throttle once there is enough."""
+        if events or not (self.enabled and self._is_idle(game_manager)):
+            self.idle_seconds = 0.0
+            return
+
+        self.idle_seconds += delta_time
+        if self.idle_seconds >= IDLE_THROTTLE_DELAY:
+            self.throttled = True
+            if self.freeze_float:
+                self._held_state = game_manager.current_state
+                self._held_state.hold_idle_motion(True)
+
+    @staticmethod
+    def _is_idle(game_manager):
+        return (
+            game_manager.fade_direction == 0 and
+            game_manager.current_state is not None and
+            game_manager.current_state.is_idle()
+        )
@@ -242,7 +242,7 @@ class CardUpdateSystem:
         for card in self.session.room.cards:
             card.update(delta_time)
             
-            if hasattr(card, 'is_flipping') and card.is_flipping:
+            if card.is_flipping:
                 card.update_flip(delta_time)
 
     def _update_inventory_cards(self, delta_time):
@@ -250,7 +250,7 @@ class CardUpdateSystem:
         for card in self.session.inventory:
             card.update(delta_time)
             
-            if hasattr(card, 'is_flipping') and card.is_flipping:
+            if card.is_flipping:
                 card.update_flip(delta_time)
 
     def _update_equipped_weapon(self, delta_time):
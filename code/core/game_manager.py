@@ -12,13 +12,22 @@ from config import (
 # Manager imports
 from managers.floor_manager import FloorManager
 
+# Loading imports
+from core.asset_preloader import AssetPreloader
+
+# Display imports
+from core.display import display
+
+# Instrumentation imports
+from core import latency
+from core.profiler import profiler
+
+# Save imports
+from core.autosave import Autosaver
+from core.snapshot import decode_snapshot, SnapshotError
+
 # State imports
-from states.title_state import TitleState
-from states.rules_state import RulesState
-from states.playing_state import PlayingState
-from states.game_over_state import GameOverState
-from states.tutorial_state import TutorialState
-from states.floor_start_state import FloorStartState
+from core.state_registry import StateRegistry
 
 class GameManager:
     """Manager for game states with roguelike elements."""
@@ -27,14 +36,19 @@ class GameManager:
 
         self.floor_manager = FloorManager(self)
 
-        self.states = {
-            "title": TitleState(self),
-            "rules": RulesState(self),
-            "playing": PlayingState(self),
-            "game_over": GameOverState(self),
-            "tutorial": TutorialState(self),
-            "tutorial_watch": TutorialState(self, watch=True),
-        }
+        self.preloader = AssetPreloader()
+
+        self.autosaver = Autosaver()
+        self.resume_snapshot = None
+
+        # States are imported and built on first use
+        self.states = StateRegistry(self)
+        self.states.register("title", "states.title_state", "TitleState")
+        self.states.register("rules", "states.rules_state", "RulesState")
+        self.states.register("playing", "states.playing_state", "PlayingState")
+        self.states.register("game_over", "states.game_over_state", "GameOverState")
+        self.states.register("tutorial", "states.tutorial_state", "TutorialState")
+        self.states.register("tutorial_watch", "states.tutorial_state", "TutorialState", watch=True)
 
         self.current_state = None
         self.game_data = {
@@ -55,7 +69,7 @@ class GameManager:
         self.fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.fade_surface.fill(BLACK)
         
-        self.fade_surface = self.fade_surface.convert_alpha()
+        self.fade_surface = display.retain(self.fade_surface.convert_alpha())
 
         self.change_state("title")
 
@@ -77,9 +91,11 @@ class GameManager:
         self.fade_direction = 1
         self.fade_alpha = 0
 
+        latency.mark("state")
+
     def _execute_state_transition(self):
         if self.current_state:
-            if type(self.current_state) == TutorialState:
+            if self.states.name_of(self.current_state) in ("tutorial", "tutorial_watch"):
                 self.has_shown_tutorial = True
             self.current_state.exit()
 
@@ -111,29 +127,35 @@ class GameManager:
             self.current_state.handle_event(event)
 
     def update(self, delta_time):
-        if self.fade_direction != 0:
-            self.fade_alpha += self.fade_direction * self.fade_speed * delta_time
+        with profiler.scope("update"):
+            # Install whatever the background preloader has finished
+            with profiler.scope("preload"):
+                self.preloader.pump()
+
+            if self.fade_direction != 0:
+                self.fade_alpha += self.fade_direction * self.fade_speed * delta_time
+                
+                if self.fade_direction == 1:
+                    if self.fade_alpha >= 255:
+                        self.fade_alpha = 255
+                        self._execute_state_transition()
+                        self.fade_direction = -1
+                else:
+                    if self.fade_alpha <= 0:
+                        self.fade_alpha = 0
+                        self.fade_direction = 0
             
-            if self.fade_direction == 1:
-                if self.fade_alpha >= 255:
-                    self.fade_alpha = 255
-                    self._execute_state_transition()
-                    self.fade_direction = -1
-            else:
-                if self.fade_alpha <= 0:
-                    self.fade_alpha = 0
-                    self.fade_direction = 0
-        
-        if self.current_state and not (self.fade_direction == 1):
-            self.current_state.update(delta_time)
+            if self.current_state and not (self.fade_direction == 1):
+                self.current_state.update(delta_time)
 
     def draw(self, surface):
-        if self.current_state:
-            self.current_state.draw(surface)
-        
-        if self.fade_alpha > 0:
-            self.fade_surface.set_alpha(int(self.fade_alpha))
-            surface.blit(self.fade_surface, (0, 0))
+        with profiler.scope("draw"):
+            if self.current_state:
+                self.current_state.draw(surface)
+            
+            if self.fade_alpha > 0:
+                self.fade_surface.set_alpha(int(self.fade_alpha))
+                surface.blit(self.fade_surface, (0, 0))
 
     def start_new_run(self):
         """Initialise a new roguelike run."""
@@ -149,6 +171,40 @@ class GameManager:
 
         self.change_state("playing")
 
+    def has_saved_run(self):
+        """Check whether there is an autosaved run to continue."""
+        return self.autosaver.exists()
+
+    def resume_saved_run(self):
+        """
+        Continue the autosaved run.
+
+        Returns:
+            True if the run was restored, False if the save was unusable
+        """
+        data = self.autosaver.load()
+        if data is None:
+            return False
+
+        try:
+            snapshot = decode_snapshot(data)
+        except SnapshotError:
+            self.autosaver.clear()
+            return False
+
+        self.floor_manager.restore(snapshot.floors, snapshot.floor_index, snapshot.current_room, snapshot.endless)
+
+        self.game_data["life_points"] = snapshot.life_points
+        self.game_data["max_life"] = snapshot.max_life
+        self.game_data["victory"] = False
+        self.game_data["run_complete"] = False
+
+        self.has_shown_tutorial = True
+        self.resume_snapshot = snapshot
+
+        self.change_state("playing")
+        return True
+
     def advance_to_next_room(self):
         """Advance to the next room in the current floor."""
         room_info = self.floor_manager.advance_room()
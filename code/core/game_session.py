@@ -5,6 +5,11 @@ Single source of truth for all game state during a playthrough.
 NO MORE scattered state, duplicate trackers, or sync methods!
 """
 
+from config import DISCARD_LIVE_CARDS
+from core.card_registry import CardLocation, CardRegistry
+from core.rules_session import RulesSession
+from entities.card import Card, CardTextures
+from entities.card_pool import card_pool
 from entities.deck import Deck, DiscardPile
 from entities.room import Room
 
@@ -41,6 +46,66 @@ class GameSession:
         # Turn state
         self.ran_last_turn = False
         
+        # Where every live card currently is
+        self.card_locations = CardRegistry()
+        
+    # ========================================================================
+    # Card Location Helpers
+    # ========================================================================
+    
+    def location_of(self, card):
+        """Get the CardLocation of a card, or None if it is not in play."""
+        return self.card_locations.location_of(card)
+    
+    def move_card(self, card, location):
+        """Record a card's new location without touching any container."""
+        self.card_locations.move(card, location)
+    
+    def add_to_room(self, card):
+        """Place a card in the current room."""
+        self.room.add_card(card)
+        self.card_locations.move(card, CardLocation.ROOM)
+    
+    def remove_from_room(self, card, destination=None):
+        """
+        Take a card out of the room.
+        
+        Args:
+            card: Card to remove
+            destination: CardLocation the card is heading to, if it changes
+        """
+        self.room.remove_card(card)
+        if destination is not None:
+            self.card_locations.move(card, destination)
+    
+    def clear_room(self):
+        """Empty the room, forgetting cards that have left play."""
+        for card in self.room.cards:
+            if self.card_locations.location_of(card) in (CardLocation.ROOM, CardLocation.DECK):
+                self.card_locations.forget(card)
+        self.room.clear()
+    
+    def return_to_deck(self, card):
+        """Put a room card back on the bottom of the deck."""
+        self.deck.add_to_bottom({"suit": card.suit, "value": card.value})
+        self.card_locations.move(card, CardLocation.DECK)
+    
+    def discard_card(self, card):
+        """Move a card onto the discard pile from wherever it is."""
+        location = self.card_locations.location_of(card)
+        
+        if location == CardLocation.ROOM:
+            self.room.remove_card(card)
+        elif location == CardLocation.DEFEATED:
+            self.defeated_monsters.remove(card)
+        elif location == CardLocation.EQUIPPED and self.equipped_weapon is card:
+            self.equipped_weapon = None
+        
+        self.card_locations.move(card, CardLocation.DISCARD)
+        for buried in self.discard_pile.add_card(card):
+            self.card_locations.forget(buried)
+            card_pool.release(buried)
+        
     # ========================================================================
     # Player State Helpers
     # ========================================================================
@@ -57,12 +122,13 @@ class GameSession:
         """Add a card to inventory if space available."""
         if self.can_add_to_inventory():
             self.inventory.append(card)
+            self.card_locations.move(card, CardLocation.INVENTORY)
             return True
         return False
     
     def remove_from_inventory(self, card):
-        """Remove a card from inventory."""
-        if card in self.inventory:
+        """Remove a card from inventory. The caller records where it goes next."""
+        if self.card_locations.is_at(card, CardLocation.INVENTORY):
             self.inventory.remove(card)
             return True
         return False
@@ -75,6 +141,9 @@ class GameSession:
         self.equipped_weapon = weapon_card
         self.defeated_monsters = []
         
+        self.card_locations.move(weapon_card, CardLocation.EQUIPPED)
+        self._mark_discarded(old_weapon, old_monsters)
+        
         return old_weapon, old_monsters
     
     def unequip_weapon(self):
@@ -85,11 +154,21 @@ class GameSession:
         self.equipped_weapon = None
         self.defeated_monsters = []
         
+        self._mark_discarded(weapon, monsters)
+        
         return weapon, monsters
     
+    def _mark_discarded(self, weapon, monsters):
+        """Record a dropped weapon stack as discarded while it animates away."""
+        for monster in monsters:
+            self.card_locations.move(monster, CardLocation.DISCARD)
+        if weapon:
+            self.card_locations.move(weapon, CardLocation.DISCARD)
+    
     def add_defeated_monster(self, monster_card):
         """Add a monster to the defeated stack."""
         self.defeated_monsters.append(monster_card)
+        self.card_locations.move(monster_card, CardLocation.DEFEATED)
     
     def change_health(self, amount):
         """
@@ -127,6 +206,11 @@ class GameSession:
         """Check if deck still has cards."""
         return len(self.deck.cards) > 0
     
+    def next_room_draw_count(self):
+        """Number of cards the next room will draw from the deck."""
+        carried = 1 if self.has_single_card_remaining() else 0
+        return min(4 - carried, len(self.deck.cards))
+    
     def mark_room_complete(self):
         """Mark current room as complete."""
         if not self.current_room_complete:
@@ -142,15 +226,28 @@ class GameSession:
         """Mark current floor as complete."""
         self.floor_complete = True
     
-    def reset_for_new_floor(self, floor_type):
-        """Reset state for a new floor."""
+    def reset_for_new_floor(self, floor_type, deck=None):
+        """
+        Reset state for a new floor.
+
+        Args:
+            floor_type: The new floor
+            deck: A deck already dealt for it, or None for a fresh one
+        """
         self.current_floor = floor_type
-        self.deck = Deck(floor_type)
-        self.discard_pile.cards = []
+        self.deck = deck if deck is not None else Deck(floor_type)
+        self.discard_pile.clear()
+        # Run-back and discarded cards are done with for good
+        for card in self.card_locations.forget_location(CardLocation.DECK, CardLocation.DISCARD):
+            card_pool.release(card)
         self.completed_rooms = 0
         self.floor_complete = False
         self.current_room_complete = False
     
+    def to_rules_session(self):
+        """Capture this session as a cheap, forkable RulesSession for lookahead."""
+        return RulesSession.from_session(self)
+    
     # ========================================================================
     # Save/Load Support
     # ========================================================================
@@ -170,3 +267,54 @@ class GameSession:
         self.max_life = data.get("max_life", 20)
         self.current_floor = data.get("current_floor", "dungeon")
         self.completed_rooms = data.get("completed_rooms", 0)
+    
+    def restore_from_snapshot(self, snapshot):
+        """
+        Rebuild the whole session from a decoded Snapshot.
+        Cards come back face up and in their containers; callers position them.
+        """
+        self.life_points = snapshot.life_points
+        self.max_life = snapshot.max_life
+        self.current_floor = snapshot.current_floor
+        self.completed_rooms = snapshot.completed_rooms
+        self.current_room_complete = snapshot.current_room_complete
+        self.floor_complete = snapshot.floor_complete
+        self.ran_last_turn = snapshot.ran_last_turn
+        
+        self.deck = Deck(self.current_floor)
+        self.deck.restore(snapshot.deck, snapshot.known_count)
+        
+        self.card_locations.clear()
+        self.room.clear()
+        self.inventory = []
+        self.equipped_weapon = None
+        self.defeated_monsters = []
+        self.discard_pile.clear()
+        
+        for model in snapshot.room:
+            self.add_to_room(self._restored_card(model))
+        
+        for model in snapshot.inventory:
+            self.add_to_inventory(self._restored_card(model))
+        
+        if snapshot.equipped_weapon:
+            self.equip_weapon(self._restored_card(snapshot.equipped_weapon))
+        
+        for model in snapshot.defeated_monsters:
+            self.add_defeated_monster(self._restored_card(model))
+        
+        # Only the top of the discard pile comes back as cards
+        live_from = max(0, len(snapshot.discard_pile) - DISCARD_LIVE_CARDS)
+        for model in snapshot.discard_pile[:live_from]:
+            self.discard_pile.add_model(model, CardTextures.face(model))
+        for model in snapshot.discard_pile[live_from:]:
+            card = self._restored_card(model)
+            self.discard_pile.add_card(card)
+            self.card_locations.move(card, CardLocation.DISCARD)
+    
+    @staticmethod
+    def _restored_card(model):
+        """Wrap a restored CardModel in a face-up view."""
+        card = Card(model.suit, model.value, model.floor_type, model=model)
+        card.face_up = True
+        return card
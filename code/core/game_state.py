@@ -27,4 +27,12 @@ class GameState:
 
     def draw(self, surface):
         """Draw state visuals."""
+        pass
+
+    def is_idle(self):
+        """Whether nothing but ambient motion is happening, so the loop may slow down."""
+        return False
+
+    def hold_idle_motion(self, held):
+        """Stop or restart ambient motion while the loop is throttled."""
         pass
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+core/hit_index.py
+
+Uniform-grid spatial index for point queries against many rectangles.
+Each item is bucketed into every grid cell its rect overlaps, so "what is
+under the cursor?" only looks at the items sharing the cursor's cell instead
+of every item on the board. Items carry a sortable layer and come back from
+queries topmost first.
+
+Updates are incremental: moving an item only re-buckets it when the set of
+cells it covers changes, which for a card sliding a few pixels is usually
+never.
+"""
+
+import pygame
+
+from config import HIT_GRID_CELL
+
+
+class HitIndex:
+    """Layered uniform grid of item rects."""
+
+    def __init__(self, cell_size=HIT_GRID_CELL):
+        """
+        Create an empty index.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels
+        """
+        self.cell_size = cell_size
+
+        # (column, row) -> set of items overlapping that cell
+        self._cells = {}
+
+        # item -> [rect, cell range, layer]
+        self._entries = {}
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ========================================================================
+    # Updates
+    # ========================================================================
+
+    def insert(self, item, rect, layer=0):
+        """
+        Add an item, or move an existing one to a new rect and layer.
+
+        Args:
+            item: Hashable object to index
+            rect: Its current area
+            layer: Sort key; higher layers are returned first
+        """
+        if item in self._entries:
+            self.update(item, rect)
+            self._entries[item][2] = layer
+            return
+
+        rect = pygame.Rect(rect)
+        cells = self._cell_range(rect)
+        self._entries[item] = [rect, cells, layer]
+        self._add_to_cells(item, cells)
+
+    def update(self, item, rect):
+        """Record a new rect for an indexed item; unknown items are ignored."""
+        entry = self._entries.get(item)
+        if entry is None or entry[0] == rect:
+            return
+
+        entry[0] = pygame.Rect(rect)
+
+        cells = self._cell_range(entry[0])
+        if cells != entry[1]:
+            self._remove_from_cells(item, entry[1])
+            self._add_to_cells(item, cells)
+            entry[1] = cells
+
+    def set_layer(self, item, layer):
+        """Change the layer of an indexed item."""
+        entry = self._entries.get(item)
+        if entry is not None:
+            entry[2] = layer
+
+    def remove(self, item):
+        """Drop an item if it is indexed."""
+        entry = self._entries.pop(item, None)
+        if entry is not None:
+            self._remove_from_cells(item, entry[1])
+
+    def clear(self):
+        """Drop every item."""
+        self._cells.clear()
+        self._entries.clear()
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def query(self, point):
+        """
+        Find the items whose rect contains a point.
+
+        Args:
+            point: (x, y) position
+
+        Returns:
+            List of items, highest layer first
+        """
+        cell = (int(point[0]) // self.cell_size, int(point[1]) // self.cell_size)
+        bucket = self._cells.get(cell)
+        if not bucket:
+            return []
+
+        entries = self._entries
+        hits = [item for item in bucket if entries[item][0].collidepoint(point)]
+        if len(hits) > 1:
+            hits.sort(key=lambda item: entries[item][2], reverse=True)
+        return hits
+
+    def top(self, point, accept=None):
+        """
+        Find the topmost item containing a point.
+
+        Args:
+            point: (x, y) position
+            accept: Optional predicate an item must satisfy
+
+        Returns:
+            The item, or None
+        """
+        for item in self.query(point):
+            if accept is None or accept(item):
+                return item
+        return None
+
+    # ========================================================================
+    # Grid
+    # ========================================================================
+
+    def _cell_range(self, rect):
+        """Inclusive (first column, first row, last column, last row) a rect covers."""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def _add_to_cells(self, item, cells):
+        first_column, first_row, last_column, last_row = cells
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                bucket = self._cells.get((column, row))
+                if bucket is None:
+                    bucket = self._cells[(column, row)] = set()
+                bucket.add(item)
+
+    def _remove_from_cells(self, item, cells):
+        first_column, first_row, last_column, last_row = cells
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                bucket = self._cells.get((column, row))
+                if bucket is not None:
+                    bucket.discard(item)
+                    if not bucket:
+                        del self._cells[(column, row)]
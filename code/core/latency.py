@@ -0,0 +1,264 @@
+"""
+core/latency.py
+
+Click-to-photon latency instrumentation, switched on by setting the
+SCOUNDREL_LATENCY environment variable (e.g. SCOUNDREL_LATENCY=1).
+
+main.py timestamps every input event as it is read. Code that changes the
+game in response to input (card actions, hover changes, state changes)
+calls mark(), and the latency of that input is taken once the frame showing
+the change has been flipped. Each frame's update, draw and flip are timed
+per game state, percentiles are drawn in a small overlay, and a summary is
+printed on exit.
+
+When the variable is not set no probe exists: mark() and current() return
+straight away and main.py's loop calls NULL_PROBE, whose methods do nothing.
+"""
+
+import os
+import time
+from collections import deque
+
+import pygame
+
+ENV_VAR = "SCOUNDREL_LATENCY"
+
+# Samples kept per series
+SAMPLE_LIMIT = 2000
+
+# How often the overlay text is refreshed, in seconds
+OVERLAY_REFRESH = 0.25
+
+# Frame phases timed by the loop, in order
+PHASES = ("events", "update", "draw", "flip")
+
+probe = None
+
+
+def enabled_by_environment():
+    """Whether the environment asks for latency instrumentation."""
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def enable():
+    """Create the global probe and return it."""
+    global probe
+    probe = LatencyProbe()
+    return probe
+
+
+def current():
+    """Read time of the input being handled right now, or None."""
+    if probe is None:
+        return None
+    return probe.current_input
+
+
+def mark(label, read_at=None):
+    """
+    Record that input has changed the game.
+
+    Args:
+        label: Kind of change, e.g. "action", "hover", "state"; input
+            that had to wait for an animation uses a "_held" label
+        read_at: When the input was read, for effects applied after the
+            event was handled (queued clicks, coalesced hover); defaults
+            to the input currently being handled
+    """
+    if probe is not None:
+        probe.mark(label, read_at)
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sequence of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class LatencyProbe:
+    """Collects input latencies and per-state frame phase timings."""
+
+    def __init__(self):
+        self.current_input = None
+
+        # (label, read_at) waiting for the frame that shows them
+        self._awaiting = []
+
+        # label -> deque of latencies in milliseconds
+        self.latencies = {}
+
+        # state name -> phase -> deque of durations in milliseconds
+        self.phases = {}
+
+        self._lap_started = 0.0
+        self._laps = {}
+
+        self._overlay = None
+        self._overlay_built = 0.0
+        self._font = None
+
+    # ========================================================================
+    # Input
+    # ========================================================================
+
+    def read_input(self):
+        """Stamp an input event as it comes off the queue; call before handling it."""
+        self.current_input = time.perf_counter()
+
+    def input_handled(self):
+        """Call after the event has been handled."""
+        self.current_input = None
+
+    def mark(self, label, read_at=None):
+        """Queue a change caused by input until its frame is on screen."""
+        if read_at is None:
+            read_at = self.current_input
+        if read_at is not None:
+            self._awaiting.append((label, read_at))
+
+    # ========================================================================
+    # Frames
+    # ========================================================================
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        self._lap_started = time.perf_counter()
+        self._laps.clear()
+
+    def lap(self, phase):
+        """Close the current phase of the frame."""
+        now = time.perf_counter()
+        self._laps[phase] = (now - self._lap_started) * 1000
+        self._lap_started = now
+
+    def end_frame(self, state_name):
+        """
+        Finish a frame once it has been flipped: record its phases under
+        the state that ran it and complete every input it showed.
+        """
+        now = time.perf_counter()
+
+        state_phases = self.phases.get(state_name)
+        if state_phases is None:
+            state_phases = self.phases[state_name] = {phase: deque(maxlen=SAMPLE_LIMIT) for phase in PHASES}
+        for phase, duration in self._laps.items():
+            state_phases[phase].append(duration)
+
+        for label, read_at in self._awaiting:
+            samples = self.latencies.get(label)
+            if samples is None:
+                samples = self.latencies[label] = deque(maxlen=SAMPLE_LIMIT)
+            samples.append((now - read_at) * 1000)
+        self._awaiting.clear()
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def summary(self):
+        """
+        Percentiles of everything recorded so far.
+
+        Returns:
+            {"latency": {label: {...}}, "phases": {state: {phase: {...}}}}
+        """
+        def stats(values):
+            values = list(values)
+            return {
+                "count": len(values),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+            }
+
+        all_latencies = [value for samples in self.latencies.values() for value in samples]
+        latency = {label: stats(samples) for label, samples in self.latencies.items()}
+        latency["all"] = stats(all_latencies)
+
+        return {
+            "latency": latency,
+            "phases": {
+                state: {phase: stats(samples) for phase, samples in state_phases.items() if samples}
+                for state, state_phases in self.phases.items()
+            },
+        }
+
+    def report(self):
+        """Summary as printable lines."""
+        summary = self.summary()
+        lines = ["Input latency (ms, read to flip):"]
+        for label, stats in sorted(summary["latency"].items()):
+            lines.append(
+                f"  {label:<12} n={stats['count']:<6} p50 {stats['p50']:7.2f}   "
+                f"p95 {stats['p95']:7.2f}   p99 {stats['p99']:7.2f}"
+            )
+        lines.append("Frame phases by state (ms, p50 / p95):")
+        for state, state_phases in sorted(summary["phases"].items()):
+            parts = [f"{phase} {stats['p50']:.2f}/{stats['p95']:.2f}" for phase, stats in state_phases.items()]
+            lines.append(f"  {state:<14} " + "   ".join(parts))
+        return lines
+
+    def draw_overlay(self, surface, state_name):
+        """Draw the latest percentiles in the top-left corner."""
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_built >= OVERLAY_REFRESH:
+            self._overlay = self._build_overlay(state_name)
+            self._overlay_built = now
+        surface.blit(self._overlay, (8, 8))
+
+    def _build_overlay(self, state_name):
+        """Render the overlay text onto a translucent box."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        all_latencies = [value for samples in self.latencies.values() for value in samples]
+        lines = [
+            f"input->photon  p50 {percentile(all_latencies, 0.50):.1f}  "
+            f"p95 {percentile(all_latencies, 0.95):.1f}  "
+            f"p99 {percentile(all_latencies, 0.99):.1f} ms  (n={len(all_latencies)})"
+        ]
+        state_phases = self.phases.get(state_name, {})
+        lines.append(state_name + "  " + "  ".join(
+            f"{phase} {percentile(state_phases[phase], 0.50):.1f}"
+            for phase in PHASES if state_phases.get(phase)
+        ))
+
+        rendered = [self._font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(text.get_width() for text in rendered) + 12
+        height = sum(text.get_height() for text in rendered) + 10
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        y = 5
+        for text in rendered:
+            overlay.blit(text, (6, y))
+            y += text.get_height()
+        return overlay
+
+
+class NullProbe:
+    """The loop's probe while instrumentation is off; every call does nothing."""
+
+    def read_input(self):
+        pass
+
+    def input_handled(self):
+        pass
+
+    def begin_frame(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+    def end_frame(self, state_name):
+        pass
+
+    def draw_overlay(self, surface, state_name):
+        pass
+
+
+NULL_PROBE = NullProbe()
@@ -0,0 +1,296 @@
+"""
+core/profiler.py
+
+Built-in hierarchical frame profiler.
+Code wraps its stages in nestable scopes:
+
+    with profiler.scope("draw"):
+        ...
+
+Scopes nest into paths ("frame/draw/board"). Each frame's total per path
+feeds a rolling window that the overlay summarises (mean, p95, max and a
+bar of the recent frames), and every scope is also kept as a Chrome
+trace event so a run can be opened in chrome://tracing or Perfetto.
+
+The profiler is off unless SCOUNDREL_PROFILE is set. While off, scope()
+hands back one shared do-nothing context manager, so the scopes can stay
+in production builds. With it on, F3 toggles the overlay and F4 writes the
+trace (to SCOUNDREL_PROFILE_TRACE, or scoundrel_trace.json).
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+ENV_VAR = "SCOUNDREL_PROFILE"
+TRACE_ENV_VAR = "SCOUNDREL_PROFILE_TRACE"
+DEFAULT_TRACE_PATH = "scoundrel_trace.json"
+
+# Frames kept in each rolling window
+HISTORY_FRAMES = 240
+
+# Trace events kept for export; older ones are dropped
+TRACE_EVENT_LIMIT = 200000
+
+# How often the overlay is re-rendered, in seconds
+OVERLAY_REFRESH = 0.25
+
+OVERLAY_TOGGLE_KEY = pygame.K_F3
+TRACE_EXPORT_KEY = pygame.K_F4
+
+
+class _NullScope:
+    """Context manager that does nothing; shared by every disabled scope."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """A timed region of a frame."""
+
+    __slots__ = ("profiler", "name", "started")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._stack.append(self.name)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler._close(self.started, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """Scoped timers, rolling per-path histograms and a trace buffer."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.overlay_visible = False
+
+        self._stack = []
+        self._origin = time.perf_counter()
+
+        # path -> milliseconds spent in it during the current frame
+        self._frame_totals = {}
+
+        # path -> deque of per-frame milliseconds, in first-seen order
+        self.histograms = {}
+        self.frames = 0
+
+        self._trace = deque(maxlen=TRACE_EVENT_LIMIT)
+
+        self._overlay = None
+        self._overlay_built = 0.0
+        self._font = None
+
+    def configure_from_environment(self):
+        """Switch the profiler on when SCOUNDREL_PROFILE is set."""
+        self.enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+        return self.enabled
+
+    # ========================================================================
+    # Timing
+    # ========================================================================
+
+    def scope(self, name):
+        """
+        Time a region of code; use as a context manager.
+
+        Args:
+            name: Name of this stage; nested scopes form a path
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def _close(self, started, ended):
+        """Record the innermost open scope."""
+        path = "/".join(self._stack)
+        name = self._stack.pop()
+        duration = (ended - started) * 1000
+
+        self._frame_totals[path] = self._frame_totals.get(path, 0.0) + duration
+        self._trace.append((name, path, started, ended, len(self._stack)))
+
+    def end_frame(self):
+        """Push this frame's totals into the rolling windows."""
+        if not self.enabled:
+            return
+
+        self.frames += 1
+        totals = self._frame_totals
+        for path, samples in self.histograms.items():
+            samples.append(totals.pop(path, 0.0))
+        for path, duration in totals.items():
+            samples = self.histograms[path] = deque([0.0] * min(self.frames - 1, HISTORY_FRAMES), maxlen=HISTORY_FRAMES)
+            samples.append(duration)
+        totals.clear()
+
+    # ========================================================================
+    # Input
+    # ========================================================================
+
+    def handle_key(self, event):
+        """
+        Handle the profiler's hotkeys.
+
+        Returns:
+            True if the event was used by the profiler
+        """
+        if not self.enabled or event.type != pygame.KEYDOWN:
+            return False
+
+        if event.key == OVERLAY_TOGGLE_KEY:
+            self.overlay_visible = not self.overlay_visible
+            return True
+        if event.key == TRACE_EXPORT_KEY:
+            self.export_chrome_trace()
+            return True
+        return False
+
+    # ========================================================================
+    # Reporting
+    # ========================================================================
+
+    def stats(self):
+        """
+        Summary of every path's rolling window.
+
+        Returns:
+            {path: {"mean", "p95", "max"}} in milliseconds per frame, in
+            call-tree order
+        """
+        # Children directly under their parent, siblings in first-seen order
+        order = {path: index for index, path in enumerate(self.histograms)}
+
+        def tree_key(path):
+            parts = path.split("/")
+            return [order.get("/".join(parts[:depth + 1]), -1) for depth in range(len(parts))]
+
+        result = {}
+        for path in sorted(self.histograms, key=tree_key):
+            samples = self.histograms[path]
+            ordered = sorted(samples)
+            result[path] = {
+                "mean": sum(ordered) / len(ordered),
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+            }
+        return result
+
+    def chrome_trace(self):
+        """The recorded scopes as a Chrome trace-event document."""
+        events = []
+        for name, path, started, ended, depth in self._trace:
+            events.append({
+                "name": name,
+                "cat": path.split("/", 1)[0],
+                "ph": "X",
+                "ts": (started - self._origin) * 1e6,
+                "dur": (ended - started) * 1e6,
+                "pid": 1,
+                "tid": 1,
+                "args": {"path": path, "depth": depth},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path=None):
+        """
+        Write the trace to a JSON file.
+
+        Args:
+            path: Output file; defaults to SCOUNDREL_PROFILE_TRACE or
+                scoundrel_trace.json in the working directory
+
+        Returns:
+            The path written
+        """
+        path = path or os.environ.get(TRACE_ENV_VAR) or DEFAULT_TRACE_PATH
+        with open(path, "w") as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+        return path
+
+    def draw_overlay(self, surface):
+        """Draw the profiler overlay in the top-right corner if it is shown."""
+        if not (self.enabled and self.overlay_visible):
+            return
+
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_built >= OVERLAY_REFRESH:
+            self._overlay = self._build_overlay()
+            self._overlay_built = now
+        surface.blit(self._overlay, (surface.get_width() - self._overlay.get_width() - 8, 8))
+
+    def _build_overlay(self):
+        """Render the per-path table with a bar of recent frames for each row."""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+
+        stats = self.stats()
+        row_height = self._font.get_linesize()
+        bar_width = 120
+        bar_frames = 60
+
+        colour = (230, 230, 230)
+        rows = []
+        for path, values in stats.items():
+            label = "  " * path.count("/") + path.rsplit("/", 1)[-1]
+            numbers = [self._font.render(f"{values[key]:.2f}", True, colour) for key in ("mean", "p95", "max")]
+            rows.append((self._font.render(label, True, colour), numbers, path))
+
+        header = self._font.render("scope", True, (255, 220, 120))
+        headings = [self._font.render(key, True, (255, 220, 120)) for key in ("mean", "p95", "max")]
+
+        label_width = max([header.get_width()] + [label.get_width() for label, _, _ in rows]) + 12
+        number_width = 48
+        width = label_width + number_width * 3 + bar_width + 18
+        height = row_height * (len(rows) + 1) + 10
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        def blit_row(label, numbers, y):
+            overlay.blit(label, (6, y))
+            for column, number in enumerate(numbers):
+                right = 6 + label_width + number_width * (column + 1)
+                overlay.blit(number, (right - number.get_width(), y))
+
+        blit_row(header, headings, 5)
+
+        # Bars are scaled against a 60 fps frame
+        frame_budget = 1000 / 60
+        y = 5 + row_height
+        for label, numbers, path in rows:
+            blit_row(label, numbers, y)
+
+            recent = list(self.histograms[path])[-bar_frames:]
+            x = width - bar_width - 6
+            step = bar_width / bar_frames
+            for index, duration in enumerate(recent):
+                bar_height = min(row_height - 2, int((row_height - 2) * duration / frame_budget))
+                if bar_height > 0:
+                    bar_colour = (90, 200, 90) if duration < frame_budget / 2 else (220, 90, 60)
+                    pygame.draw.rect(overlay, bar_colour, (x + index * step, y + row_height - 1 - bar_height, max(1, step), bar_height))
+            y += row_height
+
+        return overlay
+
+
+# The game's single profiler
+profiler = Profiler()
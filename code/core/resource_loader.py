@@ -1,39 +1,223 @@
 """
 Resource loading and caching system
+
+Images live in a byte-budgeted LRU cache (see core/surface_cache.py) and are
+converted to the display's pixel format as they are loaded, so blits never
+pay for a per-pixel format conversion. Scaled, rotated and premultiplied
+copies of a surface are cached alongside, keyed by their transform.
 """
 
+import os
+
 import pygame
-from config import relative_to_assets, CARD_WIDTH, CARD_HEIGHT
+from config import (
+    relative_to_assets,
+    ASSETS_PATH,
+    ASSET_ARCHIVE_PATH,
+    CARD_WIDTH,
+    CARD_HEIGHT,
+    IMAGE_CACHE_BUDGET
+)
+from core.asset_archive import AssetArchive, variant_key
+from core.surface_cache import SurfaceCache
 
 
 class ResourceLoader:
     """Class for loading and caching game resources."""
 
-    _image_cache = {}
+    _image_cache = SurfaceCache(IMAGE_CACHE_BUDGET)
     _font_cache = {}
 
+    # Packed archive of pre-decoded images, opened on first use
+    _archive = None
+    _archive_checked = False
+    _assets_root = os.path.normpath(str(ASSETS_PATH))
+
     @classmethod
     def load_image(cls, name, scale=1, cache=True):
         """Load an image with optional scaling and caching."""
         cache_key = f"{name}_{scale}"
-        if cache and cache_key in cls._image_cache:
-            return cls._image_cache[cache_key]
+        image = cls._image_cache.get(cache_key)
+        if image is not None:
+            return image
 
         try:
-            image = pygame.image.load(relative_to_assets(name))
+            image = cls._load_surface(name)
 
             if scale != 1:
                 new_size = (int(image.get_width() * scale), int(image.get_height() * scale))
                 image = pygame.transform.scale(image, new_size)
 
             if cache:
-                cls._image_cache[cache_key] = image
+                cls._image_cache.put(cache_key, image)
 
             return image
         except pygame.error as e:
             # Return a placeholder surface if loading fails
             return pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
 
+    @classmethod
+    def load_scaled(cls, name, size, cache=True):
+        """
+        Load an image at an exact size.
+        Uses the archive's pre-scaled copy when there is one, otherwise loads
+        and scales the image.
+
+        Args:
+            name: Asset path relative to assets/
+            size: (width, height) to return
+            cache: Whether to keep the result in the cache (an already cached
+                copy, e.g. from the preloader, is used either way)
+
+        Returns:
+            A Surface of the requested size
+        """
+        size = (int(size[0]), int(size[1]))
+        cache_key = cls._cache_key(name, size)
+        image = cls._image_cache.get(cache_key)
+        if image is not None:
+            return image
+
+        image = cls._load_surface(name, size)
+        if image is None:
+            # Only the scaled copy is worth keeping
+            image = cls.load_image(name, cache=False)
+            if image.get_size() != size:
+                image = pygame.transform.scale(image, size)
+
+        if cache:
+            cls._image_cache.put(cache_key, image)
+
+        return image
+
+    @classmethod
+    def load_variant(cls, source_key, source, size=None, angle=0, premultiplied=False):
+        """
+        Get a transformed copy of a surface, cached by its transform.
+
+        Args:
+            source_key: Stable, hashable identity of the source surface
+                (e.g. an asset name, or a card's face key)
+            source: The source Surface
+            size: Optional (width, height) to scale to
+            angle: Optional rotation in degrees, counter-clockwise
+            premultiplied: Premultiply alpha, for BLEND_PREMULTIPLIED blits
+
+        Returns:
+            The transformed Surface (the source itself if nothing applies)
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+            if size == source.get_size():
+                size = None
+        if not (size or angle or premultiplied):
+            return source
+
+        cache_key = ("variant", source_key, size, angle, premultiplied)
+        image = cls._image_cache.get(cache_key)
+        if image is not None:
+            return image
+
+        image = source
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        if angle:
+            image = pygame.transform.rotate(image, angle)
+        if premultiplied:
+            image = image.premul_alpha()
+
+        cls._image_cache.put(cache_key, image)
+        return image
+
+    @classmethod
+    def is_cached(cls, name, size=None):
+        """Check whether an image is already cached, at its file size or at `size`."""
+        return cls._cache_key(name, size) in cls._image_cache
+
+    @classmethod
+    def in_archive(cls, name, size=None):
+        """Check whether the packed archive holds an up-to-date image (at `size`, if given)."""
+        archive = cls.get_archive()
+        if archive is None:
+            return False
+        key = cls._asset_key(name)
+        return variant_key(key, size) in archive and archive.is_fresh(key)
+
+    @classmethod
+    def decode(cls, name, size=None):
+        """
+        Decode and scale a loose image file without touching the cache or
+        the display, so it is safe to call from a worker thread.
+
+        Args:
+            name: Asset path relative to assets/
+            size: Optional (width, height) to scale to
+
+        Returns:
+            An unconverted Surface
+        """
+        image = pygame.image.load(relative_to_assets(name))
+        if size is not None and image.get_size() != tuple(size):
+            image = pygame.transform.scale(image, size)
+        return image
+
+    @classmethod
+    def store(cls, name, image, size=None):
+        """Put an image loaded elsewhere into the cache, as load_image/load_scaled would."""
+        cls._image_cache.put(cls._cache_key(name, size), image)
+
+    @staticmethod
+    def to_display_format(image):
+        """
+        Convert a surface to the display's pixel format, keeping per-pixel
+        alpha if it has any. Returns it unchanged before a display exists.
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+
+    @staticmethod
+    def _cache_key(name, size=None):
+        """Cache key for an image at its file size (scale 1) or at an exact size."""
+        if size is None:
+            return f"{name}_1"
+        return f"{name}_{int(size[0])}x{int(size[1])}"
+
+    @classmethod
+    def _load_surface(cls, name, size=None):
+        """
+        Get a surface from the archive, falling back to decoding the PNG.
+        Pre-scaled sizes only come from the archive; returns None if absent.
+        Archive surfaces are already in the display format.
+        """
+        archive = cls.get_archive()
+        if archive is not None:
+            image = archive.load(cls._asset_key(name), size)
+            if image is not None:
+                return image
+
+        if size is not None:
+            return None
+        return cls.to_display_format(pygame.image.load(relative_to_assets(name)))
+
+    @classmethod
+    def _asset_key(cls, name):
+        """Archive key for a name given relative to assets/ or as a full path."""
+        path = os.path.normpath(str(name))
+        if os.path.isabs(path) and path.startswith(cls._assets_root + os.sep):
+            path = path[len(cls._assets_root) + 1:]
+        return path.replace(os.sep, "/")
+
+    @classmethod
+    def get_archive(cls):
+        """The packed asset archive, or None when the game runs from loose files."""
+        if not cls._archive_checked:
+            cls._archive_checked = True
+            cls._archive = AssetArchive.open(ASSET_ARCHIVE_PATH)
+        return cls._archive
+
     @classmethod
     def load_font(cls, name, size):
         """Load a font with caching."""
@@ -48,8 +232,13 @@ class ResourceLoader:
         except pygame.error as e:
             return pygame.font.SysFont(None, size)
 
+    @classmethod
+    def cache_stats(cls):
+        """Image cache counters: entries, bytes used and budget, hits, misses, evictions."""
+        return cls._image_cache.stats()
+
     @classmethod
     def clear_cache(cls):
         """Clear all cached resources."""
         cls._image_cache.clear()
-        cls._font_cache.clear()
\ No newline at end of file
+        cls._font_cache.clear()
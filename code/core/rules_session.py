@@ -0,0 +1,391 @@
+"""
+core/rules_session.py
+
+Rules-only model of a run for solvers, hint systems and bots.
+Cards are plain (suit, value) tuples and the whole state is one immutable
+RulesState, so forking a position is a single object copy and every action
+returns a new state that shares everything it did not change:
+
+- the deck is one tuple plus a "top" index, so drawing never copies it
+- the discard pile is a linked list of (card, rest) pairs, so discarding
+  never copies it
+
+RulesSession wraps a state with undo/redo history. Pygame-free.
+"""
+
+from collections import namedtuple
+
+from config import SUITS
+from entities.card_model import card_type_for_suit
+
+ROOM_SIZE = 4
+MAX_INVENTORY_SIZE = 2
+
+# Action kinds. Actions are (kind, index) tuples; index is None where unused.
+FIGHT = "fight"              # Fight a room monster bare-handed
+FIGHT_WITH_WEAPON = "weapon" # Fight a room monster with the equipped weapon
+EQUIP = "equip"              # Equip a room weapon
+DRINK = "drink"              # Drink a room potion
+STASH = "stash"              # Move a room weapon/potion to the inventory
+USE = "use"                  # Use an inventory card
+DROP = "drop"                # Discard an inventory card
+DROP_WEAPON = "drop_weapon"  # Discard the equipped weapon and its stack
+RUN = "run"                  # Put the room under the deck and draw a new one
+
+
+RulesState = namedtuple("RulesState", (
+    "life",
+    "max_life",
+    "deck",
+    "deck_top",
+    "room",
+    "inventory",
+    "weapon",
+    "stack",
+    "discard",
+    "discard_count",
+    "ran_last_turn",
+    "completed_rooms",
+))
+RulesState.__doc__ = "Immutable rules-level snapshot of a floor in progress."
+
+_make_state = RulesState._make
+
+_ROOM_ACTIONS = frozenset((FIGHT, FIGHT_WITH_WEAPON, EQUIP, DRINK, STASH))
+_SUIT_TYPES = {suit: card_type_for_suit(suit) for suit in SUITS}
+
+
+# ============================================================================
+# State Helpers
+# ============================================================================
+
+def card_type(card):
+    """Type of a (suit, value) card."""
+    return _SUIT_TYPES.get(card[0], "unknown")
+
+
+def deck_remaining(state):
+    """Number of cards left in the deck."""
+    return len(state.deck) - state.deck_top
+
+
+def discard_cards(state):
+    """Iterate the discard pile, newest card first."""
+    node = state.discard
+    while node is not None:
+        yield node[0]
+        node = node[1]
+
+
+def _push(discard, discard_count, cards):
+    """Push cards onto a discard list, returning the new (discard, count)."""
+    for card in cards:
+        discard = (card, discard)
+    return discard, discard_count + len(cards)
+
+
+def _draw_room(state, count):
+    """Draw up to `count` cards from the top of the deck into the room."""
+    top = state.deck_top
+    drawn = state.deck[top:top + count]
+    return state._replace(room=state.room + drawn, deck_top=top + len(drawn))
+
+
+def can_use_weapon_on(state, monster):
+    """Whether the equipped weapon can fight a monster (stack rule)."""
+    if state.weapon is None:
+        return False
+    return not state.stack or monster[1] < state.stack[-1][1]
+
+
+def can_run(state):
+    """Whether the player may run from the current room."""
+    return len(state.room) == ROOM_SIZE and not state.ran_last_turn
+
+
+def is_dead(state):
+    return state.life <= 0
+
+
+def is_floor_complete(state):
+    return not state.room and deck_remaining(state) == 0
+
+
+# ============================================================================
+# Transitions
+# ============================================================================
+
+def legal_actions(state):
+    """
+    List every action available in a state.
+
+    Args:
+        state: RulesState
+
+    Returns:
+        List of (kind, index) action tuples
+    """
+    if is_dead(state) or is_floor_complete(state):
+        return []
+
+    actions = []
+    inventory_full = len(state.inventory) >= MAX_INVENTORY_SIZE
+
+    for index, card in enumerate(state.room):
+        kind = card_type(card)
+        if kind == "monster":
+            actions.append((FIGHT, index))
+            if can_use_weapon_on(state, card):
+                actions.append((FIGHT_WITH_WEAPON, index))
+        elif kind == "weapon":
+            actions.append((EQUIP, index))
+            if not inventory_full:
+                actions.append((STASH, index))
+        elif kind == "potion":
+            actions.append((DRINK, index))
+            if not inventory_full:
+                actions.append((STASH, index))
+
+    for index in range(len(state.inventory)):
+        actions.append((USE, index))
+        actions.append((DROP, index))
+
+    if state.weapon is not None:
+        actions.append((DROP_WEAPON, None))
+
+    if can_run(state):
+        actions.append((RUN, None))
+
+    return actions
+
+
+def apply_action(state, action):
+    """
+    Apply an action to a state.
+
+    Args:
+        state: RulesState
+        action: (kind, index) tuple from legal_actions
+
+    Returns:
+        The new RulesState
+
+    Raises:
+        ValueError: If the action is not legal in this state
+    """
+    # Unpack once and build the result once; _replace is slow in a hot loop
+    (life, max_life, deck, deck_top, room, inventory, weapon, stack,
+     discard, discard_count, ran_last_turn, completed_rooms) = state
+    kind, index = action
+
+    if kind in _ROOM_ACTIONS:
+        card = room[index]
+        card_kind = _SUIT_TYPES.get(card[0])
+        room = room[:index] + room[index + 1:]
+        ran_last_turn = False
+
+        if kind == FIGHT and card_kind == "monster":
+            life = max(0, life - card[1])
+            discard, discard_count = _push(discard, discard_count, (card,))
+
+        elif kind == FIGHT_WITH_WEAPON and card_kind == "monster" and can_use_weapon_on(state, card):
+            life = max(0, life - max(0, card[1] - weapon[1]))
+            stack = stack + (card,)
+
+        elif kind == EQUIP and card_kind == "weapon":
+            discard, discard_count = _push(discard, discard_count, stack + ((weapon,) if weapon else ()))
+            weapon, stack = card, ()
+
+        elif kind == DRINK and card_kind == "potion":
+            life = min(life + card[1], max_life)
+            discard, discard_count = _push(discard, discard_count, (card,))
+
+        elif kind == STASH and card_kind in ("weapon", "potion") and len(inventory) < MAX_INVENTORY_SIZE:
+            inventory = inventory + (card,)
+
+        else:
+            raise ValueError(f"Illegal action {action}")
+
+        # Complete the room and deal the next one once it is down to its last card
+        if len(room) <= 1:
+            remaining = len(deck) - deck_top
+            if not room or remaining:
+                completed_rooms += 1
+                drawn = deck[deck_top:deck_top + ROOM_SIZE - len(room)]
+                room = room + drawn
+                deck_top += len(drawn)
+
+    elif kind == USE or kind == DROP:
+        card = inventory[index]
+        inventory = inventory[:index] + inventory[index + 1:]
+
+        if kind == USE and _SUIT_TYPES.get(card[0]) == "weapon":
+            discard, discard_count = _push(discard, discard_count, stack + ((weapon,) if weapon else ()))
+            weapon, stack = card, ()
+        else:
+            if kind == USE and _SUIT_TYPES.get(card[0]) == "potion":
+                life = min(life + card[1], max_life)
+            discard, discard_count = _push(discard, discard_count, (card,))
+
+    elif kind == DROP_WEAPON and weapon is not None:
+        discard, discard_count = _push(discard, discard_count, stack + (weapon,))
+        weapon, stack = None, ()
+
+    elif kind == RUN and can_run(state):
+        deck = deck[deck_top:] + room
+        room = deck[:ROOM_SIZE]
+        deck_top = len(room)
+        ran_last_turn = True
+
+    else:
+        raise ValueError(f"Illegal action {action}")
+
+    return _make_state((life, max_life, deck, deck_top, room, inventory, weapon, stack,
+                        discard, discard_count, ran_last_turn, completed_rooms))
+
+
+# ============================================================================
+# Session
+# ============================================================================
+
+class RulesSession:
+    """
+    A RulesState with undo/redo history.
+    Forking is O(1): the fork shares the current state and starts a fresh history.
+    """
+
+    __slots__ = ("state", "_undo", "_redo")
+
+    def __init__(self, state):
+        """
+        Create a rules session.
+
+        Args:
+            state: Starting RulesState
+        """
+        self.state = state
+        self._undo = []
+        self._redo = []
+
+    @classmethod
+    def new_floor(cls, deck_cards, life=20, max_life=20):
+        """
+        Start a floor from a list of (suit, value) cards in draw order.
+
+        Args:
+            deck_cards: Cards in draw order
+            life: Starting life points
+            max_life: Maximum life points
+        """
+        state = RulesState(
+            life=life,
+            max_life=max_life,
+            deck=tuple(deck_cards),
+            deck_top=0,
+            room=(),
+            inventory=(),
+            weapon=None,
+            stack=(),
+            discard=None,
+            discard_count=0,
+            ran_last_turn=False,
+            completed_rooms=0,
+        )
+        return cls(_draw_room(state, ROOM_SIZE))
+
+    @classmethod
+    def from_session(cls, session):
+        """
+        Capture a live GameSession as a rules session.
+
+        Args:
+            session: GameSession to capture
+        """
+        def cards(container):
+            return tuple((card.suit, card.value) for card in container)
+
+        discard = None
+        for model in session.discard_pile.models:
+            discard = ((model.suit, model.value), discard)
+
+        weapon = session.equipped_weapon
+        state = RulesState(
+            life=session.life_points,
+            max_life=session.max_life,
+            deck=tuple((card["suit"], card["value"]) for card in session.deck.cards),
+            deck_top=0,
+            room=cards(session.room.cards),
+            inventory=cards(session.inventory),
+            weapon=(weapon.suit, weapon.value) if weapon else None,
+            stack=cards(session.defeated_monsters),
+            discard=discard,
+            discard_count=len(session.discard_pile.models),
+            ran_last_turn=session.ran_last_turn,
+            completed_rooms=session.completed_rooms,
+        )
+        return cls(state)
+
+    def fork(self):
+        """Branch off a new session at the current state, with no history."""
+        return RulesSession(self.state)
+
+    def clone(self):
+        """Copy this session including its undo/redo history."""
+        clone = RulesSession(self.state)
+        clone._undo = self._undo.copy()
+        clone._redo = self._redo.copy()
+        return clone
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+
+    def legal_actions(self):
+        return legal_actions(self.state)
+
+    @property
+    def is_over(self):
+        """Whether the floor has ended, by death or by clearing it."""
+        return is_dead(self.state) or is_floor_complete(self.state)
+
+    # ========================================================================
+    # Actions and History
+    # ========================================================================
+
+    def apply(self, action):
+        """
+        Apply an action, recording the previous state for undo.
+
+        Args:
+            action: (kind, index) tuple from legal_actions
+
+        Returns:
+            The new RulesState
+        """
+        new_state = apply_action(self.state, action)
+        self._undo.append(self.state)
+        self._redo.clear()
+        self.state = new_state
+        return new_state
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """Step back one action. Returns False if there is nothing to undo."""
+        if not self._undo:
+            return False
+        self._redo.append(self.state)
+        self.state = self._undo.pop()
+        return True
+
+    def redo(self):
+        """Re-apply an undone action. Returns False if there is nothing to redo."""
+        if not self._redo:
+            return False
+        self._undo.append(self.state)
+        self.state = self._redo.pop()
+        return True
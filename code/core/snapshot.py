@@ -0,0 +1,305 @@
+"""
+core/snapshot.py
+
+Compact, versioned binary snapshots of a run.
+Captures the whole GameSession (deck, room, inventory, weapon stack, discard
+pile and counters) plus the FloorManager's floor list and position. Cards are
+packed into two bytes: suit/value in one, chosen artwork in the other.
+
+Pure Python and pygame-free, so it can run off the main thread and in tools.
+"""
+
+import struct
+
+from config import (
+    SUITS,
+    MONSTER_RANKS,
+    MONSTER_DIFFICULTY_MAP,
+    WEAPON_RANKS,
+    WEAPON_RANK_MAP
+)
+from entities.card_model import CardModel, card_type_for_suit
+
+SNAPSHOT_MAGIC = b"SCDL"
+SNAPSHOT_VERSION = 1
+
+NO_ART = 0xFF
+
+_HEADER = struct.Struct("<4sH")
+_SESSION = struct.Struct("<hhHB")
+_FLOOR_POSITION = struct.Struct("<HH")
+
+_FLAG_RAN_LAST_TURN = 1
+_FLAG_ROOM_COMPLETE = 2
+_FLAG_FLOOR_COMPLETE = 4
+_FLAG_ENDLESS = 8
+
+_SUIT_CODES = {suit: code for code, suit in enumerate(SUITS)}
+
+
+class SnapshotError(ValueError):
+    """Raised when snapshot bytes cannot be decoded."""
+
+
+class Snapshot:
+    """Decoded contents of a snapshot, ready to be restored."""
+
+    __slots__ = (
+        "life_points",
+        "max_life",
+        "completed_rooms",
+        "ran_last_turn",
+        "current_room_complete",
+        "floor_complete",
+        "current_floor",
+        "deck",
+        "known_count",
+        "room",
+        "inventory",
+        "equipped_weapon",
+        "defeated_monsters",
+        "discard_pile",
+        "floors",
+        "floor_index",
+        "current_room",
+        "endless",
+    )
+
+
+# ============================================================================
+# Card Encoding
+# ============================================================================
+
+def _art_table(suit, value):
+    """The list a card's art index points into, or None for index-valued art."""
+    card_type = card_type_for_suit(suit)
+    if card_type == "monster" and value in MONSTER_RANKS:
+        return MONSTER_DIFFICULTY_MAP[MONSTER_RANKS[value]]
+    if card_type == "weapon" and value in WEAPON_RANKS:
+        return WEAPON_RANK_MAP[WEAPON_RANKS[value]]
+    return None
+
+
+def _pack_suit_value(suit, value):
+    """Pack a suit and value into one byte."""
+    return (_SUIT_CODES[suit] << 4) | value
+
+
+def _unpack_suit_value(byte):
+    """Unpack a suit and value from one byte."""
+    return SUITS[byte >> 4], byte & 0x0F
+
+
+def encode_card(model):
+    """
+    Encode a card model as two bytes.
+
+    Args:
+        model: CardModel to encode
+
+    Returns:
+        bytes of length 2
+    """
+    art = model.art_key
+    if art is None:
+        art_index = NO_ART
+    else:
+        table = _art_table(model.suit, model.value)
+        art_index = table.index(art) if table is not None else art
+
+    return bytes((_pack_suit_value(model.suit, model.value), art_index))
+
+
+def decode_card(data, offset, floor_type):
+    """
+    Decode a two-byte card.
+
+    Args:
+        data: Snapshot bytes
+        offset: Position of the card in data
+        floor_type: Floor to attach to the card
+
+    Returns:
+        A new CardModel
+    """
+    suit, value = _unpack_suit_value(data[offset])
+    art_index = data[offset + 1]
+
+    art = None
+    if art_index != NO_ART:
+        table = _art_table(suit, value)
+        art = table[art_index] if table is not None else art_index
+
+    return CardModel(suit, value, floor_type, art=art)
+
+
+# ============================================================================
+# Encoder
+# ============================================================================
+
+def _encode_string(text):
+    """Length-prefixed UTF-8 string."""
+    raw = text.encode("utf-8")
+    return bytes((len(raw),)) + raw
+
+
+def _encode_cards(cards):
+    """Count-prefixed list of two-byte cards."""
+    return _encode_models([card.model for card in cards])
+
+
+def _encode_models(models):
+    """Count-prefixed list of two-byte card models."""
+    return bytes((len(models),)) + b"".join(encode_card(model) for model in models)
+
+
+def encode_snapshot(session, floor_manager):
+    """
+    Encode a session and floor manager into snapshot bytes.
+
+    Args:
+        session: GameSession to capture
+        floor_manager: FloorManager to capture
+
+    Returns:
+        Snapshot bytes
+    """
+    flags = 0
+    if session.ran_last_turn:
+        flags |= _FLAG_RAN_LAST_TURN
+    if session.current_room_complete:
+        flags |= _FLAG_ROOM_COMPLETE
+    if session.floor_complete:
+        flags |= _FLAG_FLOOR_COMPLETE
+    if floor_manager.endless:
+        flags |= _FLAG_ENDLESS
+
+    deck = session.deck
+    weapon = [session.equipped_weapon] if session.equipped_weapon else []
+
+    parts = [
+        _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION),
+        _SESSION.pack(session.life_points, session.max_life, session.completed_rooms, flags),
+        _encode_string(session.current_floor),
+        bytes((len(deck.cards), len(deck.known_composition))),
+        bytes(_pack_suit_value(card["suit"], card["value"]) for card in deck.cards),
+        _encode_cards(session.room.cards),
+        _encode_cards(session.inventory),
+        _encode_cards(weapon),
+        _encode_cards(session.defeated_monsters),
+        _encode_models(session.discard_pile.models),
+        bytes((len(floor_manager.floors),)),
+        b"".join(_encode_string(floor) for floor in floor_manager.floors),
+        # An endless run can outlast the field; past that it resumes on the last floor it can hold
+        _FLOOR_POSITION.pack(min(floor_manager.current_floor_index, 0xFFFF), floor_manager.current_room),
+    ]
+    return b"".join(parts)
+
+
+# ============================================================================
+# Decoder
+# ============================================================================
+
+class _Reader:
+    """Cursor over snapshot bytes."""
+
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.offset = offset
+
+    def take(self, size):
+        """Consume `size` bytes and return their start offset."""
+        start = self.offset
+        self.offset += size
+        if self.offset > len(self.data):
+            raise SnapshotError("Snapshot is truncated")
+        return start
+
+    def unpack(self, fmt):
+        """Consume and unpack a struct."""
+        return fmt.unpack_from(self.data, self.take(fmt.size))
+
+    def byte(self):
+        return self.data[self.take(1)]
+
+    def string(self):
+        length = self.byte()
+        start = self.take(length)
+        return self.data[start:start + length].decode("utf-8")
+
+    def cards(self, floor_type):
+        count = self.byte()
+        start = self.take(count * 2)
+        return [decode_card(self.data, start + i * 2, floor_type) for i in range(count)]
+
+
+def _decode_v1(reader):
+    """Decode the body of a version 1 snapshot."""
+    snapshot = Snapshot()
+
+    life_points, max_life, completed_rooms, flags = reader.unpack(_SESSION)
+    snapshot.life_points = life_points
+    snapshot.max_life = max_life
+    snapshot.completed_rooms = completed_rooms
+    snapshot.ran_last_turn = bool(flags & _FLAG_RAN_LAST_TURN)
+    snapshot.current_room_complete = bool(flags & _FLAG_ROOM_COMPLETE)
+    snapshot.floor_complete = bool(flags & _FLAG_FLOOR_COMPLETE)
+    snapshot.endless = bool(flags & _FLAG_ENDLESS)
+
+    floor_type = reader.string()
+    snapshot.current_floor = floor_type
+
+    deck_count = reader.byte()
+    snapshot.known_count = reader.byte()
+    start = reader.take(deck_count)
+    snapshot.deck = []
+    for byte in reader.data[start:start + deck_count]:
+        suit, value = _unpack_suit_value(byte)
+        snapshot.deck.append({"suit": suit, "value": value, "floor_type": floor_type})
+
+    snapshot.room = reader.cards(floor_type)
+    snapshot.inventory = reader.cards(floor_type)
+    weapon = reader.cards(floor_type)
+    snapshot.equipped_weapon = weapon[0] if weapon else None
+    snapshot.defeated_monsters = reader.cards(floor_type)
+    snapshot.discard_pile = reader.cards(floor_type)
+
+    snapshot.floors = [reader.string() for _ in range(reader.byte())]
+    snapshot.floor_index, snapshot.current_room = reader.unpack(_FLOOR_POSITION)
+
+    return snapshot
+
+
+_DECODERS = {
+    1: _decode_v1,
+}
+
+
+def decode_snapshot(data):
+    """
+    Decode snapshot bytes.
+
+    Args:
+        data: Bytes produced by encode_snapshot
+
+    Returns:
+        A Snapshot
+
+    Raises:
+        SnapshotError: If the data is not a snapshot, is from an unknown
+            version, or is truncated
+    """
+    reader = _Reader(data)
+    magic, version = reader.unpack(_HEADER)
+
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a Scoundrel snapshot")
+
+    decoder = _DECODERS.get(version)
+    if decoder is None:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+
+    try:
+        return decoder(reader)
+    except (IndexError, KeyError, UnicodeDecodeError) as error:
+        raise SnapshotError(f"Corrupt snapshot: {error}") from error
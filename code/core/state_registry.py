@@ -0,0 +1,119 @@
+"""
+core/state_registry.py
+
+Lazy registry of game states.
+States are registered by module and class name and are only imported and
+constructed the first time they are looked up, so startup pays for the
+title screen alone rather than for every state's UI, animation and
+rendering modules. warm_up() builds states ahead of time through the asset
+preloader: the module import runs on a worker thread and construction on
+the main thread.
+"""
+
+import importlib
+
+from core.asset_preloader import PRIORITY_LOW
+
+
+class StateRegistry:
+    """Name -> GameState mapping that builds each state on first use."""
+
+    def __init__(self, game_manager):
+        """
+        Create an empty registry.
+
+        Args:
+            game_manager: GameManager passed to every state constructor
+        """
+        self.game_manager = game_manager
+        self._specs = {}
+        self._states = {}
+
+    def register(self, name, module_name, class_name, **kwargs):
+        """
+        Register a state without importing it.
+
+        Args:
+            name: State name used with change_state
+            module_name: Module defining the state, e.g. "states.title_state"
+            class_name: GameState subclass in that module
+            **kwargs: Extra constructor arguments
+        """
+        self._specs[name] = (module_name, class_name, kwargs)
+
+    # ========================================================================
+    # Lookup
+    # ========================================================================
+
+    def __getitem__(self, name):
+        state = self._states.get(name)
+        if state is None:
+            state = self._build(name)
+        return state
+
+    def get(self, name, default=None):
+        if name not in self._specs:
+            return default
+        return self[name]
+
+    def __contains__(self, name):
+        return name in self._specs
+
+    def __iter__(self):
+        return iter(self._specs)
+
+    def __len__(self):
+        return len(self._specs)
+
+    def is_loaded(self, name):
+        """Check whether a state has been constructed yet."""
+        return name in self._states
+
+    def name_of(self, state):
+        """The registered name of a constructed state, or None."""
+        for name, loaded in self._states.items():
+            if loaded is state:
+                return name
+        return None
+
+    def reset(self, name):
+        """Drop a constructed state so the next lookup builds a fresh one."""
+        self._states.pop(name, None)
+
+    # ========================================================================
+    # Construction
+    # ========================================================================
+
+    def warm_up(self, *names):
+        """
+        Import and construct states in the background before they are needed.
+        States that are already built, or get built meanwhile, are skipped.
+
+        Args:
+            *names: State names to warm up
+        """
+        preloader = self.game_manager.preloader
+
+        for name in names:
+            if name in self._states:
+                continue
+            module_name = self._specs[name][0]
+            preloader.add_task(
+                lambda module, name=name: self._build(name, module),
+                decode=lambda module_name=module_name: importlib.import_module(module_name),
+                priority=PRIORITY_LOW
+            )
+
+    def _build(self, name, module=None):
+        """Import (unless given) and construct a state, once."""
+        state = self._states.get(name)
+        if state is not None:
+            return state
+
+        module_name, class_name, kwargs = self._specs[name]
+        if module is None:
+            module = importlib.import_module(module_name)
+
+        state = getattr(module, class_name)(self.game_manager, **kwargs)
+        self._states[name] = state
+        return state
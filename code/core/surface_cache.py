@@ -0,0 +1,114 @@
+"""
+core/surface_cache.py
+
+Least-recently-used surface cache with a memory budget.
+Every entry is charged its pixel bytes (pitch x height); when the total goes
+over budget the least recently used surfaces are dropped. Anything still
+holding a dropped surface keeps it alive, so eviction only ever costs a
+reload later. Hits, misses and evictions are counted for tuning the budget.
+
+A surface that has been in any SurfaceCache is shared, so it is never drawn
+on again; is_shared() tells other caches (such as the display's scaled
+copies) that what they derive from one stays valid.
+"""
+
+import weakref
+from collections import OrderedDict
+
+
+def surface_bytes(surface):
+    """Bytes of pixel memory a surface holds."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceCache:
+    """Byte-budgeted LRU mapping of keys to surfaces."""
+
+    # Every surface put in any cache, for as long as it is alive
+    _shared = weakref.WeakSet()
+
+    def __init__(self, budget_bytes):
+        """
+        Create an empty cache.
+
+        Args:
+            budget_bytes: Pixel memory to keep before evicting
+        """
+        self.budget_bytes = budget_bytes
+        self.bytes_used = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # key -> (surface, bytes), oldest first
+        self._entries = OrderedDict()
+
+    def __contains__(self, key):
+        """Membership test; does not count as a use."""
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Look up a surface and mark it as recently used.
+
+        Returns:
+            The cached surface, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface):
+        """
+        Add or replace a surface, then evict down to the budget.
+        The surface just added is never evicted by its own insertion.
+        """
+        self.discard(key)
+
+        size = surface_bytes(surface)
+        self._entries[key] = (surface, size)
+        SurfaceCache._shared.add(surface)
+        self.bytes_used += size
+
+        while self.bytes_used > self.budget_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted_size
+            self.evictions += 1
+
+    @classmethod
+    def is_shared(cls, surface):
+        """Whether a surface has been handed out by a SurfaceCache, and so never changes."""
+        return surface in cls._shared
+
+    def discard(self, key):
+        """Remove a surface if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes_used -= entry[1]
+
+    def clear(self):
+        """Drop every surface. Counters are kept."""
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        """Snapshot of the cache's counters and memory use."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes_used": self.bytes_used,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
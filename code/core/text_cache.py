@@ -0,0 +1,142 @@
+"""
+core/text_cache.py
+
+Shared cache of rendered text.
+UI code calls TextCache.render(font, text, antialias, colour) where it would
+call font.render(...). Rendered strings are kept in a byte-budgeted LRU keyed
+by (font, text, antialias, colour, background), so static labels are
+rasterised once instead of every frame.
+
+Short numeric strings (health, deck counts, timers, damage numbers) change
+often, so instead of rasterising each new value they are assembled from a
+per-font glyph atlas: each digit is rendered once and values are built by
+blitting glyphs side by side.
+
+Returned surfaces are shared: copy one before changing its alpha or drawing
+onto it.
+"""
+
+import pygame
+
+from config import TEXT_CACHE_BUDGET
+from core.surface_cache import SurfaceCache
+
+# Characters the glyph atlas covers, and the longest string it assembles
+ATLAS_CHARACTERS = frozenset("0123456789/+-:. ")
+ATLAS_MAX_LENGTH = 8
+
+
+class TextCache:
+    """Class-level cache of rendered strings and glyph atlases."""
+
+    _cache = SurfaceCache(TEXT_CACHE_BUDGET)
+
+    # (font, antialias, colour) -> {character: (glyph surface, advance)}
+    _atlases = {}
+
+    @classmethod
+    def render(cls, font, text, antialias, colour, background=None):
+        """
+        Render text, reusing an earlier rendering when there is one.
+        Same arguments as pygame.font.Font.render.
+
+        Returns:
+            A shared Surface; copy it before modifying
+        """
+        if type(colour) is not tuple:
+            colour = tuple(colour)
+        if background is not None and type(background) is not tuple:
+            background = tuple(background)
+
+        key = (font, text, antialias, colour, background)
+        surface = cls._cache.get(key)
+        if surface is not None:
+            return surface
+
+        if cls._use_atlas(text, antialias, background):
+            surface = cls._render_from_atlas(font, text, colour)
+        else:
+            surface = font.render(text, antialias, colour, background)
+
+        cls._cache.put(key, surface)
+        return surface
+
+    @classmethod
+    def stats(cls):
+        """Counters of the rendered-text cache."""
+        stats = cls._cache.stats()
+        stats["atlases"] = len(cls._atlases)
+        return stats
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached rendering and atlas."""
+        cls._cache.clear()
+        cls._atlases.clear()
+
+    # ========================================================================
+    # Glyph Atlas
+    # ========================================================================
+
+    @staticmethod
+    def _use_atlas(text, antialias, background):
+        """Whether a string can be assembled from the glyph atlas."""
+        return (
+            antialias
+            and background is None
+            and 0 < len(text) <= ATLAS_MAX_LENGTH
+            and ATLAS_CHARACTERS.issuperset(text)
+        )
+
+    @classmethod
+    def _glyphs(cls, font, colour):
+        """The glyph atlas for a font and colour, built on first use."""
+        key = (font, True, colour)
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = {}
+            for character, metrics in zip(sorted(ATLAS_CHARACTERS), font.metrics("".join(sorted(ATLAS_CHARACTERS)))):
+                glyph = font.render(character, True, colour)
+                advance = metrics[4] if metrics else glyph.get_width()
+                atlas[character] = (glyph, advance)
+            cls._atlases[key] = atlas
+        return atlas
+
+    @classmethod
+    def glyph(cls, font, character, colour):
+        """
+        Get one antialiased character from the font's glyph atlas, adding it
+        to the atlas if it is not one of the preset characters.
+
+        Returns:
+            (glyph surface, advance); the surface is shared
+        """
+        if type(colour) is not tuple:
+            colour = tuple(colour)
+        atlas = cls._glyphs(font, colour)
+        glyph = atlas.get(character)
+        if glyph is None:
+            surface = font.render(character, True, colour)
+            metrics = font.metrics(character)
+            advance = metrics[0][4] if metrics and metrics[0] else surface.get_width()
+            glyph = atlas[character] = (surface, advance)
+        return glyph
+
+    @classmethod
+    def _render_from_atlas(cls, font, text, colour):
+        """Assemble a short string by blitting pre-rendered glyphs."""
+        atlas = cls._glyphs(font, colour)
+        glyphs = [atlas[character] for character in text]
+
+        width = sum(advance for _, advance in glyphs)
+        # The last glyph may overhang its advance
+        width = max(width, width - glyphs[-1][1] + glyphs[-1][0].get_width())
+
+        surface = pygame.Surface((width, font.get_height()), pygame.SRCALPHA)
+        x = 0
+        for glyph, advance in glyphs:
+            # Glyphs do not overlap, so taking the maximum copies them exactly
+            surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += advance
+
+        return surface
@@ -2,15 +2,28 @@
 Game entities (cards, decks, rooms)
 """
 
-from .card import Card
+# entities.card uses core, and core's managers use entities in turn.
+# Bringing core in first gives the one order in which the cycle resolves,
+# whichever package is imported first.
+import core
+
+from .card_model import CardModel
+from .deck_composition import DeckComposition
+from .card import Card, CardView, CardTextures
+from .card_pool import CardPool
 from .deck import Deck, DiscardPile
 from .room import Room
 from .player import Player
 
 __all__ = [
+    'CardModel',
+    'DeckComposition',
     'Card',
+    'CardView',
+    'CardTextures',
+    'CardPool',
     'Deck',
     'DiscardPile',
     'Room',
     'Player'
-]
\ No newline at end of file
+]
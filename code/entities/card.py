@@ -6,40 +6,157 @@ import random
 from config import *
 
 from core.resource_loader import ResourceLoader
+from core.surface_cache import SurfaceCache
+from core.text_cache import TextCache
+
+from entities.card_model import CardModel
 
 from ui.panel import Panel
 
-class Card:
-    """ Represents a card in the game with support for rotation and scaling. """
+
+def _model_field(name):
+    """Expose a CardModel slot as a read/write attribute of the view."""
+    def getter(self):
+        return getattr(self.model, name)
+
+    def setter(self, value):
+        setattr(self.model, name, value)
+
+    return property(getter, setter)
+
+
+def _model_readonly(name):
+    """Expose a CardModel attribute as a read-only attribute of the view."""
+    return property(lambda self: getattr(self.model, name))
+
+
+class CardTextures:
+    """
+    Flyweight store for card textures.
+    Every card with the same face (suit, value and artwork) shares one surface,
+    and all cards share a single scaled card back. Faces are kept in a
+    byte-budgeted LRU, since artwork rolls make more of them than a run shows
+    at once; cards keep their own reference, so eviction never affects one.
+
+    The flat tints, shadows and hover info panels drawn over and around
+    cards are shared the same way, so hovering and flipping make no surfaces.
+    """
+
+    _faces = SurfaceCache(CARD_FACE_CACHE_BUDGET)
+    _effects = SurfaceCache(CARD_EFFECT_CACHE_BUDGET)
+    _back = None
+
+    BACK_KEY = "cards/card_back.png"
+
+    @classmethod
+    def back(cls):
+        """Get the shared, card-sized card back."""
+        if cls._back is None:
+            cls._back = ResourceLoader.load_scaled(cls.BACK_KEY, (CARD_WIDTH, CARD_HEIGHT))
+        return cls._back
+
+    @staticmethod
+    def face_key(model):
+        """Identity of a card's face texture, shared by every card that looks the same."""
+        return (model.suit, model.value, model.art_key)
+
+    @classmethod
+    def face(cls, model):
+        """Get the shared, card-sized face texture for a card model."""
+        key = cls.face_key(model)
+        texture = cls._faces.get(key)
+        if texture is None:
+            texture = pygame.transform.scale(cls._compose_face(model), (CARD_WIDTH, CARD_HEIGHT))
+            cls._faces.put(key, texture)
+        return texture
+
+    @classmethod
+    def tint(cls, size, colour):
+        """
+        Get a shared surface of one colour, for overlays and shadows.
+
+        Shadows and overlays change size as cards float and lift, so there
+        is one surface per colour, grown in steps to cover the largest size
+        asked for; blit it with an area of the size wanted. Its alpha is left as the
+        last user set it, so set it before each blit too.
+        """
+        key = ("tint", colour)
+        tint = cls._effects.get(key)
+        if tint is None or tint.get_width() < size[0] or tint.get_height() < size[1]:
+            if tint is not None:
+                size = (max(size[0], tint.get_width()), max(size[1], tint.get_height()))
+            # Rounded up so a card lifting a pixel at a time does not regrow it every frame
+            size = (-(-size[0] // 32) * 32, -(-size[1] // 32) * 32)
+            tint = pygame.Surface(size, pygame.SRCALPHA)
+            tint.fill(colour)
+            cls._effects.put(key, tint)
+        return tint
+
+    @classmethod
+    def info_panel(cls, size, colour):
+        """Get the shared surface of a hover info panel."""
+        key = ("info_panel", size, colour)
+        panel = cls._effects.get(key)
+        if panel is None:
+            panel = Panel(size, (0, 0), colour=colour, alpha=220, border_radius=8, dungeon_style=True).surface
+            cls._effects.put(key, panel)
+        return panel
+
+    @classmethod
+    def clear(cls):
+        """Drop all shared textures."""
+        cls._faces.clear()
+        cls._effects.clear()
+        cls._back = None
+
+    @classmethod
+    def _compose_face(cls, model):
+        """Build the face texture: the card image with its artwork on top."""
+        suit, value = model.suit, model.value
+
+        if value == 0:
+            try:
+                texture = ResourceLoader.load_image(f"cards/{suit}_{value}.png")
+            except:
+                if suit == "diamonds":
+                    try:
+                        texture = ResourceLoader.load_image(f"cards/{suit}_14.png")
+                    except:
+                        texture = cls._create_blank_card("diamonds")
+                else:
+                    texture = cls._create_blank_card(suit)
+        else:
+            texture = ResourceLoader.load_image(f"cards/{suit}_{value}.png")
+
+        if not (2 <= value <= 14):
+            return texture
+
+        if model.type == "monster":
+            return cls._add_art(texture, model.sprite_file_path, 96)
+        elif model.type == "weapon":
+            return cls._add_art(texture, f"weapons/{model.weapon_name}.png", 120)
+        elif model.type == "potion":
+            return cls._add_art(texture, f"potions/{model.potion_index}.png", 120)
+        return texture
+
+    @staticmethod
+    def _add_art(card_surface, art_path, art_size):
+        """Blit an artwork image centred on a copy of the card surface."""
+        card_width, card_height = card_surface.get_width(), card_surface.get_height()
+        new_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
+        new_surface.blit(card_surface, (0, 0))
+
+        try:
+            art_img = ResourceLoader.load_scaled(art_path, (art_size, art_size))
+            art_pos = ((card_width - art_size) // 2, (card_height - art_size) // 2)
+            new_surface.blit(art_img, art_pos)
+        except Exception as e:
+            return card_surface
+
+        return new_surface
 
     @staticmethod
-    def _to_roman(num):
-        """Convert integer to Roman numeral"""
-        if num == 0:
-            return ""
-
-        val = [
-            1000, 900, 500, 400,
-            100, 90, 50, 40,
-            10, 9, 5, 4,
-            1
-        ]
-        syms = [
-            "M", "CM", "D", "CD",
-            "C", "XC", "L", "XL",
-            "X", "IX", "V", "IV",
-            "I"
-        ]
-        roman_num = ''
-        i = 0
-        while num > 0:
-            for _ in range(num // val[i]):
-                roman_num += syms[i]
-                num -= val[i]
-            i += 1
-        return roman_num
-
-    def _create_blank_card(self, suit):
+    def _create_blank_card(suit):
         """Create a blank card texture with just the suit symbol (for non-valued cards)"""
 
         texture = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
@@ -63,13 +180,13 @@ class Card:
             suit_colour = BLACK
 
         suit_font = pygame.font.SysFont("arial", 40)
-        suit_text = suit_font.render(suit_symbol, True, suit_colour)
+        suit_text = TextCache.render(suit_font, suit_symbol, True, suit_colour)
 
         text_rect = suit_text.get_rect(center=(CARD_WIDTH // 2, CARD_HEIGHT // 2))
         texture.blit(suit_text, text_rect)
 
         small_font = pygame.font.SysFont("arial", 20)
-        small_text = small_font.render(suit_symbol, True, suit_colour)
+        small_text = TextCache.render(small_font, suit_symbol, True, suit_colour)
 
         texture.blit(small_text, (5, 5))
 
@@ -78,185 +195,144 @@ class Card:
 
         return texture
 
-    def __init__(self, suit, value, floor_type="dungeon"):
-        self.suit = suit
-        self.value = value
-        self.type = self.determine_type()
-        self.width = CARD_WIDTH
-        self.height = CARD_HEIGHT
+
+class CardView:
+    """
+    On-screen representation of a card with support for rotation and scaling.
+    Rules data and state flags live in the CardModel; the view only keeps
+    animation state and references to shared textures.
+    """
+
+    __slots__ = (
+        "model",
+        "rect",
+        "is_hovered",
+        "hover_selection",
+        "is_selected",
+        "is_flipping",
+        "flip_progress",
+        "face_up",
+        "z_index",
+        "is_visible",
+        "rotation",
+        "scale",
+        "idle_time",
+        "idle_float_offset",
+        "idle_phase_offset",
+        "hover_progress",
+        "hover_float_offset",
+        "weapon_available",
+        "inventory_available",
+        "weapon_attack_not_viable",
+        "original_texture",
+        "original_face_down_texture",
+        "texture",
+        "face_down_texture",
+        "original_y",
+        "hit_index",
+    )
+
+    width = CARD_WIDTH
+    height = CARD_HEIGHT
+
+    idle_float_speed = 1
+    idle_float_amount = 6.0
+
+    hover_speed = 5.0
+    hover_scale_target = 1.12
+    hover_lift_amount = 15.0
+
+    inventory_colour = (128, 0, 128, 100)
+    use_colour = (255, 165, 0, 100)
+    equip_colour = (0, 255, 0, 100)
+    weapon_attack_colour = (0, 100, 200, 100)
+    bare_hands_colour = (200, 50, 50, 100)
+    icon_size = 50
+
+    lift_height = 20
+
+    suit = _model_readonly("suit")
+    value = _model_readonly("value")
+    type = _model_readonly("type")
+    floor_type = _model_readonly("floor_type")
+    name = _model_field("name")
+    sprite_file_path = _model_readonly("sprite_file_path")
+    monster_type = _model_readonly("monster_type")
+    weapon_difficulty = _model_readonly("weapon_difficulty")
+    damage_type = _model_readonly("damage_type")
+    can_add_to_inventory = _model_readonly("can_add_to_inventory")
+    can_show_attack_options = _model_readonly("can_show_attack_options")
+
+    # Location flags are owned by the session's CardRegistry
+    in_inventory = _model_readonly("in_inventory")
+    is_equipped = _model_readonly("is_equipped")
+    is_defeated = _model_readonly("is_defeated")
+
+    def __init__(self, suit, value, floor_type="dungeon", model=None):
+        """
+        Create a card view.
+
+        Args:
+            suit: Card suit
+            value: Card value
+            floor_type: Floor the card was dealt on
+            model: Optional existing CardModel to display instead of a new one
+        """
+        self.reset(suit, value, floor_type, model)
+
+    def reset(self, suit, value, floor_type="dungeon", model=None):
+        """
+        Show a card from scratch, as a new view would. Used by CardPool to
+        reuse views of cards that have left play. Same arguments as the
+        constructor.
+        """
+        self.model = model if model is not None else CardModel(suit, value, floor_type)
         self.rect = pygame.Rect(0, 0, self.width, self.height)
+
         self.is_hovered = False
+        self.hover_selection = None
+        self.is_selected = False
 
         self.is_flipping = False
+        self.flip_progress = 0.0
         self.face_up = False
         self.z_index = 0
         self.is_visible = True
-        self.floor_type = floor_type
-        self.name = None
-
-        self.damage_type = None
-        self.weapon_difficulty = None
-        self.monster_type = None
-
-        self.sprite_file_path = None if self.suit in ("diamonds", "hearts") else self.determine_monster_sprite_path()
-
-        if self.type == "potion":
-            self.name = f"Potion {self._to_roman(self.value)}"
-        elif self.type == "weapon":
-
-            self.name = f"Weapon {self._to_roman(self.value)}"
-        elif self.type == "monster":
-
-            pass
 
         self.rotation = 0
         self.scale = 1.0
 
         self.idle_time = 0.0
-        self.idle_float_speed = 1
-        self.idle_float_amount = 6.0
         self.idle_float_offset = 0.0
         self.idle_phase_offset = 6.28 * random.random()
 
         self.hover_progress = 0.0
-        self.hover_speed = 5.0
         self.hover_float_offset = 0.0
-        self.hover_scale_target = 1.12
-        self.hover_lift_amount = 15.0
-
-        self.can_add_to_inventory = self.type in ["potion", "weapon"]
-        self.can_show_attack_options = self.type in ["monster"]
-        self.hover_selection = None
-        self.inventory_colour = (128, 0, 128, 100)
-        self.use_colour = (255, 165, 0, 100)
-        self.equip_colour = (0, 255, 0, 100)
-        self.weapon_attack_colour = (0, 100, 200, 100)
-        self.bare_hands_colour = (200, 50, 50, 100)
-        self.is_selected = False
-        self.icon_size = 50
 
         self.weapon_available = False
         self.inventory_available = True
         self.weapon_attack_not_viable = False
 
-        if self.value == 0:
-            try:
-                texture = ResourceLoader.load_image(f"cards/{self.suit}_{self.value}.png")
-            except:
-                if self.suit == "diamonds":
-                    try:
-                        texture = ResourceLoader.load_image(f"cards/{self.suit}_14.png")
-                    except:
-                        texture = self._create_blank_card("diamonds")
-                else:
-                    texture = self._create_blank_card(self.suit)
-        else:
-            texture = ResourceLoader.load_image(f"cards/{self.suit}_{self.value}.png")
-
-        if self.type == "monster" and (self.value >= 2 and self.value <= 14):
-            texture = self.add_monster_to_card(texture)
-        elif self.type == "weapon" and (self.value >= 2 and self.value <= 14):
-            texture = self.add_weapon_to_card(texture)
-        elif self.type == "potion" and (self.value >= 2 and self.value <= 14):
-            texture = self.add_potion_to_card(texture)
-
-        self.texture = pygame.transform.scale(texture, (self.width, self.height))
-        self.original_texture = self.texture
+        self.original_texture = CardTextures.face(self.model)
+        self.original_face_down_texture = CardTextures.back()
+        self.texture = self.original_texture
+        self.face_down_texture = self.original_face_down_texture
 
-        self.face_down_texture = pygame.transform.scale(
-            ResourceLoader.load_image("cards/card_back.png"),
-            (self.width, self.height)
-        )
-        self.original_face_down_texture = self.face_down_texture
-
-        self.flip_progress = 0.0
-        self.is_flipping = False
-        self.face_up = False
-        self.lift_height = 20
         self.original_y = 0
 
-    def add_monster_to_card(self, card_surface):
-        """Add monster image to card surface based on suit, value and floor type"""
-        self.name = f"{self.sprite_file_path.split("/")[-1].split(".")[0].title()} {self._to_roman(self.value)}"
-        monster_name = self.name.lower()
-        self.monster_type = self.sprite_file_path.split("/")[-2]
-
-        card_width, card_height = card_surface.get_width(), card_surface.get_height()
-        new_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-        new_surface.blit(card_surface, (0, 0))
-
-        monster_img = ResourceLoader.load_image(self.sprite_file_path, cache=False)
-        monster_size = 96
-        monster_img = pygame.transform.scale(monster_img, (monster_size, monster_size))
-        monster_surface = pygame.Surface((monster_size, monster_size), pygame.SRCALPHA)
-        monster_surface.blit(monster_img, (0, 0))
-
-        monster_pos = ((card_width - monster_size) // 2, (card_height - monster_size) // 2)
-        new_surface.blit(monster_surface, monster_pos)
+        # Set by the session's CardRegistry while the card is on the board
+        self.hit_index = None
 
-        return new_surface
-
-    def add_weapon_to_card(self, card_surface):
-        """Add weapon image to card surface based on value"""
-        card_width, card_height = card_surface.get_width(), card_surface.get_height()
-        new_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-        new_surface.blit(card_surface, (0, 0))
-
-        self.weapon_difficulty = WEAPON_RANKS[self.value]
-        weapon_name = random.choice(WEAPON_RANK_MAP[self.weapon_difficulty])
-        self.damage_type = WEAPON_DAMAGE_TYPES[weapon_name]
-
-        weapon_display_name = weapon_name.capitalize()
-        self.name = f"{weapon_display_name} {self._to_roman(self.value)}"
-
-        weapon_path = f"weapons/{weapon_name}.png"
-        try:
-            weapon_img = ResourceLoader.load_image(weapon_path)
-            weapon_size = 120
-            weapon_img = pygame.transform.scale(weapon_img, (weapon_size, weapon_size))
-            weapon_pos = ((card_width - weapon_size) // 2, (card_height - weapon_size) // 2)
-            new_surface.blit(weapon_img, weapon_pos)
-        except Exception as e:
-            return card_surface
-
-        return new_surface
-
-    def add_potion_to_card(self, card_surface):
-        """Add potion image to card surface based on value"""
-        card_width, card_height = card_surface.get_width(), card_surface.get_height()
-        new_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-        new_surface.blit(card_surface, (0, 0))
-
-        potion_path = f"potions/{random.randint(1,20)}.png"
-        try:
-            potion_img = ResourceLoader.load_image(potion_path)
-            potion_size = 120
-            potion_img = pygame.transform.scale(potion_img, (potion_size, potion_size))
-            potion_pos = ((card_width - potion_size) // 2, (card_height - potion_size) // 2)
-            new_surface.blit(potion_img, potion_pos)
-        except Exception as e:
-            return card_surface
-
-        return new_surface
-
-    def determine_type(self):
-        if self.suit in ["spades", "clubs"]:
-            return "monster"
-        elif self.suit == "diamonds":
-            return "weapon"
-        elif self.suit == "hearts":
-            return "potion"
-        return "unknown"
-
-    def determine_monster_sprite_path(self):
-        difficulty = MONSTER_RANKS[self.value]
-        monster_file_path = random.choice(MONSTER_DIFFICULTY_MAP[difficulty])
-        return monster_file_path
+    def _rect_changed(self):
+        """Report the card's new rect to the hit index it is in, if any."""
+        if self.hit_index is not None:
+            self.hit_index.update(self, self.rect)
 
     def update_position(self, pos):
         self.rect.topleft = (int(pos[0]), int(pos[1]))
         if not self.is_flipping:
             self.original_y = int(pos[1])
+        self._rect_changed()
 
     def start_flip(self):
         self.is_flipping = True
@@ -268,7 +344,7 @@ class Card:
 
         self.idle_time += delta_time
 
-        if hasattr(self, 'in_inventory') and self.in_inventory:
+        if self.in_inventory:
             self.idle_float_offset = math.sin(self.idle_time * self.idle_float_speed + self.idle_phase_offset) * (self.idle_float_amount * 0.25)
         else:
             self.idle_float_offset = math.sin(self.idle_time * self.idle_float_speed + self.idle_phase_offset) * self.idle_float_amount
@@ -291,12 +367,18 @@ class Card:
 
             self.rect.centerx = center_x
             self.rect.centery = center_y
+            self._rect_changed()
 
-            if hasattr(self, 'in_inventory') and self.in_inventory:
+            if self.in_inventory:
                 self.hover_float_offset = self.hover_lift_amount * self.hover_progress * 0.25
             else:
                 self.hover_float_offset = self.hover_lift_amount * self.hover_progress
 
+    def is_settled(self):
+        """Whether the card is still apart from its idle float."""
+        target_hover = 1.0 if self.is_hovered else 0.0
+        return not self.is_flipping and abs(self.hover_progress - target_hover) <= 0.01
+
     def update_flip(self, delta_time):
         if self.is_flipping:
 
@@ -320,24 +402,32 @@ class Card:
 
                 self.rect.y = self.original_y - lift_amount
 
+            self._rect_changed()
+
     def rotate(self, angle):
         """Rotate the card textures"""
         self.rotation = angle
 
         if abs(angle) > 0.1:
 
-            self.texture = pygame.transform.rotate(self.original_texture, angle)
-            self.face_down_texture = pygame.transform.rotate(self.original_face_down_texture, angle)
+            self.texture = ResourceLoader.load_variant(
+                CardTextures.face_key(self.model), self.original_texture, angle=angle
+            )
+            self.face_down_texture = ResourceLoader.load_variant(
+                CardTextures.BACK_KEY, self.original_face_down_texture, angle=angle
+            )
 
             self.rect.width = self.texture.get_width()
             self.rect.height = self.texture.get_height()
         else:
 
-            self.texture = self.original_texture.copy()
-            self.face_down_texture = self.original_face_down_texture.copy()
+            self.texture = self.original_texture
+            self.face_down_texture = self.original_face_down_texture
             self.rect.width = self.width
             self.rect.height = self.height
 
+        self._rect_changed()
+
     def update_scale(self, scale):
         """Update the card scale"""
 
@@ -346,8 +436,8 @@ class Card:
 
         if abs(scale - 1.0) < 0.01:
 
-            self.texture = self.original_texture.copy()
-            self.face_down_texture = self.original_face_down_texture.copy()
+            self.texture = self.original_texture
+            self.face_down_texture = self.original_face_down_texture
             self.rect.width = self.width
             self.rect.height = self.height
         else:
@@ -356,13 +446,20 @@ class Card:
             new_height = int(self.height * scale)
 
             if new_width > 0 and new_height > 0:
-                self.texture = pygame.transform.scale(self.original_texture, (new_width, new_height))
-                self.face_down_texture = pygame.transform.scale(self.original_face_down_texture, (new_width, new_height))
+                # Hover and animation scales land on a handful of pixel sizes,
+                # so the scaled textures are shared through the variant cache
+                self.texture = ResourceLoader.load_variant(
+                    CardTextures.face_key(self.model), self.original_texture, size=(new_width, new_height)
+                )
+                self.face_down_texture = ResourceLoader.load_variant(
+                    CardTextures.BACK_KEY, self.original_face_down_texture, size=(new_width, new_height)
+                )
 
                 self.rect.width = new_width
                 self.rect.height = new_height
 
         self.scale = scale
+        self._rect_changed()
 
     def draw(self, surface):
 
@@ -391,14 +488,6 @@ class Card:
             else:
                 shadow_alpha = 80 + (self.flip_progress - 0.5) * 80
 
-            shadow_texture = None
-            if self.flip_progress < 0.5:
-                shadow_texture = self.face_down_texture.copy()
-            else:
-                shadow_texture = self.texture.copy()
-
-            shadow_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-
             scaled_width = self.width
             if self.flip_progress < 0.5:
 
@@ -409,17 +498,17 @@ class Card:
 
             if scaled_width > 1:
 
-                scaled_shadow = pygame.transform.scale(shadow_texture, (int(scaled_width), self.height))
-
-                for x in range(scaled_shadow.get_width()):
-                    for y in range(scaled_shadow.get_height()):
-                        colour = scaled_shadow.get_at((x, y))
-                        grey = (colour[0] + colour[1] + colour[2]) // 3
-                        scaled_shadow.set_at((x, y), (30, 30, 30, shadow_alpha))
+                # A flat shadow the shape of the squeezed card
+                shadow = CardTextures.tint((self.width, self.height), (30, 30, 30))
+                shadow.set_alpha(int(shadow_alpha))
 
                 x_offset = (self.width - scaled_width) / 2
 
-                surface.blit(scaled_shadow, (self.rect.x + x_offset + shadow_offset_x, self.rect.y + shadow_offset_y))
+                surface.blit(
+                    shadow,
+                    (self.rect.x + x_offset + shadow_offset_x, self.rect.y + shadow_offset_y),
+                    (0, 0, int(scaled_width), self.height)
+                )
 
             scaled_width = self.width
             if self.flip_progress < 0.5:
@@ -464,13 +553,13 @@ class Card:
             shadow_width = int(current_texture.get_width() * shadow_scale)
             shadow_height = int(current_texture.get_height() * shadow_scale)
 
-            shadow_surf = pygame.Surface((shadow_width, shadow_height), pygame.SRCALPHA)
-            shadow_surf.fill((0, 0, 0, shadow_alpha))
+            shadow_surf = CardTextures.tint((shadow_width, shadow_height), (0, 0, 0))
+            shadow_surf.set_alpha(shadow_alpha)
 
             shadow_x = center_x - shadow_width / 2 + shadow_offset
             shadow_y = center_y - shadow_height / 2 + shadow_offset
 
-            surface.blit(shadow_surf, (shadow_x, shadow_y))
+            surface.blit(shadow_surf, (shadow_x, shadow_y), (0, 0, shadow_width, shadow_height))
 
             surface.blit(current_texture, (pos_x, pos_y))
 
@@ -479,51 +568,22 @@ class Card:
                 overlay_width = current_texture.get_width()
                 overlay_height = current_texture.get_height() // 2
 
-                is_defeated_monster = False
-
-                if hasattr(self, 'is_defeated') and self.is_defeated:
-                    is_defeated_monster = True
-
-                if not is_defeated_monster and pygame.display.get_surface():
-
-                    try:
-
-                        main_module = sys.modules['__main__']
-                        if hasattr(main_module, 'game_manager'):
-                            game_manager = main_module.game_manager
-                            if hasattr(game_manager, 'current_state'):
-                                current_state = game_manager.current_state
-                                if hasattr(current_state, 'defeated_monsters'):
-
-                                    if self in current_state.defeated_monsters:
-                                        is_defeated_monster = True
-
-                                        self.is_defeated = True
-                    except:
-
-                        pass
+                is_defeated_monster = self.is_defeated
 
                 if is_defeated_monster:
                     pass
 
-                elif hasattr(self, 'is_equipped') and self.is_equipped:
+                elif self.is_equipped:
 
-                    full_overlay = pygame.Surface((overlay_width, overlay_height*2), pygame.SRCALPHA)
-                    full_overlay.fill((200, 60, 60))
-                    full_overlay.set_alpha(120)
-                    surface.blit(full_overlay, (pos_x, pos_y))
+                    self._blit_tint(surface, (overlay_width, overlay_height*2), (200, 60, 60), 120, (pos_x, pos_y))
 
-                elif hasattr(self, 'in_inventory') and self.in_inventory:
-
-                    top_overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
-                    top_overlay.fill((200, 60, 60))
-
-                    bottom_overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
+                elif self.in_inventory:
 
+                    bottom_colour = None
                     if self.type == "weapon":
-                        bottom_overlay.fill((60, 180, 60))
+                        bottom_colour = (60, 180, 60)
                     elif self.type == "potion":
-                        bottom_overlay.fill((220, 160, 50))
+                        bottom_colour = (220, 160, 50)
 
                     top_alpha = 120
                     bottom_alpha = 120
@@ -534,23 +594,17 @@ class Card:
                         top_alpha = 100
                         bottom_alpha = 180
 
-                    top_overlay.set_alpha(top_alpha)
-                    bottom_overlay.set_alpha(bottom_alpha)
-
-                    surface.blit(top_overlay, (pos_x, pos_y))
-                    surface.blit(bottom_overlay, (pos_x, pos_y + overlay_height))
+                    self._blit_tint(surface, (overlay_width, overlay_height), (200, 60, 60), top_alpha, (pos_x, pos_y))
+                    if bottom_colour:
+                        self._blit_tint(surface, (overlay_width, overlay_height), bottom_colour, bottom_alpha, (pos_x, pos_y + overlay_height))
 
                 elif self.can_add_to_inventory:
-                    if hasattr(self, 'inventory_available') and self.inventory_available:
-
-                        top_overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
-                        top_overlay.fill(self.inventory_colour)
+                    if self.inventory_available:
 
-                        bottom_overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
                         if self.type == "weapon":
-                            bottom_overlay.fill(self.equip_colour)
+                            bottom_colour = self.equip_colour
                         else:
-                            bottom_overlay.fill(self.use_colour)
+                            bottom_colour = self.use_colour
 
                         top_alpha = 120
                         bottom_alpha = 120
@@ -563,35 +617,22 @@ class Card:
                             top_alpha = 120
                             bottom_alpha = 180
 
-                        top_overlay.set_alpha(top_alpha)
-                        bottom_overlay.set_alpha(bottom_alpha)
-
-                        surface.blit(top_overlay, (pos_x, pos_y))
-                        surface.blit(bottom_overlay, (pos_x, pos_y + overlay_height))
+                        self._blit_tint(surface, (overlay_width, overlay_height), self.inventory_colour, top_alpha, (pos_x, pos_y))
+                        self._blit_tint(surface, (overlay_width, overlay_height), bottom_colour, bottom_alpha, (pos_x, pos_y + overlay_height))
 
                     else:
 
-                        full_overlay = pygame.Surface((overlay_width, overlay_height*2), pygame.SRCALPHA)
-
                         if self.type == "weapon":
-                            full_overlay.fill(self.equip_colour)
+                            full_colour = self.equip_colour
                         else:
-                            full_overlay.fill(self.use_colour)
+                            full_colour = self.use_colour
 
-                        full_overlay.set_alpha(130)
-
-                        surface.blit(full_overlay, (pos_x, pos_y))
+                        self._blit_tint(surface, (overlay_width, overlay_height*2), full_colour, 130, (pos_x, pos_y))
 
                 elif self.can_show_attack_options:
 
                     if self.weapon_available and not self.weapon_attack_not_viable:
 
-                        top_overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
-                        top_overlay.fill(self.weapon_attack_colour)
-
-                        bottom_overlay = pygame.Surface((overlay_width, overlay_height), pygame.SRCALPHA)
-                        bottom_overlay.fill(self.bare_hands_colour)
-
                         top_alpha = 120
                         bottom_alpha = 120
                         if self.hover_selection == "top":
@@ -603,25 +644,25 @@ class Card:
                             top_alpha = 120
                             bottom_alpha = 180
 
-                        top_overlay.set_alpha(top_alpha)
-                        bottom_overlay.set_alpha(bottom_alpha)
-
-                        surface.blit(top_overlay, (pos_x, pos_y))
-                        surface.blit(bottom_overlay, (pos_x, pos_y + overlay_height))
+                        self._blit_tint(surface, (overlay_width, overlay_height), self.weapon_attack_colour, top_alpha, (pos_x, pos_y))
+                        self._blit_tint(surface, (overlay_width, overlay_height), self.bare_hands_colour, bottom_alpha, (pos_x, pos_y + overlay_height))
                     else:
 
-                        full_overlay = pygame.Surface((overlay_width, overlay_height*2), pygame.SRCALPHA)
-                        full_overlay.fill(self.bare_hands_colour)
-                        full_overlay.set_alpha(120)
+                        self._blit_tint(surface, (overlay_width, overlay_height*2), self.bare_hands_colour, 120, (pos_x, pos_y))
 
-                        surface.blit(full_overlay, (pos_x, pos_y))
+    @staticmethod
+    def _blit_tint(surface, size, colour, alpha, pos):
+        """Blit a shared tint of one colour at the given alpha."""
+        tint = CardTextures.tint(size, colour)
+        tint.set_alpha(alpha)
+        surface.blit(tint, pos, (0, 0) + tuple(size))
 
     def draw_hover_text(self, surface):
         """Draw hover action text to the right of the card"""
 
-        card_in_inventory = hasattr(self, 'in_inventory') and self.in_inventory
+        card_in_inventory = self.in_inventory
 
-        is_defeated_monster = hasattr(self, 'is_defeated') and self.is_defeated
+        is_defeated_monster = self.is_defeated
 
         if is_defeated_monster:
             if not (self.is_hovered and self.face_up):
@@ -648,9 +689,7 @@ class Card:
         card_left = self.rect.left
         card_right = self.rect.right
 
-        total_float_offset = 0
-        if hasattr(self, 'idle_float_offset') and hasattr(self, 'hover_float_offset'):
-            total_float_offset = self.idle_float_offset + self.hover_float_offset
+        total_float_offset = self.idle_float_offset + self.hover_float_offset
 
         info_x = card_right + 10
         info_y = card_top - total_float_offset
@@ -659,7 +698,7 @@ class Card:
 
         if self.type == "weapon":
 
-            card_name = self.name if hasattr(self, 'name') and self.name else f"Weapon {self.value}"
+            card_name = self.name if self.name else f"Weapon {self.value}"
 
             type_text = f"Weapon - {self.weapon_difficulty.upper()}"
 
@@ -668,7 +707,7 @@ class Card:
             action_text = ""
             action_colour = GOLD_COLOUR
 
-            if hasattr(self, 'in_inventory') and self.in_inventory:
+            if self.in_inventory:
 
                 if self.hover_selection == "top":
                     action_text = "DISCARD"
@@ -687,7 +726,7 @@ class Card:
                         elif self.type == "potion":
                             action_text = "USE or DISCARD"
 
-            elif hasattr(self, 'is_equipped') and self.is_equipped:
+            elif self.is_equipped:
                 action_text = "DISCARD"
                 action_colour = (255, 120, 120)
 
@@ -714,7 +753,7 @@ class Card:
 
         elif self.type == "potion":
 
-            card_name = self.name if hasattr(self, 'name') and self.name else f"Potion {self.value}"
+            card_name = self.name if self.name else f"Potion {self.value}"
 
             type_text = "Potion - Healing"
 
@@ -723,7 +762,7 @@ class Card:
             action_text = ""
             action_colour = GOLD_COLOUR
 
-            if hasattr(self, 'in_inventory') and self.in_inventory:
+            if self.in_inventory:
                 if self.hover_selection == "top":
                     action_text = "DISCARD"
                     action_colour = (255, 120, 120)
@@ -753,38 +792,16 @@ class Card:
 
         elif self.type == "monster":
 
-            monster_name = self.name if hasattr(self, 'name') and self.name else f"Monster {self.value}"
+            monster_name = self.name if self.name else f"Monster {self.value}"
 
-            type_text = f"{self.monster_type} - Value {self.value}" if hasattr(self, 'monster_type') and self.monster_type else f"Monster - Value {self.value}"
+            type_text = f"{self.monster_type} - Value {self.value}" if self.monster_type else f"Monster - Value {self.value}"
 
             action_text = ""
             warning_text = ""
             action_colour = GOLD_COLOUR
             defeated_text = ""
 
-            is_defeated_monster = False
-
-            if hasattr(self, 'is_defeated') and self.is_defeated:
-                is_defeated_monster = True
-
-            if not is_defeated_monster and pygame.display.get_surface():
-
-                try:
-
-                    main_module = sys.modules['__main__']
-                    if hasattr(main_module, 'game_manager'):
-                        game_manager = main_module.game_manager
-                        if hasattr(game_manager, 'current_state'):
-                            current_state = game_manager.current_state
-                            if hasattr(current_state, 'defeated_monsters'):
-
-                                if self in current_state.defeated_monsters:
-                                    is_defeated_monster = True
-
-                                    self.is_defeated = True
-                except:
-
-                    pass
+            is_defeated_monster = self.is_defeated
 
             if is_defeated_monster:
 
@@ -833,7 +850,7 @@ class Card:
 
         rendered_texts = []
         for line in info_lines:
-            text_surface = line["font"].render(line["text"], True, line["colour"])
+            text_surface = TextCache.render(line["font"], line["text"], True, line["colour"])
             rendered_texts.append(text_surface)
 
             max_text_width = max(max_text_width, text_surface.get_width() + 20)
@@ -847,19 +864,13 @@ class Card:
 
         info_height = 10 + total_text_height + 5
 
-        main_panel_right = pygame.display.get_surface().get_width() - 10
-        if hasattr(self, 'main_panel') and hasattr(self.main_panel, 'rect'):
-            main_panel_right = self.main_panel.rect.right - 10
+        main_panel_right = SCREEN_WIDTH - 10
 
         if info_x + info_width > main_panel_right:
             info_x = card_left - info_width - 10
 
         main_panel_left = 10
-        main_panel_bottom = pygame.display.get_surface().get_height() - 10
-
-        if hasattr(self, 'main_panel') and hasattr(self.main_panel, 'rect'):
-            main_panel_left = self.main_panel.rect.left + 10
-            main_panel_bottom = self.main_panel.rect.bottom - 10
+        main_panel_bottom = SCREEN_HEIGHT - 10
 
         if info_x < main_panel_left:
 
@@ -874,18 +885,15 @@ class Card:
 
         main_panel_top = 10
 
-        if hasattr(self, 'main_panel') and hasattr(self.main_panel, 'rect'):
-            main_panel_top = self.main_panel.rect.top + 10
-
         info_x = max(main_panel_left, min(info_x, main_panel_right - info_width))
         info_y = max(main_panel_top, min(info_y, main_panel_bottom - info_height))
 
         panel_colour = (60, 50, 40)
 
-        if hasattr(self, 'is_defeated') and self.is_defeated:
+        if self.is_defeated:
             panel_colour = (60, 50, 40)
 
-        elif hasattr(self, 'in_inventory') and self.in_inventory:
+        elif self.in_inventory:
             if self.hover_selection == "top":
                 if self.type == "weapon":
                     panel_colour = (60, 100, 40)
@@ -894,7 +902,7 @@ class Card:
             elif self.hover_selection == "bottom":
                 panel_colour = (100, 40, 40)
 
-        elif hasattr(self, 'is_equipped') and self.is_equipped:
+        elif self.is_equipped:
             panel_colour = (100, 40, 40)
 
         elif self.type == "weapon" and self.hover_selection:
@@ -917,15 +925,7 @@ class Card:
             elif self.hover_selection == "bottom":
                 panel_colour = (100, 40, 40)
 
-        info_panel = Panel(
-            (info_width, info_height),
-            (info_x, info_y),
-            colour=panel_colour,
-            alpha=220,
-            border_radius=8,
-            dungeon_style=True
-        )
-        info_panel.draw(surface)
+        surface.blit(CardTextures.info_panel((info_width, info_height), panel_colour), (info_x, info_y))
 
         current_y = info_y + 10
         for i, line in enumerate(info_lines):
@@ -934,7 +934,7 @@ class Card:
                 text_surface = rendered_texts[i]
             else:
 
-                text_surface = line["font"].render(line["text"], True, line["colour"])
+                text_surface = TextCache.render(line["font"], line["text"], True, line["colour"])
 
             text_rect = text_surface.get_rect(centerx=info_x + info_width//2, top=current_y)
             surface.blit(text_surface, text_rect)
@@ -952,34 +952,17 @@ class Card:
 
             card_midpoint_y = self.rect.y + self.rect.height / 2
 
-            is_defeated_monster = False
-
-            if hasattr(self, 'is_defeated') and self.is_defeated:
-                is_defeated_monster = True
-
-            if not is_defeated_monster and pygame.display.get_surface():
-                try:
-                    main_module = sys.modules['__main__']
-                    if hasattr(main_module, 'game_manager'):
-                        game_manager = main_module.game_manager
-                        if hasattr(game_manager, 'current_state'):
-                            current_state = game_manager.current_state
-                            if hasattr(current_state, 'defeated_monsters'):
-                                if self in current_state.defeated_monsters:
-                                    is_defeated_monster = True
-                                    self.is_defeated = True
-                except:
-                    pass
+            is_defeated_monster = self.is_defeated
 
             if is_defeated_monster:
 
                 self.hover_selection = None
 
-            elif hasattr(self, 'is_equipped') and self.is_equipped:
+            elif self.is_equipped:
 
                 self.hover_selection = "bottom"
 
-            elif hasattr(self, 'in_inventory') and self.in_inventory:
+            elif self.in_inventory:
 
                 if mouse_pos[1] < card_midpoint_y:
                     self.hover_selection = "top"
@@ -988,7 +971,7 @@ class Card:
 
             elif self.can_add_to_inventory:
 
-                if hasattr(self, 'inventory_available') and self.inventory_available:
+                if self.inventory_available:
 
                     if mouse_pos[1] < card_midpoint_y:
                         self.hover_selection = "top"
@@ -1011,6 +994,10 @@ class Card:
 
         return previous_hover != self.is_hovered or previous_selection != self.hover_selection
 
+
+# Game code creates cards through the Card name; the view owns its model.
+Card = CardView
+
 def crop_center(img_path, output_path, target_width, target_height):
     """Crop an image to the specified dimensions, centered on the original image."""
 
@@ -0,0 +1,161 @@
+"""
+entities/card_model.py
+
+Rules-level card data. Holds everything the game rules need to know about a
+card (suit, value, type, chosen artwork and state flags) and nothing that
+depends on pygame, so it can be copied, compared and serialised cheaply.
+"""
+
+import random
+
+from config import (
+    MONSTER_RANKS,
+    MONSTER_DIFFICULTY_MAP,
+    WEAPON_RANKS,
+    WEAPON_RANK_MAP,
+    WEAPON_DAMAGE_TYPES
+)
+
+POTION_IMAGE_COUNT = 20
+
+
+def to_roman(num):
+    """Convert integer to Roman numeral"""
+    if num == 0:
+        return ""
+
+    val = [
+        1000, 900, 500, 400,
+        100, 90, 50, 40,
+        10, 9, 5, 4,
+        1
+    ]
+    syms = [
+        "M", "CM", "D", "CD",
+        "C", "XC", "L", "XL",
+        "X", "IX", "V", "IV",
+        "I"
+    ]
+    roman_num = ''
+    i = 0
+    while num > 0:
+        for _ in range(num // val[i]):
+            roman_num += syms[i]
+            num -= val[i]
+        i += 1
+    return roman_num
+
+
+def card_type_for_suit(suit):
+    """Map a suit to its card type."""
+    if suit in ("spades", "clubs"):
+        return "monster"
+    elif suit == "diamonds":
+        return "weapon"
+    elif suit == "hearts":
+        return "potion"
+    return "unknown"
+
+
+class CardModel:
+    """
+    Rules data and explicit state flags for a single card.
+    Artwork choices are rolled once here so every view of the card agrees.
+    """
+
+    __slots__ = (
+        "suit",
+        "value",
+        "type",
+        "floor_type",
+        "name",
+        "sprite_file_path",
+        "monster_type",
+        "weapon_name",
+        "weapon_difficulty",
+        "damage_type",
+        "potion_index",
+        "in_inventory",
+        "is_equipped",
+        "is_defeated",
+    )
+
+    def __init__(self, suit, value, floor_type="dungeon", art=None):
+        """
+        Create a card model.
+
+        Args:
+            suit: Card suit
+            value: Card value (2-14)
+            floor_type: Floor the card was dealt on
+            art: Optional art key to reuse (sprite path, weapon name or potion
+                index); a random one is rolled when omitted
+        """
+        self.suit = suit
+        self.value = value
+        self.type = card_type_for_suit(suit)
+        self.floor_type = floor_type
+
+        self.name = None
+        self.sprite_file_path = None
+        self.monster_type = None
+        self.weapon_name = None
+        self.weapon_difficulty = None
+        self.damage_type = None
+        self.potion_index = None
+
+        self.in_inventory = False
+        self.is_equipped = False
+        self.is_defeated = False
+
+        self._assign_art(art)
+
+    def _assign_art(self, art):
+        """Choose artwork and derive the display name for this card."""
+        has_art = 2 <= self.value <= 14
+
+        if self.type == "monster":
+            if has_art:
+                self.sprite_file_path = art or random.choice(
+                    MONSTER_DIFFICULTY_MAP[MONSTER_RANKS[self.value]]
+                )
+                monster_name = self.sprite_file_path.split("/")[-1].split(".")[0].title()
+                self.monster_type = self.sprite_file_path.split("/")[-2]
+                self.name = f"{monster_name} {to_roman(self.value)}"
+
+        elif self.type == "weapon":
+            self.name = f"Weapon {to_roman(self.value)}"
+            if has_art:
+                self.weapon_difficulty = WEAPON_RANKS[self.value]
+                self.weapon_name = art or random.choice(WEAPON_RANK_MAP[self.weapon_difficulty])
+                self.damage_type = WEAPON_DAMAGE_TYPES[self.weapon_name]
+                self.name = f"{self.weapon_name.capitalize()} {to_roman(self.value)}"
+
+        elif self.type == "potion":
+            self.name = f"Potion {to_roman(self.value)}"
+            if has_art:
+                self.potion_index = art or random.randint(1, POTION_IMAGE_COUNT)
+
+    @property
+    def art_key(self):
+        """The artwork identifier chosen for this card (None for plain cards)."""
+        if self.type == "monster":
+            return self.sprite_file_path
+        elif self.type == "weapon":
+            return self.weapon_name
+        elif self.type == "potion":
+            return self.potion_index
+        return None
+
+    @property
+    def can_add_to_inventory(self):
+        """Whether the card can be stored in the inventory."""
+        return self.type in ("potion", "weapon")
+
+    @property
+    def can_show_attack_options(self):
+        """Whether the card offers weapon/bare-hands attack choices."""
+        return self.type == "monster"
+
+    def __repr__(self):
+        return f"CardModel({self.suit!r}, {self.value!r})"
@@ -0,0 +1,65 @@
+"""
+entities/card_pool.py
+
+Recycles card views.
+Cards that have left play for good (buried in the discard pile, or swept
+away when a floor ends) are released to the pool, and new cards for the
+room are taken from it, so a long run keeps reusing the same few views
+instead of building one per card dealt.
+"""
+
+from config import CARD_POOL_SIZE
+
+
+class CardPool:
+    """A bounded free list of Card views."""
+
+    def __init__(self, capacity=CARD_POOL_SIZE):
+        """
+        Create an empty pool.
+
+        Args:
+            capacity: Most views kept; any released beyond this are dropped
+        """
+        self.capacity = capacity
+        self._free = []
+
+        # Views built and views reused, for reporting
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, suit, value, floor_type="dungeon", model=None):
+        """
+        Get a view of a card, reusing a released one if there is one.
+        Same arguments as the Card constructor.
+        """
+        if self._free:
+            card = self._free.pop()
+            card.reset(suit, value, floor_type, model)
+            self.reused += 1
+            return card
+
+        # Imported here: entities.card pulls in core, whose managers use the pool
+        from entities.card import Card
+
+        self.created += 1
+        return Card(suit, value, floor_type, model=model)
+
+    def release(self, card):
+        """
+        Give back a view whose card has left play. Nothing may still refer
+        to it: it is handed out again as a different card.
+        """
+        if len(self._free) < self.capacity:
+            self._free.append(card)
+
+    def clear(self):
+        """Drop every free view."""
+        self._free.clear()
+
+    def __len__(self):
+        return len(self._free)
+
+
+# The game's single card pool
+card_pool = CardPool()
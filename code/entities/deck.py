@@ -1,10 +1,14 @@
 import pygame
 import random
-
+from collections import deque
 
 from config import *
 
+from core.display import canvas_draw, display
 from core.resource_loader import ResourceLoader
+from entities.card import CardTextures
+from entities.deck_composition import DeckComposition
+from core.deck_odds import DeckOdds
 
 class Deck:
     """ Represents a deck of cards in the game. """
@@ -13,13 +17,23 @@ class Deck:
 
         self.floor = floor
         self.position = DECK_POSITION
-        self.cards = []
+        self.cards = deque()
+        self.composition = DeckComposition()
+        self.known_composition = DeckComposition()
+        self.odds = DeckOdds(self)
         self.card_stack = []
         self.card_spacing = (0, 3)
-        self.texture = ResourceLoader.load_image("cards/card_back.png")
-        self.texture = pygame.transform.scale(self.texture, (CARD_WIDTH, CARD_HEIGHT))
+        self.texture = CardTextures.back()
         self.rect = pygame.Rect(self.position[0], self.position[1], CARD_WIDTH, CARD_HEIGHT)
 
+        # The stack drawn once into one surface; rebuilt when it changes
+        self._stack_surface = None
+        self._stack_key = None
+
+        # (texture, cards taken off the end) -> patches of the new last card
+        # the removed cards showed through
+        self._shrink_patches = {}
+
     def initialise_deck(self):
         """Initialise the deck for a floor."""
         self.cards = []
@@ -27,6 +41,9 @@ class Deck:
         self._generate_random_deck()
 
         random.shuffle(self.cards)
+        self.cards = deque(self.cards)
+        self.composition.reset(self.cards)
+        self.known_composition.reset()
         self.initialise_visuals()
 
     def _generate_random_deck(self):
@@ -68,6 +85,20 @@ class Deck:
                 card_counts[card_key] = current_count + 1
                 cards_added += 1
 
+    def restore(self, cards, known_count=0):
+        """
+        Restore the deck's remaining cards from a saved run.
+
+        Args:
+            cards: Card dicts in draw order
+            known_count: How many of the last cards were put back by running
+        """
+        cards = list(cards)
+        self.cards = deque(cards)
+        self.composition.reset(cards)
+        self.known_composition.reset(cards[len(cards) - known_count:])
+        self.initialise_visuals()
+
     def initialise_visuals(self):
         self.card_stack = []
         for i in range(len(self.cards)):
@@ -75,45 +106,221 @@ class Deck:
             self.card_stack.append(card_pos)
 
     def draw_card(self):
-        if self.cards:
-            return self.cards.pop(0)
-        return None
+        if not self.cards:
+            return None
+
+        # Once the unseen cards run out, draws come from the known run-back cards
+        drawing_known = len(self.cards) == len(self.known_composition)
+
+        card_data = self.cards.popleft()
+        self.composition.remove(card_data["suit"], card_data["value"])
+        if drawing_known:
+            self.known_composition.remove(card_data["suit"], card_data["value"])
+
+        return card_data
 
     def add_to_bottom(self, card_data):
+        """Put a card under the deck, where the player knows it is."""
         self.cards.append(card_data)
+        self.composition.add(card_data["suit"], card_data["value"])
+        self.known_composition.add(card_data["suit"], card_data["value"])
 
     def draw(self, surface):
 
         if self.card_stack:
-            for i, pos in enumerate(self.card_stack):
-                surface.blit(self.texture, pos)
+            key = (len(self.card_stack), self.card_stack[0], self.texture)
+            if key != self._stack_key:
+                self._compose_stack(key)
+
+            left, top = self.card_stack[0]
+            height = self.card_stack[-1][1] - top + self.texture.get_height()
+            surface.blit(self._stack_surface, (left, top), (0, 0, self._stack_surface.get_width(), height))
         else:
 
-            pygame.draw.rect(surface, GRAY, self.rect, 2)
+            canvas_draw.rect(surface, GRAY, self.rect, 2)
+
+    def _compose_stack(self, key):
+        """
+        Draw the stack into one surface. Cards added to the end of the stack
+        are drawn over what is there and cards taken off the end are cleared
+        away; any other change redraws it.
+        """
+        left, top = self.card_stack[0]
+        width = self.texture.get_width()
+        height = self.card_stack[-1][1] - top + self.texture.get_height()
+
+        previous = self._stack_key
+        same_stack = previous is not None and key[1:] == previous[1:]
+
+        surface = self._stack_surface
+        if surface is None or surface.get_width() != width or surface.get_height() < height:
+            # Sized for a full deck so it is made once per texture
+            full_height = self.card_spacing[1] * (DECK_TOTAL_COUNT - 1) + self.texture.get_height()
+            self._stack_surface = display.retain(pygame.Surface((width, max(height, full_height)), pygame.SRCALPHA))
+            self._redraw_stack()
+        elif same_stack and key[0] > previous[0]:
+            for x, y in self.card_stack[previous[0]:]:
+                surface.blit(self.texture, (x - left, y - top))
+        elif same_stack and key[0] < previous[0]:
+            self._shrink_stack(previous[0] - key[0])
+        else:
+            surface.fill((0, 0, 0, 0))
+            self._redraw_stack()
+        self._stack_key = key
+        display.changed(self._stack_surface)
+
+    def _redraw_stack(self):
+        """Draw every card of the stack into its surface."""
+        left, top = self.card_stack[0]
+        for x, y in self.card_stack:
+            self._stack_surface.blit(self.texture, (x - left, y - top))
+
+    def _shrink_stack(self, removed):
+        """
+        Take cards off the end of the drawn stack: clear the strip they
+        showed below the new last card and draw that card again over them.
+        Where its pixels are transparent the removed cards showed through,
+        so the stack is redrawn under just those patches.
+
+        Args:
+            removed: How many cards came off the end
+        """
+        surface = self._stack_surface
+        left, top = self.card_stack[0]
+        last_x, last_y = self.card_stack[-1][0] - left, self.card_stack[-1][1] - top
+        bottom = last_y + self.texture.get_height()
+
+        surface.fill((0, 0, 0, 0), (0, bottom, surface.get_width(), removed * self.card_spacing[1]))
+        surface.blit(self.texture, (last_x, last_y))
+
+        patches = self._shrink_patches.get((self.texture, removed))
+        if patches is None:
+            patches = self._shrink_patches[self.texture, removed] = self._uncovered_patches(removed)
+
+        for patch in patches:
+            patch = patch.move(last_x, last_y)
+            surface.fill((0, 0, 0, 0), patch)
+            first = len(self.card_stack) - 1
+            while first > 0 and self.card_stack[first - 1][1] - top + self.texture.get_height() > patch.top:
+                first -= 1
+            for x, y in self.card_stack[first:]:
+                surface.blit(self.texture, patch.topleft, patch.move(left - x, top - y))
+
+    def _uncovered_patches(self, removed):
+        """
+        Rects of a card, relative to it, where it is transparent and one of
+        the removed cards after it is not.
+
+        Args:
+            removed: How many cards came off after it
+        """
+        solid = pygame.mask.from_surface(self.texture)
+        holes = solid.copy()
+        holes.invert()
+        shown = pygame.mask.Mask(holes.get_size())
+        for i in range(1, removed + 1):
+            offset = (self.card_spacing[0] * i, self.card_spacing[1] * i)
+            shown.draw(holes.overlap_mask(solid, offset), (0, 0))
+        return shown.get_bounding_rects()
 
 class DiscardPile:
-    """Represents a discard pile in the game."""
+    """
+    Represents a discard pile in the game.
+    Only the top DISCARD_LIVE_CARDS are kept as Card objects; cards beneath
+    them are kept as their CardModel and drawn once into a composite.
+    """
 
     def __init__(self):
         self.position = DISCARD_POSITION
-        self.cards = []
         self.card_spacing = (0, -3)
         self.rect = pygame.Rect(self.position[0], self.position[1], CARD_WIDTH, CARD_HEIGHT)
 
+        # Every discarded card's model, bottom first
+        self.models = []
+
+        # The top cards, bottom first
+        self.cards = deque()
+
+        # Cards under the live ones, drawn into one surface whose bottom
+        # edge lines up with the bottom of the first card
+        self._composite = None
+        self._composite_bottom = self.position[1] + CARD_HEIGHT
+
     def add_card(self, card):
+        """
+        Put a card on top of the pile.
+
+        Returns:
+            Cards that have been demoted to models and are no longer live
+        """
+        self.models.append(card.model)
         self.cards.append(card)
 
+        demoted = []
+        while len(self.cards) > DISCARD_LIVE_CARDS:
+            buried = self.cards.popleft()
+            self._bury(buried.texture, len(self.models) - len(self.cards) - 1)
+            demoted.append(buried)
+        return demoted
+
+    def add_model(self, model, texture):
+        """
+        Put a card straight into the buried part of the pile, as when
+        restoring a run. Only valid while there are no live cards.
+
+        Args:
+            model: The card's CardModel
+            texture: Its face texture
+        """
+        self.models.append(model)
+        self._bury(texture, len(self.models) - 1)
+
+    def clear(self):
+        self.models = []
+        self.cards = deque()
+        self._composite = None
+
     def get_card_count(self):
-        return len(self.cards)
+        return len(self.models)
+
+    def _bury(self, texture, index):
+        """Draw a card into the composite at its place in the pile."""
+        x = self.position[0]
+        y = self.position[1] + index * self.card_spacing[1]
+
+        width = texture.get_width()
+        height = self._composite_bottom - y
+        if self._composite is None or width > self._composite.get_width() or height > self._composite.get_height():
+            self._grow_composite(max(width, CARD_WIDTH), height)
+
+        top = self._composite_bottom - self._composite.get_height()
+        self._composite.blit(texture, (x - self.position[0], y - top))
+        display.changed(self._composite)
+
+    def _grow_composite(self, width, height):
+        """Make the composite at least this big, with room for more layers."""
+        height += -self.card_spacing[1] * 16
+        grown = pygame.Surface((width, height), pygame.SRCALPHA)
+        if self._composite is not None:
+            grown.blit(self._composite, (0, height - self._composite.get_height()))
+        self._composite = display.retain(grown)
 
     def draw(self, surface):
-        if self.cards:
-            for i, card in enumerate(self.cards):
+        if self.models:
+            first = len(self.models) - len(self.cards)
+            if first:
+                # Only the part of the composite that has cards in it
+                top = self.position[1] + (first - 1) * self.card_spacing[1]
+                offset = top - (self._composite_bottom - self._composite.get_height())
+                area = (0, offset, self._composite.get_width(), self._composite_bottom - top)
+                surface.blit(self._composite, (self.position[0], top), area)
+
+            for i, card in enumerate(self.cards, first):
                 pos = (self.position[0], self.position[1] + i * self.card_spacing[1])
                 surface.blit(card.texture, pos)
         else:
 
-            pygame.draw.rect(surface, GRAY, self.rect, 2)
+            canvas_draw.rect(surface, GRAY, self.rect, 2)
 
 def extract_weapons():
 
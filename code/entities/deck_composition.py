@@ -0,0 +1,87 @@
+"""
+entities/deck_composition.py
+
+Running histogram of the cards left in a deck.
+Updated one card at a time as the deck is drawn from or refilled, so the
+counts never need a rescan of the deck itself. Pygame-free.
+"""
+
+from entities.card_model import card_type_for_suit
+
+MAX_CARD_VALUE = 14
+CARD_TYPES = ("monster", "weapon", "potion")
+
+
+class DeckComposition:
+    """Counts per suit/value and per type, plus monster and potion HP totals."""
+
+    __slots__ = ("counts", "type_counts", "type_values", "monster_hp", "potion_hp", "total")
+
+    def __init__(self, cards=()):
+        """
+        Create a composition, optionally seeded from card data.
+
+        Args:
+            cards: Iterable of card dicts with "suit" and "value" keys
+        """
+        self.reset(cards)
+
+    def reset(self, cards=()):
+        """Rebuild the histogram from scratch."""
+        self.counts = {}
+        self.type_counts = dict.fromkeys(CARD_TYPES, 0)
+        self.type_values = {card_type: [0] * (MAX_CARD_VALUE + 1) for card_type in CARD_TYPES}
+        self.monster_hp = 0
+        self.potion_hp = 0
+        self.total = 0
+
+        for card_data in cards:
+            self.add(card_data["suit"], card_data["value"])
+
+    def add(self, suit, value):
+        """Count one more card."""
+        self._adjust(suit, value, 1)
+
+    def remove(self, suit, value):
+        """Count one card fewer."""
+        self._adjust(suit, value, -1)
+
+    def _adjust(self, suit, value, delta):
+        """Apply a +1/-1 change for one card to every counter."""
+        key = (suit, value)
+        count = self.counts.get(key, 0) + delta
+        if count:
+            self.counts[key] = count
+        else:
+            del self.counts[key]
+        self.total += delta
+
+        card_type = card_type_for_suit(suit)
+        if card_type not in self.type_counts:
+            return
+
+        self.type_counts[card_type] += delta
+        self.type_values[card_type][value] += delta
+
+        if card_type == "monster":
+            self.monster_hp += value * delta
+        elif card_type == "potion":
+            self.potion_hp += value * delta
+
+    def count(self, suit, value):
+        """Number of copies of a suit/value left."""
+        return self.counts.get((suit, value), 0)
+
+    def count_type(self, card_type):
+        """Number of cards of a type left."""
+        return self.type_counts.get(card_type, 0)
+
+    def count_at_least(self, card_type, value):
+        """Number of cards of a type with a value of at least `value`."""
+        values = self.type_values.get(card_type)
+        if values is None:
+            return 0
+        return sum(values[max(value, 0):])
+
+    def __len__(self):
+        return self.total
@@ -74,10 +74,8 @@ class Room:
                 card.update_position(card_position)
 
     def get_card_at_position(self, position):
-        for card in reversed(sorted(self.cards, key=lambda c: c.z_index)):
-            if card.rect.collidepoint(position):
-                return card
-        return None
+        hits = [card for card in self.cards if card.rect.collidepoint(position)]
+        return max(hits, key=lambda c: c.z_index) if hits else None
 
     def draw(self, surface):
 
@@ -89,6 +87,5 @@ class Room:
         for card in sorted_cards:
             if card.is_hovered and card.face_up:
 
-                if (hasattr(card, 'can_add_to_inventory') and card.can_add_to_inventory) or \
-                    (hasattr(card, 'can_show_attack_options') and card.can_show_attack_options):
+                if card.can_add_to_inventory or card.can_show_attack_options:
                     card.draw_hover_text(surface)
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+input/action_queue.py
+
+Player actions issued while the board is still animating.
+A click is turned into a semantic action when it happens (which card, which
+half of it), held in a small bounded queue and carried out once the
+animations settle, so a fast second click is no longer thrown away.
+"""
+
+from collections import deque
+
+from config import INPUT_ACTION_QUEUE_LIMIT
+
+
+class QueuedAction:
+    """A click, resolved to what it meant at the moment it was made."""
+
+    RESOLVE_CARD = "resolve_card"
+    USE_INVENTORY = "use_inventory"
+    DISCARD_WEAPON = "discard_weapon"
+    RUN = "run"
+
+    def __init__(self, kind, card=None, pos=None):
+        """
+        Create an action.
+
+        Args:
+            kind: One of the action kinds above
+            card: Card the action targets, if any
+            pos: Mouse position of the click
+        """
+        self.kind = kind
+        self.card = card
+
+        # When the click was read, if latency instrumentation is on
+        self.read_at = None
+
+        # Where on the card the click landed, measured from its floating
+        # centre, so the same half is picked after the card has moved
+        self.offset = None
+        if card is not None and pos is not None:
+            centre_x, centre_y = self._visual_centre(card)
+            self.offset = (pos[0] - centre_x, pos[1] - centre_y)
+
+    def position(self):
+        """The click position translated to where the card is now."""
+        if self.card is None or self.offset is None:
+            return None
+        centre_x, centre_y = self._visual_centre(self.card)
+        return (centre_x + self.offset[0], centre_y + self.offset[1])
+
+    @staticmethod
+    def _visual_centre(card):
+        """Centre of the card as drawn, including its float offsets."""
+        return (
+            card.rect.centerx,
+            card.rect.centery - (card.idle_float_offset + card.hover_float_offset)
+        )
+
+
+class ActionQueue:
+    """Bounded FIFO of QueuedActions."""
+
+    def __init__(self, limit=INPUT_ACTION_QUEUE_LIMIT):
+        """
+        Create an empty queue.
+
+        Args:
+            limit: Most actions held at once; further ones are refused
+        """
+        self.limit = limit
+        self._actions = deque()
+        self.dropped = 0
+
+    def push(self, action):
+        """
+        Queue an action.
+
+        Returns:
+            True if it was queued, False if the queue was full
+        """
+        if len(self._actions) >= self.limit:
+            self.dropped += 1
+            return False
+        self._actions.append(action)
+        return True
+
+    def pop(self):
+        """Take the oldest action, or None when empty."""
+        return self._actions.popleft() if self._actions else None
+
+    def clear(self):
+        self._actions.clear()
+
+    def __len__(self):
+        return len(self._actions)
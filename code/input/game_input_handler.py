@@ -1,6 +1,12 @@
+import time
+
 import pygame
 from pygame.locals import MOUSEMOTION, MOUSEBUTTONDOWN
 
+from core import latency
+from core.card_registry import CardLocation
+from input.action_queue import ActionQueue, QueuedAction
+
 
 class GameInputHandler:
     """
@@ -15,70 +21,110 @@ class GameInputHandler:
         self.inventory_manager = inventory_manager
         self.run_button = run_button
 
+        # The one card showing its hover state, if any
+        self.hovered_card = None
+
+        # Latest cursor position not yet applied to hover states, and
+        # when the first motion since the last hover pass was read
+        self.pending_motion = None
+        self.pending_motion_read_at = None
+
+        # Whether that motion has been held back by an animation
+        self.pending_motion_held = False
+
+        # Clicks waiting for the board to stop animating
+        self.action_queue = ActionQueue()
+
+        # Per-frame input timing and motion coalescing counters
+        self.frame_input_ms = 0.0
+        self._input_seconds = 0.0
+        self.motion_events = 0
+        self.hover_passes = 0
+
     def handle_event(self, event, animation_manager):
         """
         Main event dispatcher.
+        Mouse motion is only recorded here; the hover pass runs once per
+        frame in process(). Clicks made while cards are still animating
+        are queued instead of dropped.
 
         Args:
             event: pygame event to process
             animation_manager: Used to check if animations are blocking input
         """
-        # Block input during animations
-        if animation_manager.is_animating():
-            return
+        started = time.perf_counter()
 
         if event.type == MOUSEMOTION:
-            self._handle_hover(event)
+            if self.pending_motion is None:
+                self.pending_motion_read_at = latency.current()
+            self.pending_motion = event.pos
+            self.motion_events += 1
         elif event.type == MOUSEBUTTONDOWN and event.button == 1:
-            self._handle_click(event)
+            self._handle_click(event, animation_manager)
+
+        self._input_seconds += time.perf_counter() - started
 
-    def _handle_hover(self, event):
+    def process(self, animation_manager):
         """
-        Handle mouse hover events over interactive elements.
-        Updates hover states for cards and buttons.
+        Apply the frame's input once the board is idle: hover at the latest
+        cursor position, then any queued actions in order. Call once per
+        frame from the playing state's update.
 
         Args:
-            event: pygame MOUSEMOTION event
+            animation_manager: Used to check if animations are blocking input
         """
-        mouse_pos = event.pos
+        started = time.perf_counter()
+
+        if not animation_manager.is_animating():
+            if self.pending_motion is not None:
+                self._handle_hover(self.pending_motion)
+                self.pending_motion = None
+                self.pending_motion_read_at = None
+                self.pending_motion_held = False
+                self.hover_passes += 1
+
+            # Each action usually starts animations, which holds the rest
+            # back until they finish
+            while self.action_queue and not animation_manager.is_animating():
+                self._execute(self.action_queue.pop(), held=True)
+        elif self.pending_motion is not None:
+            self.pending_motion_held = True
+
+        self.frame_input_ms = (self._input_seconds + time.perf_counter() - started) * 1000
+        self._input_seconds = 0.0
+
+    def is_idle(self):
+        """Whether no motion or clicks are waiting to be applied."""
+        return self.pending_motion is None and not self.action_queue
+
+    def _handle_hover(self, mouse_pos):
+        """
+        Handle mouse hover over interactive elements.
+        Updates hover states for cards and buttons.
 
-        # Check if inventory is full for visual feedback
-        inventory_is_full = len(self.session.inventory) >= self.session.max_inventory_size
-
-        # Collect all potentially hoverable cards
-        all_hoverable_cards = []
-
-        # Process room cards
-        for card in self.session.room.cards:
-            self._update_card_availability(card, inventory_is_full)
-            card.is_hovered = False
-            if card.rect.collidepoint(mouse_pos):
-                all_hoverable_cards.append(card)
-
-        # Process inventory cards
-        for card in self.session.inventory:
-            card.is_hovered = False
-            if card.rect.collidepoint(mouse_pos):
-                all_hoverable_cards.append(card)
-
-        # Process equipped weapon
-        if self.session.has_weapon():
-            weapon_card = self.session.equipped_weapon
-            weapon_card.is_hovered = False
-            if weapon_card.rect.collidepoint(mouse_pos):
-                all_hoverable_cards.append(weapon_card)
-
-        # Process defeated monsters
-        for monster in self.session.defeated_monsters:
-            monster.is_hovered = False
-            if monster.rect.collidepoint(mouse_pos):
-                all_hoverable_cards.append(monster)
-
-        # Find and highlight the closest card to cursor
-        if all_hoverable_cards:
-            closest_card = self._find_closest_card(mouse_pos, all_hoverable_cards)
-            if closest_card:
-                closest_card.check_hover(mouse_pos)
+        Args:
+            mouse_pos: Latest mouse position
+        """
+        # Only the cards under the cursor are looked at
+        candidates = self.session.card_locations.cards_at(mouse_pos)
+        closest_card = self._find_closest_card(mouse_pos, candidates)
+
+        # Only the card losing the hover and the one gaining it change
+        hover_changed = False
+        if closest_card is not self.hovered_card:
+            if self.hovered_card is not None:
+                self.hovered_card.is_hovered = False
+            self.hovered_card = closest_card
+            hover_changed = True
+
+        if closest_card:
+            if self.session.location_of(closest_card) == CardLocation.ROOM:
+                inventory_is_full = len(self.session.inventory) >= self.session.max_inventory_size
+                self._update_card_availability(closest_card, inventory_is_full)
+            hover_changed = closest_card.check_hover(mouse_pos) or hover_changed
+
+        if hover_changed:
+            latency.mark("hover_held" if self.pending_motion_held else "hover", self.pending_motion_read_at)
 
         # Update run button hover state
         self.run_button.check_hover(mouse_pos)
@@ -92,7 +138,7 @@ class GameInputHandler:
             inventory_is_full: Whether the inventory has space
         """
         # Update weapon attack options
-        if hasattr(card, 'can_show_attack_options') and card.can_show_attack_options:
+        if card.can_show_attack_options:
             card.weapon_available = self.session.has_weapon()
 
             # Check if weapon attack is viable based on last defeated monster
@@ -103,7 +149,7 @@ class GameInputHandler:
                 card.weapon_attack_not_viable = False
 
         # Update inventory availability
-        if hasattr(card, 'can_add_to_inventory') and card.can_add_to_inventory:
+        if card.can_add_to_inventory:
             card.inventory_available = not inventory_is_full
 
     def _find_closest_card(self, pos, cards):
@@ -130,11 +176,7 @@ class GameInputHandler:
             card_center_y = card.rect.centery
 
             # Account for floating animations
-            total_float_offset = 0
-            if hasattr(card, 'idle_float_offset') and hasattr(card, 'hover_float_offset'):
-                total_float_offset = card.idle_float_offset + card.hover_float_offset
-
-            card_center_y -= total_float_offset
+            card_center_y -= card.idle_float_offset + card.hover_float_offset
 
             # Calculate squared distance (no need for sqrt since we're comparing)
             dist_sq = (pos[0] - card_center_x) ** 2 + (pos[1] - card_center_y) ** 2
@@ -145,12 +187,13 @@ class GameInputHandler:
 
         return closest_card
 
-    def _handle_click(self, event):
+    def _handle_click(self, event, animation_manager):
         """
         Handle mouse click events on interactive elements.
 
         Args:
             event: pygame MOUSEBUTTONDOWN event
+            animation_manager: Used to check if animations are blocking input
         """
         mouse_pos = event.pos
 
@@ -158,91 +201,86 @@ class GameInputHandler:
         if self.session.life_points <= 0:
             return
 
-        # Check run button
-        if self._try_run_button_click(mouse_pos):
-            return
-
-        # Check room cards
-        if self._try_room_card_click(mouse_pos):
-            return
-
-        # Check inventory cards
-        if self._try_inventory_card_click(mouse_pos):
+        action = self._action_at(mouse_pos)
+        if action is None:
             return
+        action.read_at = latency.current()
 
-        # Check equipped weapon
-        if self._try_weapon_click(mouse_pos):
-            return
+        # Keep actions in order behind anything already waiting
+        if animation_manager.is_animating() or self.action_queue:
+            self.action_queue.push(action)
+        else:
+            self._execute(action)
 
-    def _try_run_button_click(self, mouse_pos):
+    def _action_at(self, mouse_pos):
         """
-        Check if run button was clicked and execute run action.
+        Work out what a click means, checking the run button, room cards,
+        inventory cards and the equipped weapon in that order.
 
         Args:
             mouse_pos: Mouse position
 
         Returns:
-            True if run button was clicked and action taken
+            A QueuedAction, or None if the click does nothing
         """
-        can_run = (
-            not self.session.ran_last_turn and
-            len(self.session.room.cards) == 4
-        )
+        if self._can_run() and self.run_button.is_clicked(mouse_pos):
+            return QueuedAction(QueuedAction.RUN)
 
-        if can_run and self.run_button.is_clicked(mouse_pos):
-            self.room_manager.run_from_room()
-            return True
+        card = self.session.card_locations.card_at(mouse_pos, CardLocation.ROOM)
+        if card:
+            # A card still being dealt face down can't be chosen yet
+            if not (card.face_up or card.is_flipping):
+                return None
+            return QueuedAction(QueuedAction.RESOLVE_CARD, card, mouse_pos)
 
-        return False
+        card = self.inventory_manager.get_inventory_card_at_position(mouse_pos)
+        if card:
+            return QueuedAction(QueuedAction.USE_INVENTORY, card, mouse_pos)
 
-    def _try_room_card_click(self, mouse_pos):
-        """
-        Check if a room card was clicked and resolve it.
+        weapon = self.session.card_locations.card_at(mouse_pos, CardLocation.EQUIPPED)
+        if weapon is not None and weapon is self.session.equipped_weapon:
+            return QueuedAction(QueuedAction.DISCARD_WEAPON, weapon)
 
-        Args:
-            mouse_pos: Mouse position
+        return None
 
-        Returns:
-            True if a card was clicked and resolved
-        """
-        card = self.session.room.get_card_at_position(mouse_pos)
-        if card:
-            self.card_action_manager.resolve_card(card, event_pos=mouse_pos)
-            return True
-
-        return False
+    def _can_run(self):
+        """Check whether the room can be run from."""
+        return (
+            not self.session.ran_last_turn and
+            len(self.session.room.cards) == 4
+        )
 
-    def _try_inventory_card_click(self, mouse_pos):
+    def _execute(self, action, held=False):
         """
-        Check if an inventory card was clicked and use it.
+        Carry out an action, provided its target is still where it was
+        when the player clicked.
 
         Args:
-            mouse_pos: Mouse position
-
-        Returns:
-            True if an inventory card was used
+            action: QueuedAction to perform
+            held: Whether it waited in the queue for animations to finish
         """
-        clicked_card = self.inventory_manager.get_inventory_card_at_position(mouse_pos)
-        if clicked_card:
-            self.card_action_manager.use_inventory_card(clicked_card, mouse_pos)
-            return True
+        label = "action_held" if held else "action"
 
-        return False
+        if self.session.life_points <= 0:
+            self.action_queue.clear()
+            return
 
-    def _try_weapon_click(self, mouse_pos):
-        """
-        Check if equipped weapon was clicked to discard it.
+        if action.kind == QueuedAction.RUN:
+            if self._can_run():
+                latency.mark(label, action.read_at)
+                self.room_manager.run_from_room()
 
-        Args:
-            mouse_pos: Mouse position
+        elif action.kind == QueuedAction.RESOLVE_CARD:
+            if self.session.location_of(action.card) == CardLocation.ROOM:
+                latency.mark(label, action.read_at)
+                self.card_action_manager.resolve_card(action.card, event_pos=action.position())
 
-        Returns:
-            True if weapon was clicked and discarded
-        """
-        if self.session.has_weapon():
-            weapon = self.session.equipped_weapon
-            if weapon.rect.collidepoint(mouse_pos):
-                self.card_action_manager.discard_equipped_weapon()
-                return True
+        elif action.kind == QueuedAction.USE_INVENTORY:
+            if self.session.location_of(action.card) == CardLocation.INVENTORY:
+                latency.mark(label, action.read_at)
+                self.card_action_manager.use_inventory_card(action.card, action.position())
 
-        return False
\ No newline at end of file
+        elif action.kind == QueuedAction.DISCARD_WEAPON:
+            if self.session.equipped_weapon is action.card:
+                latency.mark(label, action.read_at)
+                self.card_action_manager.discard_equipped_weapon()
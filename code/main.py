@@ -4,43 +4,103 @@ Entry point for the game
 """
 
 import asyncio
+import os
 import sys
 import pygame
-from pygame.locals import QUIT
+from pygame.locals import QUIT, VIDEORESIZE
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from core import latency
+from core.alloc_tracker import tracker as allocations
+from core.display import display
+from core.frame_pacer import FramePacer
 from core.game_manager import GameManager
+from core.profiler import TRACE_ENV_VAR, profiler
 
 
 async def main():
     """Main entry point for the game."""
     pygame.init()
 
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Installed first so the Surfaces and Fonts the game creates, the
+    # display's canvas included, are tracked
+    allocations.configure_from_environment()
+
+    display.open()
     pygame.display.set_caption("Scoundrel - The 52-Card Roguelike Dungeon Crawler")
-    clock = pygame.time.Clock()
+    pacer = FramePacer(pygame.time.Clock())
 
     game_manager = GameManager()
+    profiler.configure_from_environment()
+
+    probe = latency.enable() if latency.enabled_by_environment() else latency.NULL_PROBE
 
     running = True
     while running:
-        delta_time = clock.tick(FPS) / 1000.0
-        
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                running = False
-            else:
-                game_manager.handle_event(event)
-        
-        game_manager.update(delta_time)
-        game_manager.draw(screen)
-        pygame.display.flip()
+        running = run_frame(game_manager, pacer, probe)
         
         await asyncio.sleep(0)
 
+    if probe is not latency.NULL_PROBE:
+        print("\n".join(probe.report()))
+
+    if profiler.enabled and os.environ.get(TRACE_ENV_VAR):
+        profiler.export_chrome_trace()
+
+    if allocations.enabled:
+        print(f"Surface allocation report written to {allocations.dump()}")
+
     pygame.quit()
     sys.exit()
 
 
+def run_frame(game_manager, pacer, probe=latency.NULL_PROBE):
+    """
+    Run one frame of the game. Returns False once the window is closed.
+
+    With a latency probe every input is stamped and every phase of a drawn
+    frame is timed; the default probe does nothing.
+    """
+    running = True
+    delta_time, events, redraw = pacer.next_frame(game_manager)
+    probe.begin_frame()
+    
+    with profiler.scope("frame"):
+        with profiler.scope("input"):
+            for event in events:
+                event = display.remap_event(event)
+                if event.type == QUIT:
+                    running = False
+                elif event.type == VIDEORESIZE:
+                    display.resize()
+                elif not (profiler.handle_key(event) or allocations.handle_key(event)):
+                    probe.read_input()
+                    game_manager.handle_event(event)
+                    probe.input_handled()
+        probe.lap("events")
+        
+        game_manager.update(delta_time)
+        probe.lap("update")
+
+        # A throttled frame with the board frozen looks like the last one
+        if redraw:
+            state_name = game_manager.states.name_of(game_manager.current_state)
+            screen = display.canvas
+            game_manager.draw(screen)
+            profiler.draw_overlay(screen)
+            allocations.draw_overlay(screen)
+            probe.draw_overlay(screen, state_name)
+            probe.lap("draw")
+
+            with profiler.scope("flip"):
+                display.present()
+            probe.lap("flip")
+            probe.end_frame(state_name)
+
+    profiler.end_frame()
+    allocations.end_frame()
+
+    return running
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -6,6 +6,7 @@ No more dict nonsense, no more z_index madness.
 """
 
 from config import WEAPON_POSITION
+from core.card_registry import CardLocation
 
 
 class CardActionManager:
@@ -67,9 +68,7 @@ class CardActionManager:
 
     def _clicked_top_half(self, card, event_pos):
         """Check if click was on top half of card."""
-        total_float = 0
-        if hasattr(card, 'idle_float_offset') and hasattr(card, 'hover_float_offset'):
-            total_float = card.idle_float_offset + card.hover_float_offset
+        total_float = card.idle_float_offset + card.hover_float_offset
         
         center_y = card.rect.centery - total_float
         return event_pos[1] < center_y
@@ -97,7 +96,7 @@ class CardActionManager:
         damage = monster.value
         
         # Remove from room
-        self.session.room.remove_card(monster)
+        self.session.remove_from_room(monster, CardLocation.DISCARD)
         
         # Take damage
         if damage > 0:
@@ -118,7 +117,7 @@ class CardActionManager:
         monster_value = monster.value
         
         # Remove from room
-        self.session.room.remove_card(monster)
+        self.session.remove_from_room(monster)
         
         # Calculate damage (weapon reduces it)
         damage = max(0, monster_value - weapon_value)
@@ -128,7 +127,6 @@ class CardActionManager:
             self.animation_controller.animate_health_change(True, damage)
         
         # Add to defeated stack
-        monster.is_defeated = True
         self.session.add_defeated_monster(monster)
         
         # Position monster on weapon stack
@@ -153,12 +151,9 @@ class CardActionManager:
         # Get old equipment
         old_weapon, old_monsters = self.session.equip_weapon(weapon)
         
-        # Mark as equipped
-        weapon.is_equipped = True
-        
         # Animate to weapon position
         def finalize():
-            self.session.room.remove_card(weapon)
+            self.session.remove_from_room(weapon)
         
         self.animation_controller.animate_card_movement(
             weapon,
@@ -194,7 +189,6 @@ class CardActionManager:
         weapon, monsters = self.session.unequip_weapon()
         
         if weapon:
-            weapon.is_equipped = False
             self.playing_state.show_message(f"{weapon.name} discarded")
             self.animation_controller.animate_card_to_discard(weapon)
             
@@ -215,7 +209,7 @@ class CardActionManager:
         heal_amount = potion.value
         
         # Remove from room
-        self.session.room.remove_card(potion)
+        self.session.remove_from_room(potion, CardLocation.DISCARD)
         
         # Heal player
         actual = self.session.change_health(heal_amount)
@@ -235,10 +229,9 @@ class CardActionManager:
             return False
         
         card.is_selected = True
-        card.in_inventory = True
         
         # Remove from room
-        self.session.room.remove_card(card)
+        self.session.remove_from_room(card)
         
         # Animate to inventory
         self.animation_controller.animate_card_to_inventory(card)
@@ -250,7 +243,7 @@ class CardActionManager:
 
     def use_inventory_card(self, card, event_pos=None):
         """Use a card from inventory."""
-        if card not in self.session.inventory:
+        if self.session.location_of(card) != CardLocation.INVENTORY:
             return
         
         card.is_selected = True
@@ -261,7 +254,6 @@ class CardActionManager:
             discard_only = self._clicked_top_half(card, event_pos)
         
         # Remove from inventory
-        card.in_inventory = False
         self.session.remove_from_inventory(card)
         self.playing_state.inventory_manager.position_inventory_cards()
         
@@ -269,32 +261,37 @@ class CardActionManager:
         if card.type == "weapon":
             if discard_only:
                 self.playing_state.show_message(f"{card.name} discarded")
-                self.animation_controller.animate_card_to_discard(card)
+                self._discard_inventory_card(card)
             else:
                 card.update_scale(1.0)
-                self.session.room.add_card(card)
+                self.session.add_to_room(card)
                 self.equip_weapon(card)
         
         elif card.type == "potion":
             if discard_only:
                 self.playing_state.show_message(f"{card.name} discarded")
-                self.animation_controller.animate_card_to_discard(card)
+                self._discard_inventory_card(card)
             else:
                 actual = self.session.change_health(card.value)
                 if actual > 0:
                     self.animation_controller.animate_health_change(False, actual)
                 self.playing_state.show_message(f"Used {card.name}. Restored {actual} health.")
-                self.animation_controller.animate_card_to_discard(card)
+                self._discard_inventory_card(card)
         
         else:
             # Unknown type - just discard
             self.playing_state.show_message(f"{card.name} discarded")
-            self.animation_controller.animate_card_to_discard(card)
+            self._discard_inventory_card(card)
 
     # ========================================================================
     # Helpers
     # ========================================================================
 
+    def _discard_inventory_card(self, card):
+        """Send a card that just left the inventory to the discard pile."""
+        self.session.move_card(card, CardLocation.DISCARD)
+        self.animation_controller.animate_card_to_discard(card)
+
     def _reposition_room_cards(self):
         """Reposition remaining room cards with animation."""
         if len(self.session.room.cards) > 0:
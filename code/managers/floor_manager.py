@@ -1,4 +1,4 @@
-from config import FLOOR_NAMES, FLOOR_TOTAL
+from config import FLOOR_NAMES, FLOOR_TOTAL, ENDLESS_RUN
 import random
 
 class FloorManager:
@@ -11,24 +11,47 @@ class FloorManager:
         self.current_room = 1
         self.total_floors = FLOOR_TOTAL
 
+        # Endless runs go round the floor list instead of ending
+        self.endless = ENDLESS_RUN
+
     def initialise_run(self):
         """Initialise a new run with randomised floor order."""
         self.current_floor_index = 0
 
         self.current_room = 1
+        self.endless = ENDLESS_RUN
         return self.get_current_floor()
 
+    def restore(self, floors, current_floor_index, current_room, endless=False):
+        """Restore the floor list and position from a saved run."""
+        self.floors = list(floors)
+        self.current_floor_index = current_floor_index
+        self.current_room = current_room
+        self.endless = endless
+
     def get_current_floor(self):
         """Get the current floor type."""
-        if not self.floors or self.current_floor_index >= len(self.floors):
+        if not self.floors or (self.current_floor_index >= len(self.floors) and not self.endless):
 
             if not self.floors:
                 self.initialise_run()
 
-            if not self.floors or self.current_floor_index >= len(self.floors):
+            if not self.floors or (self.current_floor_index >= len(self.floors) and not self.endless):
                 return "dungeon"
 
-        return self.floors[self.current_floor_index]
+        return self._floor_at(self.current_floor_index)
+
+    def has_next_floor(self):
+        """Whether clearing this floor leads to another rather than ending the run."""
+        return self.endless or self.current_floor_index + 1 < len(self.floors)
+
+    def get_next_floor(self):
+        """Get the floor type after the current one."""
+        return self._floor_at(self.current_floor_index + 1)
+
+    def _floor_at(self, index):
+        """The floor type at a position in the run; endless runs wrap around."""
+        return self.floors[index % len(self.floors)]
 
     def advance_room(self):
         """Move to the next room in the current floor."""
@@ -49,7 +72,7 @@ class FloorManager:
 
         self.current_room = 1
 
-        if self.current_floor_index >= len(self.floors):
+        if self.current_floor_index >= len(self.floors) and not self.endless:
             return {"run_complete": True}
 
         if hasattr(self.game_manager, 'states') and 'playing' in self.game_manager.states:
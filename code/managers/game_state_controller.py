@@ -1,5 +1,6 @@
 import pygame
 
+from core.text_cache import TextCache
 
 class GameStateController:
     """Manages game state transitions and UI messages."""
@@ -28,7 +29,7 @@ class GameStateController:
             font = pygame.font.Font(None, 36)
         
         # Create message surface
-        message_surface = font.render(text, True, (255, 255, 255))
+        message_surface = TextCache.render(font, text, True, (255, 255, 255))
         message_rect = message_surface.get_rect()
         
         # Position in center
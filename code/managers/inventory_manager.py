@@ -1,4 +1,5 @@
 from config import *
+from core.card_registry import CardLocation
 
 
 class InventoryManager:
@@ -36,15 +37,9 @@ class InventoryManager:
             y = start_y
             
             card.update_position((int(x), int(y)))
-            
-            if hasattr(card, 'update_scale'):
-                card.update_scale(INVENTORY_CARD_SCALE)
+            card.update_scale(INVENTORY_CARD_SCALE)
 
     def get_inventory_card_at_position(self, position):
         """Get inventory card at mouse position."""
-        # Check in reverse order (top card first)
-        for card in reversed(self.session.inventory):
-            if card.rect.collidepoint(position):
-                return card
-        
-        return None
+        # Later cards stack on top, which the hit index layers already reflect
+        return self.session.card_locations.card_at(position, CardLocation.INVENTORY)
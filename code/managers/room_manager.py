@@ -5,8 +5,11 @@ Works directly with GameSession.
 No more fake sessions, no more set_playing_state_ref hacks!
 """
 
+from itertools import islice
+
 from config import *
-from entities.card import Card
+from entities.card_pool import card_pool
+from entities.deck import Deck
 
 
 class RoomManager:
@@ -15,6 +18,13 @@ class RoomManager:
     def __init__(self, playing_state):
         """Initialize with reference to playing state."""
         self.playing_state = playing_state
+        
+        # Cards built ahead of time for upcoming deck entries:
+        # id(card_data) -> (card_data, card)
+        self._prepared_cards = {}
+        
+        # (floor type, Deck) dealt ahead for the next floor
+        self._next_floor = None
 
     @property
     def session(self):
@@ -44,7 +54,7 @@ class RoomManager:
         self.session.start_new_room()
         
         # Clear room
-        self.session.room.clear()
+        self.session.clear_room()
         
         # Handle carried card
         if carried_card:
@@ -62,7 +72,7 @@ class RoomManager:
 
     def _position_carried_card(self, card):
         """Position a card carried from previous room."""
-        self.session.room.add_card(card)
+        self.session.add_to_room(card)
         card.face_up = True
         
         # Calculate first position
@@ -86,9 +96,8 @@ class RoomManager:
             # Draw card data
             card_data = self.session.deck.draw_card()
             
-            # Create card
-            floor_type = card_data.get("floor_type", self.session.current_floor)
-            card = Card(card_data["suit"], card_data["value"], floor_type)
+            # Create card, or take the one built ahead for it
+            card = self._take_prepared_card(card_data)
             card.face_up = False
             
             # Position at deck
@@ -98,7 +107,7 @@ class RoomManager:
                 card.update_position(self.session.deck.position)
             
             # Add to room
-            self.session.room.add_card(card)
+            self.session.add_to_room(card)
             
             # Calculate target position
             pos_index = i + (1 if has_carried else 0)
@@ -140,11 +149,96 @@ class RoomManager:
         
         return positions
 
+    def place_room_cards(self):
+        """Put the room's cards straight into their slots without animating."""
+        positions = self._calculate_positions(len(self.session.room.cards))
+        for card, position in zip(self.session.room.cards, positions):
+            card.update_position(position)
+
     def _update_deck_visuals(self):
         """Update deck visual representation."""
         if hasattr(self.session.deck, 'initialise_visuals'):
             self.session.deck.initialise_visuals()
 
+    # ========================================================================
+    # Lookahead
+    # ========================================================================
+
+    def prepare_ahead(self):
+        """
+        Do one piece of the upcoming rooms' setup ahead of time: deal the next
+        floor's deck once the floor is complete, or build the Card for the
+        next upcoming deck entry that doesn't have one. Called on frames with
+        nothing else going on, so room starts only pick up finished work.
+
+        Returns:
+            True if anything was prepared
+        """
+        floor_manager = self.playing_state.game_manager.floor_manager
+        
+        if self.session.floor_complete:
+            if not floor_manager.has_next_floor():
+                return False
+            
+            next_floor = floor_manager.get_next_floor()
+            if self._next_floor is None or self._next_floor[0] != next_floor:
+                deck = Deck(next_floor)
+                deck.initialise_deck()
+                self._next_floor = (next_floor, deck)
+                return True
+            deck = self._next_floor[1]
+        else:
+            deck = self.session.deck
+        
+        for card_data in islice(deck.cards, 4):
+            entry = self._prepared_cards.get(id(card_data))
+            if entry is None or entry[0] is not card_data:
+                self._prepared_cards[id(card_data)] = (card_data, self._build_card(card_data))
+                return True
+        return False
+
+    def clear_lookahead(self):
+        """Drop everything prepared ahead, as when a new session starts."""
+        for _, card in self._prepared_cards.values():
+            card_pool.release(card)
+        self._prepared_cards = {}
+        self._next_floor = None
+
+    def take_next_floor_deck(self, floor_type):
+        """
+        Hand over the deck dealt ahead for a floor.
+
+        Returns:
+            The Deck, or None if none was dealt for that floor
+        """
+        next_floor, self._next_floor = self._next_floor, None
+        if next_floor is None or next_floor[0] != floor_type:
+            return None
+        
+        # Cards built for the old deck won't be drawn now
+        deck = next_floor[1]
+        kept = {}
+        for card_data in islice(deck.cards, 4):
+            entry = self._prepared_cards.pop(id(card_data), None)
+            if entry is not None and entry[0] is card_data:
+                kept[id(card_data)] = entry
+        for _, card in self._prepared_cards.values():
+            card_pool.release(card)
+        self._prepared_cards = kept
+        return deck
+
+    def _take_prepared_card(self, card_data):
+        """The Card built ahead for a deck entry, or a new one."""
+        entry = self._prepared_cards.pop(id(card_data), None)
+        if entry is not None and entry[0] is card_data:
+            return entry[1]
+        return self._build_card(card_data)
+
+    def _build_card(self, card_data):
+        """Create the Card for a deck entry, reusing a pooled view."""
+        floor_type = card_data.get("floor_type", self.session.current_floor)
+        return card_pool.acquire(card_data["suit"], card_data["value"], floor_type)
+
     # ========================================================================
     # Run Action
     # ========================================================================
@@ -184,8 +278,7 @@ class RoomManager:
             )
             
             # Add to bottom of deck
-            card_data = {"suit": card.suit, "value": card.value}
-            self.session.deck.add_to_bottom(card_data)
+            self.session.return_to_deck(card)
         
         # Update deck visuals
         self._update_deck_visuals()
@@ -199,7 +292,7 @@ class RoomManager:
     def _complete_run(self):
         """Complete the run action."""
         # Clear room
-        self.session.room.clear()
+        self.session.clear_room()
         
         # Mark that we ran
         self.session.ran_last_turn = True
@@ -221,17 +314,4 @@ class RoomManager:
 
     def remove_and_discard(self, card):
         """Remove a card from play and discard it."""
-        # Remove from room
-        if card in self.session.room.cards:
-            self.session.room.remove_card(card)
-        
-        # Remove from defeated monsters
-        if card in self.session.defeated_monsters:
-            self.session.defeated_monsters.remove(card)
-        
-        # Remove from equipped weapon
-        if self.session.equipped_weapon == card:
-            self.session.equipped_weapon = None
-        
-        # Add to discard pile
-        self.session.discard_pile.add_card(card)
+        self.session.discard_card(card)
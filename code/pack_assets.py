@@ -0,0 +1,37 @@
+"""
+Scoundrel - offline asset packer
+
+Decodes every PNG under assets/ into one memory-mappable archive
+(assets/assets.pak) that ResourceLoader uses instead of the loose files.
+Re-run after changing any image.
+
+Usage: python pack_assets.py [output_path]
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSET_ARCHIVE_PATH
+from core.asset_archive import pack_assets
+
+
+def main():
+    """Pack the assets folder."""
+    output_path = sys.argv[1] if len(sys.argv) > 1 else ASSET_ARCHIVE_PATH
+
+    # A display mode is needed to know the pixel format surfaces will use
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    count, size = pack_assets(output_path)
+    print(f"Packed {count} images into {output_path} ({size / 1024 / 1024:.1f} MB)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,8 +11,12 @@ from config import (
     FLOOR_WIDTH, FLOOR_HEIGHT,
     INVENTORY_PANEL_WIDTH, INVENTORY_PANEL_HEIGHT,
     INVENTORY_PANEL_X, INVENTORY_PANEL_Y,
+    PLAYING_FONT_SIZES,
     WHITE, BLACK, LIGHT_GRAY
 )
+from core.display import canvas_draw
+from core.profiler import profiler
+from core.text_cache import TextCache
 from ui.panel import Panel
 
 
@@ -67,10 +71,14 @@ class GameRenderer:
             surface: pygame Surface to draw on
             message: Optional message to display (dict with text, rect, etc.)
         """
-        self._draw_background(surface)
-        self._draw_game_board(surface)
-        self._draw_inventory(surface)
-        self._draw_ui_overlay(surface, message)
+        with profiler.scope("background"):
+            self._draw_background(surface)
+        with profiler.scope("board"):
+            self._draw_game_board(surface)
+        with profiler.scope("inventory"):
+            self._draw_inventory(surface)
+        with profiler.scope("ui"):
+            self._draw_ui_overlay(surface, message)
 
     def _draw_background(self, surface):
         """
@@ -157,7 +165,7 @@ class GameRenderer:
             surface: pygame Surface to draw on
         """
         inv_rect = self.inventory_panel.rect
-        inv_title = self.ui.body_font.render("Inventory", True, WHITE)
+        inv_title = TextCache.render(self.ui.body_font, "Inventory", True, WHITE)
 
         # Create glow effect
         glow_surface = pygame.Surface(
@@ -251,9 +259,6 @@ class GameRenderer:
 
         # Draw defeated monster tooltips
         for monster in self.session.defeated_monsters:
-            # Mark as defeated for proper display
-            monster.is_defeated = True
-
             if monster.is_hovered and monster.face_up:
                 monster.draw_hover_text(surface)
 
@@ -287,11 +292,11 @@ class GameRenderer:
         button_rect = self.run_button.rect
 
         # Draw grayed out button
-        pygame.draw.rect(surface, LIGHT_GRAY, button_rect, border_radius=5)
-        pygame.draw.rect(surface, BLACK, button_rect, 2, border_radius=5)
+        canvas_draw.rect(surface, LIGHT_GRAY, button_rect, border_radius=5)
+        canvas_draw.rect(surface, BLACK, button_rect, 2, border_radius=5)
 
         # Draw grayed out text
-        button_text = self.ui.body_font.render("RUN", True, (150, 150, 150))
+        button_text = TextCache.render(self.ui.body_font, "RUN", True, (150, 150, 150))
         button_text_rect = button_text.get_rect(center=button_rect.center)
         surface.blit(button_text, button_text_rect)
 
@@ -349,8 +354,8 @@ class GameRenderer:
             message: Dict with text and rect
         """
         # Draw background
-        pygame.draw.rect(surface, BLACK, message["bg_rect"], border_radius=8)
-        pygame.draw.rect(surface, WHITE, message["bg_rect"], 2, border_radius=8)
+        canvas_draw.rect(surface, BLACK, message["bg_rect"], border_radius=8)
+        canvas_draw.rect(surface, WHITE, message["bg_rect"], 2, border_radius=8)
 
         # Draw text
         surface.blit(message["text"], message["rect"])
@@ -397,27 +402,20 @@ class UIComponents:
         """
         # Load fonts
         fonts = {
-            'title': resource_loader.load_font("fonts/Pixel Times.ttf", 60),
-            'header': resource_loader.load_font("fonts/Pixel Times.ttf", 36),
-            'body': resource_loader.load_font("fonts/Pixel Times.ttf", 28),
-            'caption': resource_loader.load_font("fonts/Pixel Times.ttf", 24),
-            'normal': resource_loader.load_font("fonts/Pixel Times.ttf", 20),
+            name: resource_loader.load_font("fonts/Pixel Times.ttf", size)
+            for name, size in PLAYING_FONT_SIZES.items()
         }
 
         # Load and scale background
-        background = resource_loader.load_image("bg.png")
-        if background.get_width() != screen_width or background.get_height() != screen_height:
-            background = pygame.transform.scale(background, (screen_width, screen_height))
+        background = resource_loader.load_scaled("bg.png", (screen_width, screen_height))
 
         # Load and scale floor image
         floor_image_path = f"floors/{floor_type}_floor.png"
         try:
-            floor = resource_loader.load_image(floor_image_path)
+            floor = resource_loader.load_scaled(floor_image_path, (floor_width, floor_height))
         except:
             # Fallback to default floor
-            floor = resource_loader.load_image("floor.png")
-
-        floor = pygame.transform.scale(floor, (floor_width, floor_height))
+            floor = resource_loader.load_scaled("floor.png", (floor_width, floor_height))
 
         images = {
             'background': background,
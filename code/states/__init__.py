@@ -1,19 +1,26 @@
 """
 Game states
+
+The state classes are imported on first access so that importing one state
+module does not pull in every other state's dependencies.
 """
 
-from .title_state import TitleState
-from .rules_state import RulesState
-from .tutorial_state import TutorialState
-from .floor_start_state import FloorStartState
-from .game_over_state import GameOverState
-from .playing_state import PlayingState
+import importlib
+
+_STATE_MODULES = {
+    'TitleState': '.title_state',
+    'RulesState': '.rules_state',
+    'TutorialState': '.tutorial_state',
+    'FloorStartState': '.floor_start_state',
+    'GameOverState': '.game_over_state',
+    'PlayingState': '.playing_state',
+}
+
+__all__ = list(_STATE_MODULES)
+
 
-__all__ = [
-    'TitleState',
-    'RulesState',
-    'TutorialState',
-    'FloorStartState',
-    'GameOverState',
-    'PlayingState',
-]
\ No newline at end of file
+def __getattr__(name):
+    module_name = _STATE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -1,4 +1,5 @@
 from core.game_state import GameState
+from core.text_cache import TextCache
 
 class FloorStartState(GameState):
     """The floor starting screen where players begin a new floor."""
@@ -78,15 +79,15 @@ class FloorStartState(GameState):
 
         floor_type = self.game_manager.floor_manager.get_current_floor()
         floor_index = max(1, self.game_manager.floor_manager.current_floor_index + 1)
-        title_text = self.header_font.render(f"Floor {floor_index}: {floor_type.title()}", True, WHITE)
+        title_text = TextCache.render(self.header_font, f"Floor {floor_index}: {floor_type.title()}", True, WHITE)
         title_rect = title_text.get_rect(centerx=self.panels["main"].rect.centerx, top=self.panels["main"].rect.top + 30)
         surface.blit(title_text, title_rect)
 
-        welcome_text = self.body_font.render(f"Welcome to the {floor_type.title()}", True, WHITE)
+        welcome_text = TextCache.render(self.body_font, f"Welcome to the {floor_type.title()}", True, WHITE)
         welcome_rect = welcome_text.get_rect(centerx=self.panels["main"].rect.centerx, top=title_rect.bottom + 30)
         surface.blit(welcome_text, welcome_rect)
 
-        instruct_text = self.normal_font.render("Prepare yourself for the challenges ahead!", True, WHITE)
+        instruct_text = TextCache.render(self.normal_font, "Prepare yourself for the challenges ahead!", True, WHITE)
         instruct_rect = instruct_text.get_rect(centerx=self.panels["main"].rect.centerx, top=welcome_rect.bottom + 20)
         surface.blit(instruct_text, instruct_rect)
 
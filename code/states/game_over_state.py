@@ -4,11 +4,10 @@ import random
 
 from config import *
 
+from core.display import display, canvas_draw
 from core.game_state import GameState
 from core.resource_loader import ResourceLoader
-
-from states.playing_state import PlayingState
-from states.title_state import TitleState
+from core.text_cache import TextCache
 
 from ui.panel import Panel
 from ui.button import Button
@@ -21,14 +20,18 @@ class GameOverState(GameState):
         self.title_font = None
         self.header_font = None
         self.body_font = None
-        self.background = None
-        self.floor = None
 
         self.restart_button = None
         self.title_button = None
 
         self.game_over_panel = None
 
+        # The final board, darkened, captured once on entering
+        self.backdrop = None
+
+        # Result and stats texts with where they go
+        self.texts = []
+
         self.particles = []
 
         self.playing_state = None
@@ -37,6 +40,9 @@ class GameOverState(GameState):
 
         self.playing_state = self.game_manager.states["playing"]
 
+        # The run is over, so there is nothing left to resume
+        self.game_manager.autosaver.clear()
+
         self.title_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 48)
         self.header_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 36)
         self.body_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 24)
@@ -101,8 +107,65 @@ class GameOverState(GameState):
             border_colour=(100, 100, 160)
         )
 
+        self.backdrop = self._capture_backdrop()
+        self.texts = self._layout_texts()
+
+        # The board is captured, so the finished run can go
+        self.playing_state.release_run()
+
         self._create_particles()
 
+    def exit(self):
+        """Let the captured board and the screen's effects go."""
+        self.backdrop = None
+        self.texts = []
+        self.particles = []
+        self.playing_state = None
+
+    def _capture_backdrop(self):
+        """
+        Draw the final board (or, without one, the background and a floor)
+        once, darkened, so each frame is a single blit.
+        """
+        backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+        if self.playing_state.session is not None:
+            self.playing_state.draw(backdrop)
+        else:
+            backdrop.blit(ResourceLoader.load_scaled("bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+
+            random_floor_type = random.choice(FLOOR_TYPES)
+            try:
+                floor = ResourceLoader.load_scaled(f"floors/{random_floor_type}_floor.png", (FLOOR_WIDTH, FLOOR_HEIGHT))
+            except Exception:
+                floor = ResourceLoader.load_scaled("floor.png", (FLOOR_WIDTH, FLOOR_HEIGHT))
+            backdrop.blit(floor, ((SCREEN_WIDTH - FLOOR_WIDTH)/2, (SCREEN_HEIGHT - FLOOR_HEIGHT)/2))
+
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        backdrop.blit(overlay, (0, 0))
+        return display.retain(backdrop)
+
+    def _layout_texts(self):
+        """Render the result and stats texts and place them in the panel."""
+        if self.game_manager.game_data["victory"]:
+            result_text = TextCache.render(self.title_font, "VICTORY!", True, (180, 255, 180))
+            subtitle_text = TextCache.render(self.header_font, "You have conquered the dungeon", True, WHITE)
+        else:
+            result_text = TextCache.render(self.title_font, "DEFEATED", True, (255, 180, 180))
+            subtitle_text = TextCache.render(self.header_font, "Your adventure ends here...", True, WHITE)
+
+        result_rect = result_text.get_rect(centerx=SCREEN_WIDTH//2, top=self.game_over_panel.rect.top + 32)
+        subtitle_rect = subtitle_text.get_rect(centerx=SCREEN_WIDTH//2, top=result_rect.bottom + 20)
+
+        floors_text = TextCache.render(self.body_font, 
+            f"Floors Completed: {self.game_manager.floor_manager.current_floor_index}",
+            True, WHITE
+        )
+        floors_rect = floors_text.get_rect(centerx=SCREEN_WIDTH//2, top=subtitle_rect.bottom + 25)
+
+        return [(result_text, result_rect), (subtitle_text, subtitle_rect), (floors_text, floors_rect)]
+
     def _create_particles(self):
         """Create particles based on victory/defeat state"""
         self.particles = []
@@ -153,7 +216,7 @@ class GameOverState(GameState):
                 self.game_manager.game_data["max_life"] = 20
                 self.game_manager.game_data["victory"] = False
 
-                self.game_manager.states["playing"] = PlayingState(self.game_manager)
+                self.game_manager.states.reset("playing")
 
                 self.game_manager.start_new_run()
 
@@ -163,11 +226,11 @@ class GameOverState(GameState):
                 self.game_manager.game_data["max_life"] = 20
                 self.game_manager.game_data["victory"] = False
 
-                self.game_manager.states["playing"] = PlayingState(self.game_manager)
+                self.game_manager.states.reset("playing")
 
                 self.game_manager.change_state("title")
 
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.mouse_pos()
         if self.restart_button:
             self.restart_button.check_hover(mouse_pos)
         if self.title_button:
@@ -193,46 +256,14 @@ class GameOverState(GameState):
 
     def draw(self, surface):
 
-        if not self.playing_state:
-
-            if not hasattr(self, 'background') or not self.background:
-                self.background = ResourceLoader.load_image("bg.png")
-                if self.background.get_width() != SCREEN_WIDTH or self.background.get_height() != SCREEN_HEIGHT:
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-
-            surface.blit(self.background, (0, 0))
-
-            if not hasattr(self, 'floor') or not self.floor:
-                random_floor_type = random.choice(FLOOR_TYPES)
-                floor_image = f"floors/{random_floor_type}_floor.png"
-
-                try:
-                    self.floor = ResourceLoader.load_image(floor_image)
-                    self.floor = pygame.transform.scale(self.floor, (FLOOR_WIDTH, FLOOR_HEIGHT))
-                except:
-
-                    self.floor = ResourceLoader.load_image("floor.png")
-                    self.floor = pygame.transform.scale(self.floor, (FLOOR_WIDTH, FLOOR_HEIGHT))
-
-            surface.blit(self.floor, ((SCREEN_WIDTH - FLOOR_WIDTH)/2, (SCREEN_HEIGHT - FLOOR_HEIGHT)/2))
-
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            surface.blit(overlay, (0, 0))
-        else:
-
-            self.playing_state.draw(surface)
-
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            surface.blit(overlay, (0, 0))
+        surface.blit(self.backdrop, (0, 0))
 
         for particle in self.particles:
             alpha = int(255 * particle['life'])
 
             r, g, b = particle['colour']
             particle_colour = pygame.Color(r, g, b, alpha)
-            pygame.draw.circle(
+            canvas_draw.circle(
                 surface,
                 particle_colour,
                 (int(particle['x']), int(particle['y'])),
@@ -241,27 +272,8 @@ class GameOverState(GameState):
 
         self.game_over_panel.draw(surface)
 
-        if self.game_manager.game_data["victory"]:
-            result_text = self.title_font.render("VICTORY!", True, (180, 255, 180))
-            subtitle_text = self.header_font.render("You have conquered the dungeon", True, WHITE)
-        else:
-            result_text = self.title_font.render("DEFEATED", True, (255, 180, 180))
-            subtitle_text = self.header_font.render("Your adventure ends here...", True, WHITE)
-
-        result_rect = result_text.get_rect(centerx=SCREEN_WIDTH//2, top=self.game_over_panel.rect.top + 32)
-        surface.blit(result_text, result_rect)
-
-        subtitle_rect = subtitle_text.get_rect(centerx=SCREEN_WIDTH//2, top=result_rect.bottom + 20)
-        surface.blit(subtitle_text, subtitle_rect)
-
-        stats_y = subtitle_rect.bottom + 25
-
-        floors_text = self.body_font.render(
-            f"Floors Completed: {self.game_manager.floor_manager.current_floor_index}",
-            True, WHITE
-        )
-        floors_rect = floors_text.get_rect(centerx=SCREEN_WIDTH//2, top=stats_y)
-        surface.blit(floors_text, floors_rect)
+        for text, rect in self.texts:
+            surface.blit(text, rect)
 
         if self.restart_button:
             self.restart_button.draw(surface)
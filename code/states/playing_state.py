@@ -9,7 +9,11 @@ import pygame
 from config import *
 from core.game_state import GameState
 from core.resource_loader import ResourceLoader
+from core.card_registry import CardLocation
 from core.game_session import GameSession
+from core.profiler import profiler
+from core.snapshot import encode_snapshot
+from entities.card_pool import card_pool
 
 # Managers
 from managers.animation_manager import AnimationManager
@@ -71,27 +75,41 @@ class PlayingState(GameState):
         
         # Temporary flags (TODO: move to session or remove)
         self.room_started_in_enter = False
+        
+        # Card bob held still while the loop is throttled
+        self.idle_motion_held = False
 
     def enter(self):
         """Initialize when entering the playing state."""
+        snapshot = self.game_manager.resume_snapshot
+        self.game_manager.resume_snapshot = None
+        
         # Create/reset game session
         floor_type = self.game_manager.floor_manager.get_current_floor()
         self.session = GameSession(floor_type)
+        self.room_manager.clear_lookahead()
         
-        # Load player state from save data
-        self.session.load_from_dict(self.game_manager.game_data)
+        if snapshot:
+            # Continue a saved run
+            self.session.restore_from_snapshot(snapshot)
+        else:
+            # Load player state from save data
+            self.session.load_from_dict(self.game_manager.game_data)
         
         # Load resources
         self._load_resources()
         
         # Initialize game components
-        self._setup_game_components()
+        self._setup_game_components(new_deck=snapshot is None)
         
         # Initialize subsystems
         self._setup_subsystems()
         
-        # Start first room
-        self._start_initial_room()
+        if snapshot:
+            self._restore_layout()
+        else:
+            # Start first room
+            self._start_initial_room()
 
     def _load_resources(self):
         """Load fonts and images."""
@@ -111,10 +129,10 @@ class PlayingState(GameState):
         self.background = self.ui_components.background
         self.floor = self.ui_components.floor
 
-    def _setup_game_components(self):
+    def _setup_game_components(self, new_deck=True):
         """Initialize deck, room, etc."""
         # Initialize deck
-        if hasattr(self.session.deck, "initialise_deck"):
+        if new_deck and hasattr(self.session.deck, "initialise_deck"):
             self.session.deck.initialise_deck()
         
         if hasattr(self.session.deck, "initialise_visuals"):
@@ -159,6 +177,30 @@ class PlayingState(GameState):
         self.room_manager.start_new_room()
         self.room_started_in_enter = True
 
+    def _restore_layout(self):
+        """Lay out the cards of a restored session."""
+        self.room_manager.place_room_cards()
+        self.inventory_manager.position_inventory_cards()
+        
+        weapon = self.session.equipped_weapon
+        if weapon:
+            weapon.update_position(WEAPON_POSITION)
+            for monster in self.session.defeated_monsters:
+                monster.update_position(WEAPON_POSITION)
+            self.animation_controller.position_monster_stack()
+        
+        # Saved mid-transition: let the normal room flow pick up from here
+        if self.session.is_room_empty() or self.session.has_single_card_remaining():
+            self._process_game_logic(animations_just_finished=True)
+
+    def _autosave(self):
+        """Queue a snapshot of the run for the background writer."""
+        if self.session.is_player_dead():
+            return
+        
+        data = encode_snapshot(self.session, self.game_manager.floor_manager)
+        self.game_manager.autosaver.save(data)
+
     def exit(self):
         """Save state when exiting."""
         if self.session:
@@ -166,6 +208,29 @@ class PlayingState(GameState):
             save_data = self.session.save_to_dict()
             self.game_manager.game_data.update(save_data)
 
+    def release_run(self):
+        """
+        Let go of a finished run: its session and cards, animations, and
+        everything built to draw it. The game over screen calls this once it
+        has captured the final board; enter() builds it all again.
+        """
+        if self.session:
+            for card in self.session.card_locations.forget_location(*CardLocation.ALL):
+                card_pool.release(card)
+        
+        self.room_manager.clear_lookahead()
+        self.animation_manager.clear()
+        
+        self.session = None
+        self.message = None
+        self.renderer = None
+        self.input_handler = None
+        self.status_ui = None
+        self.run_button = None
+        self.ui_components = None
+        self.background = None
+        self.floor = None
+
     # ========================================================================
     # Main Loop
     # ========================================================================
@@ -178,7 +243,8 @@ class PlayingState(GameState):
         """Update game state."""
         # Track animation state
         was_animating = self.animation_manager.is_animating()
-        self.animation_manager.update(delta_time)
+        with profiler.scope("animations"):
+            self.animation_manager.update(delta_time)
         is_animating = self.animation_manager.is_animating()
         animations_just_finished = was_animating and not is_animating
         
@@ -186,19 +252,45 @@ class PlayingState(GameState):
         self._update_message(delta_time)
         
         # Update cards
-        self._update_cards(delta_time)
+        with profiler.scope("cards"):
+            self._update_cards(delta_time)
         
         # Process game logic when animations finish
         if not is_animating:
             self._process_game_logic(animations_just_finished)
+            
+            # Save once each action has fully played out
+            if animations_just_finished:
+                self._autosave()
+        
+        # Hover and any clicks queued during the animations
+        with profiler.scope("input"):
+            self.input_handler.process(self.animation_manager)
         
         # Check for game over
         self.game_state_controller.check_game_over()
+        
+        # Get the next room ready while the player thinks
+        if self.session.floor_complete or self.is_idle():
+            with profiler.scope("lookahead"):
+                self.room_manager.prepare_ahead()
 
     def draw(self, surface):
         """Render the game."""
         self.renderer.render(surface, self.message)
 
+    def is_idle(self):
+        """Idle once nothing animates and no input waits; the card bob doesn't count."""
+        if self.animation_manager.is_animating() or self.message:
+            return False
+        if not self.input_handler.is_idle():
+            return False
+        return all(card.is_settled() for card in self._board_cards())
+
+    def hold_idle_motion(self, held):
+        """Hold the card bob still while the loop is throttled."""
+        self.idle_motion_held = held
+
     # ========================================================================
     # Update Helpers
     # ========================================================================
@@ -227,18 +319,29 @@ class PlayingState(GameState):
                 if self.message['alpha'] <= 0:
                     self.message = None
 
+    def _board_cards(self):
+        """Every card on the board that animates."""
+        cards = self.session.room.cards + self.session.inventory + self.session.defeated_monsters
+        if self.session.equipped_weapon:
+            cards.append(self.session.equipped_weapon)
+        return cards
+
     def _update_cards(self, delta_time):
         """Update all card animations."""
+        # Settled cards only bob, and that is on hold
+        if self.idle_motion_held:
+            return
+        
         # Room cards
         for card in self.session.room.cards:
             card.update(delta_time)
-            if hasattr(card, 'is_flipping') and card.is_flipping:
+            if card.is_flipping:
                 card.update_flip(delta_time)
         
         # Inventory cards
         for card in self.session.inventory:
             card.update(delta_time)
-            if hasattr(card, 'is_flipping') and card.is_flipping:
+            if card.is_flipping:
                 card.update_flip(delta_time)
         
         # Equipped weapon
@@ -297,7 +400,7 @@ class PlayingState(GameState):
         
         # Check if final floor
         floor_manager = self.game_manager.floor_manager
-        is_final = floor_manager.current_floor_index >= len(floor_manager.floors) - 1
+        is_final = not floor_manager.has_next_floor()
         
         if is_final:
             # Victory!
@@ -306,8 +409,7 @@ class PlayingState(GameState):
             self.game_manager.change_state("game_over")
         else:
             # Next floor
-            next_floor_index = floor_manager.current_floor_index + 1
-            next_floor_type = floor_manager.floors[next_floor_index]
+            next_floor_type = floor_manager.get_next_floor()
             
             self.show_message(
                 f"Floor completed! Moving to {next_floor_type.title()}..."
@@ -324,11 +426,12 @@ class PlayingState(GameState):
         self.game_manager.floor_manager.advance_floor()
         next_floor = self.game_manager.floor_manager.get_current_floor()
         
-        # Reset session for new floor
-        self.session.reset_for_new_floor(next_floor)
+        # Reset session for new floor, with the deck dealt during the delay
+        deck = self.room_manager.take_next_floor_deck(next_floor)
+        self.session.reset_for_new_floor(next_floor, deck)
         
         # Reinitialize
-        if hasattr(self.session.deck, "initialise_deck"):
+        if deck is None and hasattr(self.session.deck, "initialise_deck"):
             self.session.deck.initialise_deck()
         
         if hasattr(self.session.deck, "initialise_visuals"):
@@ -5,9 +5,34 @@ from config import *
 
 from core.game_state import GameState
 from core.resource_loader import ResourceLoader
+from core.text_cache import TextCache
 
 from ui.panel import Panel
 
+RULES_PANEL_SIZE = (800, 610)
+
+RULES = [
+    "Welcome to SCOUNDREL",
+    "The card-base roguelike dungeon crawler:",
+    "",
+    "- Each dungeon floor is a deck of cards",
+    "- Each set of 4 cards represents a floor room",
+    "- Cards represent:",
+    "  - Monsters (Clubs & Spades)",
+    "  - Weapons (Diamonds)",
+    "  - Potions (Hearts)",
+    "- You start with 20 life points",
+    "- Equip weapons and defeat monsters",
+    "- Defeat them with weapons and block some damage",
+    "- Or defeat them bare-handed and take full damage",
+    "- Weapons lose durability and can only battle weaker monsters each time",
+    "- Heal health with potions",
+    "- You can run from dangerous rooms before you choose",
+    "- But you cannot run twice in a row",
+    "- Win by surviving until the deck is empty",
+    "- Lose if your health reaches zero"
+]
+
 class RulesState(GameState):
     """The rules screen state of the game."""
 
@@ -22,18 +47,20 @@ class RulesState(GameState):
         self.alpha_direction = True
         self.speed = 40
 
+        # Static screen contents, composed on the first draw
+        self.layout = None
+        self.continue_text = None
+        self.continue_rect = None
+
     def enter(self):
 
         self.header_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 36)
         self.body_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 23)
         self.normal_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 20)
 
-        self.background = ResourceLoader.load_image("bg.png")
-        if self.background.get_width() != SCREEN_WIDTH or self.background.get_height() != SCREEN_HEIGHT:
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = ResourceLoader.load_scaled("bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
-        self.floor = ResourceLoader.load_image("floor.png")
-        self.floor = pygame.transform.scale(self.floor, (FLOOR_WIDTH, FLOOR_HEIGHT))
+        self.floor = ResourceLoader.load_scaled("floor.png", (FLOOR_WIDTH, FLOOR_HEIGHT))
 
     def handle_event(self, event):
         if event.type == MOUSEBUTTONDOWN and event.button == 1:
@@ -45,46 +72,11 @@ class RulesState(GameState):
 
     def draw(self, surface):
 
-        surface.blit(self.background, (0, 0))
-        surface.blit(self.floor, ((SCREEN_WIDTH - self.floor.get_width())/2, (SCREEN_HEIGHT - self.floor.get_height())/2))
-
-        panel = Panel((800, 610), (SCREEN_WIDTH//2-400, SCREEN_HEIGHT//2-305), colour=DARK_GRAY)
-        panel.draw(surface)
-
-        title_text = self.header_font.render("HOW TO PLAY", True, WHITE)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, panel.rect.top + 40))
-        surface.blit(title_text, title_rect)
-
-        rules = [
-            "Welcome to SCOUNDREL",
-            "The card-base roguelike dungeon crawler:",
-            "",
-            "- Each dungeon floor is a deck of cards",
-            "- Each set of 4 cards represents a floor room",
-            "- Cards represent:",
-            "  - Monsters (Clubs & Spades)",
-            "  - Weapons (Diamonds)",
-            "  - Potions (Hearts)",
-            "- You start with 20 life points",
-            "- Equip weapons and defeat monsters",
-            "- Defeat them with weapons and block some damage",
-            "- Or defeat them bare-handed and take full damage",
-            "- Weapons lose durability and can only battle weaker monsters each time",
-            "- Heal health with potions",
-            "- You can run from dangerous rooms before you choose",
-            "- But you cannot run twice in a row",
-            "- Win by surviving until the deck is empty",
-            "- Lose if your health reaches zero"
-        ]
+        if self.layout is None:
+            self._compose_layout()
 
-        y_offset = title_rect.bottom + 10
-        for i, line in enumerate(rules):
-            rule_text = self.normal_font.render(line, True, WHITE)
-            rule_rect = rule_text.get_rect(centerx=panel.rect.centerx, top=y_offset) if i < 2 else rule_text.get_rect(left=panel.rect.left + 40, top=y_offset)
-            surface.blit(rule_text, rule_rect)
-            y_offset += 25
+        surface.blit(self.layout, (0, 0))
 
-        continue_text = self.body_font.render("Left-click to continue...", True, WHITE)
         if self.alpha_direction:
             if self.alpha > 0:
                 self.alpha -= 255/self.speed
@@ -98,9 +90,35 @@ class RulesState(GameState):
                 self.alpha_direction = True
                 self.alpha -= 255/self.speed
 
-        continue_text.set_alpha(self.alpha)
-        continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH//2, panel.rect.bottom - 30))
-        surface.blit(continue_text, continue_rect)
+        # Only the pulsing prompt changes from frame to frame
+        self.continue_text.set_alpha(self.alpha)
+        surface.blit(self.continue_text, self.continue_rect)
+
+    def _compose_layout(self):
+        """Compose the static part of the screen (backdrop, panel, rules) once."""
+
+        self.layout = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+
+        self.layout.blit(self.background, (0, 0))
+        self.layout.blit(self.floor, ((SCREEN_WIDTH - self.floor.get_width())/2, (SCREEN_HEIGHT - self.floor.get_height())/2))
+
+        panel = Panel(RULES_PANEL_SIZE, (SCREEN_WIDTH//2-400, SCREEN_HEIGHT//2-305), colour=DARK_GRAY)
+        panel.draw(self.layout)
+
+        title_text = TextCache.render(self.header_font, "HOW TO PLAY", True, WHITE)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, panel.rect.top + 40))
+        self.layout.blit(title_text, title_rect)
+
+        y_offset = title_rect.bottom + 10
+        for i, line in enumerate(RULES):
+            rule_text = TextCache.render(self.normal_font, line, True, WHITE)
+            rule_rect = rule_text.get_rect(centerx=panel.rect.centerx, top=y_offset) if i < 2 else rule_text.get_rect(left=panel.rect.left + 40, top=y_offset)
+            self.layout.blit(rule_text, rule_rect)
+            y_offset += 25
+
+        # Rendered text is shared through the text cache
+        self.continue_text = TextCache.render(self.body_font, "Left-click to continue...", True, WHITE).copy()
+        self.continue_rect = self.continue_text.get_rect(center=(SCREEN_WIDTH//2, panel.rect.bottom - 30))
 
 def split_image(image_path, output_dir, rows, cols):
     """Split an image into smaller images."""
@@ -5,12 +5,30 @@ from pygame.locals import *
 import random
 
 from config import *
+from core.asset_preloader import PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW
+from core.display import display, canvas_draw
 from core.game_state import GameState
 from core.resource_loader import ResourceLoader
+from core.text_cache import TextCache
+from entities.card_model import POTION_IMAGE_COUNT
+from states.rules_state import RULES_PANEL_SIZE
 
 from ui.button import Button
 from ui.panel import Panel
 
+# Size the title screen's decorative cards draw their artwork at
+TITLE_ART_SIZE = 96
+
+# Dungeon-style panels the playing state creates on entry and first frame:
+# inventory, floor status bar, health display, deck counter and run button
+PLAYING_PANEL_SIZES = (
+    (INVENTORY_PANEL_WIDTH, INVENTORY_PANEL_HEIGHT),
+    (STATUS_PANEL_WIDTH, STATUS_PANEL_HEIGHT),
+    (HEALTH_PANEL_WIDTH, HEALTH_PANEL_HEIGHT),
+    (DECK_COUNT_PANEL_WIDTH, DECK_COUNT_PANEL_HEIGHT),
+    (RUN_BUTTON_WIDTH, RUN_BUTTON_HEIGHT),
+)
+
 class TitleState(GameState):
     """The atmospheric title screen state of the game."""
 
@@ -25,6 +43,7 @@ class TitleState(GameState):
         self.floor = None
         self.title_panel = None
         self.start_button = None
+        self.new_button = None
         self.tutorial_button = None
         self.rules_button = None
 
@@ -56,18 +75,15 @@ class TitleState(GameState):
         self.subtitle_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 36)
         self.body_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 24)
 
-        self.background = ResourceLoader.load_image("bg.png")
-        if self.background.get_width() != SCREEN_WIDTH or self.background.get_height() != SCREEN_HEIGHT:
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = ResourceLoader.load_scaled("bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
-        self.torch_anim = [pygame.transform.scale(ResourceLoader.load_image(f"torch_anim/torch_{i}.png"),(128,128)) for i in range(5)]
+        self.torch_anim = [ResourceLoader.load_scaled(f"torch_anim/torch_{i}.png", (128, 128)) for i in range(5)]
 
         self.torch_anim_indexes = random.sample(range(5), 2)
         self.torches = [self.torch_anim[i] for i in self.torch_anim_indexes]
 
         floor_image = "floor.png"
-        self.floor = ResourceLoader.load_image(floor_image)
-        self.floor = pygame.transform.scale(self.floor, (FLOOR_WIDTH, FLOOR_HEIGHT))
+        self.floor = ResourceLoader.load_scaled(floor_image, (FLOOR_WIDTH, FLOOR_HEIGHT))
 
         panel_width = 730
         panel_height = 500
@@ -90,21 +106,46 @@ class TitleState(GameState):
         button_spacing = 10
         buttons_y = panel_y + panel_height - button_height*3 - button_spacing*2 - 25
 
-        start_button_rect = pygame.Rect(
-            (SCREEN_WIDTH - button_width) // 2,
-            buttons_y,
-            button_width,
-            button_height
-        )
-        self.start_button = Button(
-            start_button_rect,
-            "START ADVENTURE",
-            self.body_font,
-            text_colour=WHITE,
-            dungeon_style=True,
-            panel_colour=(60, 30, 30),
-            border_colour=(150, 70, 70)
-        )
+        # With a run to continue the top row splits into Continue and
+        # New Adventure, so starting over never means editing the save away
+        if self.game_manager.has_saved_run():
+            row_button_width = 260
+            row_left = (SCREEN_WIDTH - row_button_width*2 - button_spacing) // 2
+            self.start_button = Button(
+                pygame.Rect(row_left, buttons_y, row_button_width, button_height),
+                "CONTINUE",
+                self.body_font,
+                text_colour=WHITE,
+                dungeon_style=True,
+                panel_colour=(60, 30, 30),
+                border_colour=(150, 70, 70)
+            )
+            self.new_button = Button(
+                pygame.Rect(row_left + row_button_width + button_spacing, buttons_y, row_button_width, button_height),
+                "NEW ADVENTURE",
+                self.body_font,
+                text_colour=WHITE,
+                dungeon_style=True,
+                panel_colour=(60, 45, 30),
+                border_colour=(150, 110, 70)
+            )
+        else:
+            start_button_rect = pygame.Rect(
+                (SCREEN_WIDTH - button_width) // 2,
+                buttons_y,
+                button_width,
+                button_height
+            )
+            self.start_button = Button(
+                start_button_rect,
+                "START ADVENTURE",
+                self.body_font,
+                text_colour=WHITE,
+                dungeon_style=True,
+                panel_colour=(60, 30, 30),
+                border_colour=(150, 70, 70)
+            )
+            self.new_button = None
 
         tutorial_button_rect = pygame.Rect(
             (SCREEN_WIDTH - button_width) // 2,
@@ -143,6 +184,71 @@ class TitleState(GameState):
         self._load_card_images()
         self._create_animated_cards()
 
+        self._queue_preloads()
+
+    def exit(self):
+        """Let the floating cards and their images go until the title is shown again."""
+        self.cards = []
+        self.particles = []
+        self.card_images = {}
+        self.monster_imgs = []
+        self.weapon_imgs = []
+        self.potion_imgs = []
+
+    def _queue_preloads(self):
+        """
+        Warm everything the playing state loads on entry and on its first
+        frames, so START ADVENTURE goes straight in without a hitch.
+        """
+        preloader = self.game_manager.preloader
+        font_path = "fonts/Pixel Times.ttf"
+
+        # Panel noise is by far the slowest thing the playing state builds.
+        # It is pure Python, so it is rendered in slices on the main thread
+        # rather than on a worker contending with the frame loop for the GIL
+        for panel_size in PLAYING_PANEL_SIZES:
+            if not Panel.has_prepared_noise(panel_size):
+                preloader.add_steps(
+                    lambda texture, size=panel_size: Panel.prepare_noise(size, texture),
+                    Panel.render_noise_steps(panel_size),
+                    priority=PRIORITY_HIGH
+                )
+
+        # The rules screen keeps its panel once composed, but the first
+        # visit would still have to generate the noise
+        if not Panel.has_prepared_noise(RULES_PANEL_SIZE):
+            preloader.add_steps(
+                lambda texture: Panel.prepare_noise(RULES_PANEL_SIZE, texture),
+                Panel.render_noise_steps(RULES_PANEL_SIZE),
+                priority=PRIORITY_LOW
+            )
+
+        for size in PLAYING_FONT_SIZES.values():
+            preloader.add_font(font_path, size, PRIORITY_HIGH)
+
+        preloader.add_image("bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT), PRIORITY_HIGH)
+        preloader.add_image("floor.png", (FLOOR_WIDTH, FLOOR_HEIGHT), PRIORITY_HIGH)
+        preloader.add_image("cards/card_back.png", (CARD_WIDTH, CARD_HEIGHT), PRIORITY_HIGH)
+
+        # Card faces are composed on demand from the card image and its
+        # artwork; having both ready leaves just the blits
+        for suit in SUITS:
+            for value in range(2, 15):
+                preloader.add_image(f"cards/{suit}_{value}.png", priority=PRIORITY_NORMAL)
+
+        for weapon_names in WEAPON_RANK_MAP.values():
+            for weapon_name in weapon_names:
+                preloader.add_image(f"weapons/{weapon_name}.png", (120, 120), PRIORITY_NORMAL)
+        for potion_index in range(1, POTION_IMAGE_COUNT + 1):
+            preloader.add_image(f"potions/{potion_index}.png", (120, 120), PRIORITY_NORMAL)
+
+        for sprite_paths in MONSTER_DIFFICULTY_MAP.values():
+            for sprite_path in sprite_paths:
+                preloader.add_image(sprite_path, (96, 96), PRIORITY_LOW)
+
+        # The states the buttons lead to: import on a worker, build here
+        self.game_manager.states.warm_up("playing", "tutorial", "game_over")
+
     def _create_torch_lights(self):
         """Create torch light effects around the title screen"""
         self.torch_lights = []
@@ -168,14 +274,17 @@ class TitleState(GameState):
     def _load_card_images(self):
         """Load a selection of card images for visual effect"""
         self.card_images = {}
+        self.monster_imgs = []
+        self.weapon_imgs = []
+        self.potion_imgs = []
 
         for monster_class in os.listdir(relative_to_assets("monsters")):
             for monster_name in os.listdir(os.path.join(relative_to_assets("monsters"), monster_class)):
-                self.monster_imgs.append(ResourceLoader.load_image(os.path.join(relative_to_assets("monsters"), monster_class, monster_name), cache=False))
+                self.monster_imgs.append(ResourceLoader.load_scaled(f"monsters/{monster_class}/{monster_name}", (TITLE_ART_SIZE, TITLE_ART_SIZE)))
         for weapon_name in os.listdir(relative_to_assets("weapons")):
-            self.weapon_imgs.append(ResourceLoader.load_image(os.path.join(relative_to_assets("weapons"), weapon_name), cache=False))
+            self.weapon_imgs.append(ResourceLoader.load_scaled(f"weapons/{weapon_name}", (TITLE_ART_SIZE, TITLE_ART_SIZE)))
         for potion_name in os.listdir(relative_to_assets("potions")):
-            self.potion_imgs.append(ResourceLoader.load_image(os.path.join(relative_to_assets("potions"), potion_name), cache=False))
+            self.potion_imgs.append(ResourceLoader.load_scaled(f"potions/{potion_name}", (TITLE_ART_SIZE, TITLE_ART_SIZE)))
 
         for value in range(2, 15):
             key = f"spades_{value}"
@@ -200,8 +309,7 @@ class TitleState(GameState):
         new_surface.blit(card_surf, (0, 0))
 
         monster_img = random.choice(self.monster_imgs)
-        monster_size = 96
-        monster_img = pygame.transform.scale(monster_img, (monster_size, monster_size))
+        monster_size = TITLE_ART_SIZE
         monster_surface = pygame.Surface((monster_size, monster_size), pygame.SRCALPHA)
         monster_surface.blit(monster_img, (0, 0))
 
@@ -216,8 +324,7 @@ class TitleState(GameState):
         new_surface.blit(card_surf, (0, 0))
 
         weapon_img = random.choice(self.weapon_imgs)
-        weapon_size = 96
-        weapon_img = pygame.transform.scale(weapon_img, (weapon_size, weapon_size))
+        weapon_size = TITLE_ART_SIZE
         weapon_surface = pygame.Surface((weapon_size, weapon_size), pygame.SRCALPHA)
         weapon_surface.blit(weapon_img, (0, 0))
 
@@ -232,8 +339,7 @@ class TitleState(GameState):
         new_surface.blit(card_surf, (0, 0))
 
         potion_img = random.choice(self.potion_imgs)
-        potion_size = 96
-        potion_img = pygame.transform.scale(potion_img, (potion_size, potion_size))
+        potion_size = TITLE_ART_SIZE
         potion_surface = pygame.Surface((potion_size, potion_size), pygame.SRCALPHA)
         potion_surface.blit(potion_img, (0, 0))
 
@@ -304,10 +410,12 @@ class TitleState(GameState):
         })
 
     def handle_event(self, event):
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.mouse_pos()
         
         if event.type == MOUSEBUTTONDOWN and event.button == 1:
             self.start_button.check_hover(mouse_pos)
+            if self.new_button:
+                self.new_button.check_hover(mouse_pos)
             self.rules_button.check_hover(mouse_pos)
 
             card_clicked = False
@@ -343,11 +451,11 @@ class TitleState(GameState):
 
             if not card_clicked:
                 if self.start_button.is_clicked(mouse_pos):
-                    if not hasattr(self.game_manager, 'has_shown_tutorial') or not self.game_manager.has_shown_tutorial:
-                        self.game_manager.has_shown_tutorial = True
-                        self.game_manager.change_state("tutorial")
-                    else:
-                        self.game_manager.change_state("playing")
+                    if not (self.game_manager.has_saved_run() and self.game_manager.resume_saved_run()):
+                        self._start_adventure()
+                elif self.new_button and self.new_button.is_clicked(mouse_pos):
+                    self.game_manager.autosaver.clear()
+                    self._start_adventure()
                 elif self.tutorial_button.is_clicked(mouse_pos):
                     self.game_manager.change_state("tutorial_watch")
                 elif self.rules_button.is_clicked(mouse_pos):
@@ -402,13 +510,25 @@ class TitleState(GameState):
         card_under_cursor = any(card['hover'] for card in self.cards)
         if not card_under_cursor:
             self.start_button.check_hover(mouse_pos)
+            if self.new_button:
+                self.new_button.check_hover(mouse_pos)
             self.tutorial_button.check_hover(mouse_pos)
             self.rules_button.check_hover(mouse_pos)
         else:
             self.start_button.hovered = False
+            if self.new_button:
+                self.new_button.hovered = False
             self.tutorial_button.hovered = False
             self.rules_button.hovered = False
 
+    def _start_adventure(self):
+        """Start a new run, through the tutorial the first time"""
+        if not hasattr(self.game_manager, 'has_shown_tutorial') or not self.game_manager.has_shown_tutorial:
+            self.game_manager.has_shown_tutorial = True
+            self.game_manager.change_state("tutorial")
+        else:
+            self.game_manager.change_state("playing")
+
     def _update_particles(self, delta_time):
         """Update the particle effects"""
 
@@ -504,8 +624,10 @@ class TitleState(GameState):
 
     def update(self, delta_time):
 
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.mouse_pos()
         self.start_button.check_hover(mouse_pos)
+        if self.new_button:
+            self.new_button.check_hover(mouse_pos)
         self.tutorial_button.check_hover(mouse_pos)
         self.rules_button.check_hover(mouse_pos)
 
@@ -531,6 +653,22 @@ class TitleState(GameState):
             y = random.uniform(self.title_panel.rect.top + 50, self.title_panel.rect.bottom - 50)
             self._add_particle(x, y)
 
+    def _draw_preload_progress(self, surface):
+        """Thin progress line under the start button while assets preload"""
+        preloader = self.game_manager.preloader
+        if preloader.is_done:
+            return
+
+        rect = self.start_button.rect
+        bar_width = int((rect.width - 20) * preloader.progress)
+        canvas_draw.line(
+            surface,
+            (150, 70, 70),
+            (rect.left + 10, rect.bottom - 6),
+            (rect.left + 10 + bar_width, rect.bottom - 6),
+            2
+        )
+
     def draw(self, surface):
 
         surface.blit(self.background, (0, 0))
@@ -612,7 +750,7 @@ class TitleState(GameState):
         glow_intensity = int(40 + 30 * self.title_glow)
         glow_colour = (255, 200, 50, glow_intensity)
 
-        title_text = self.title_font.render("SCOUNDREL", True, WHITE)
+        title_text = TextCache.render(self.title_font, "SCOUNDREL", True, WHITE)
         title_rect = title_text.get_rect(centerx=SCREEN_WIDTH//2, top=self.title_panel.rect.top + 50)
 
         glow_size = 15
@@ -631,7 +769,7 @@ class TitleState(GameState):
         surface.blit(glow_surface, glow_rect)
         surface.blit(title_text, title_rect)
 
-        subtitle_text = self.subtitle_font.render("The 52-Card Dungeon Crawler", True, WHITE)
+        subtitle_text = TextCache.render(self.subtitle_font, "The 52-Card Dungeon Crawler", True, WHITE)
         subtitle_rect = subtitle_text.get_rect(centerx=SCREEN_WIDTH//2, top=title_rect.bottom + 40)
         surface.blit(subtitle_text, subtitle_rect)
 
@@ -717,7 +855,7 @@ class TitleState(GameState):
 
         max_width = 600
 
-        test_text = self.body_font.render(tagline, True, (200, 200, 200))
+        test_text = TextCache.render(self.body_font, tagline, True, (200, 200, 200))
 
         if test_text.get_width() > max_width:
 
@@ -731,8 +869,8 @@ class TitleState(GameState):
 
             line2 = " ".join(words[break_point:])
 
-            line1_text = self.body_font.render(line1, True, (200, 200, 200))
-            line2_text = self.body_font.render(line2, True, (200, 200, 200))
+            line1_text = TextCache.render(self.body_font, line1, True, (200, 200, 200))
+            line2_text = TextCache.render(self.body_font, line2, True, (200, 200, 200))
 
             line1_rect = line1_text.get_rect(centerx=SCREEN_WIDTH//2, top=subtitle_rect.bottom + 15)
             line2_rect = line2_text.get_rect(centerx=SCREEN_WIDTH//2, top=line1_rect.bottom + 5)
@@ -741,18 +879,22 @@ class TitleState(GameState):
             surface.blit(line2_text, line2_rect)
         else:
 
-            tagline_text = self.body_font.render(tagline, True, (200, 200, 200))
+            tagline_text = TextCache.render(self.body_font, tagline, True, (200, 200, 200))
             tagline_rect = tagline_text.get_rect(centerx=SCREEN_WIDTH//2, top=subtitle_rect.bottom + 25)
             surface.blit(tagline_text, tagline_rect)
 
         self.start_button.draw(surface)
+        if self.new_button:
+            self.new_button.draw(surface)
         self.tutorial_button.draw(surface)
         self.rules_button.draw(surface)
 
+        self._draw_preload_progress(surface)
+
         for particle in self.particles:
             alpha = int(255 * particle['life'])
             particle_colour = (*particle['colour'], alpha)
-            pygame.draw.circle(
+            canvas_draw.circle(
                 surface,
                 particle_colour,
                 (int(particle['x']), int(particle['y'])),
@@ -4,13 +4,16 @@ import random
 
 from config import *
 
+from core.display import canvas_draw, display
 from core.game_state import GameState
 from core.resource_loader import ResourceLoader
+from core.text_cache import TextCache
 
 from entities.card import Card
 
 from ui.panel import Panel
 from ui.button import Button
+from ui.text_layout import TextLayout
 
 class TutorialState(GameState):
     """Tutorial state with typing text, animated merchant, and demo UI."""
@@ -117,9 +120,8 @@ class TutorialState(GameState):
             }
         ]
         
-        self.text_line_num = 1
         self.line_height = 30
-        self.final_line_str = ""
+        self.text_layout = None
         
         self.demo_cards = []
         self.demo_weapon = None
@@ -136,21 +138,20 @@ class TutorialState(GameState):
         self.body_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 24)
         self.name_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 20)
         
-        self.background = ResourceLoader.load_image("bg.png")
-        if self.background.get_width() != SCREEN_WIDTH or self.background.get_height() != SCREEN_HEIGHT:
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.background = ResourceLoader.load_scaled("bg.png", (SCREEN_WIDTH, SCREEN_HEIGHT))
         
-        self.floor = ResourceLoader.load_image("floor.png")
-        self.floor = pygame.transform.scale(self.floor, (FLOOR_WIDTH, FLOOR_HEIGHT))
+        self.floor = ResourceLoader.load_scaled("floor.png", (FLOOR_WIDTH, FLOOR_HEIGHT))
         
         self.merchant_image = ResourceLoader.load_image("hires/Merchant.png")
         merchant_scale = 14
-        self.merchant_image = pygame.transform.scale(self.merchant_image, (int(self.merchant_image.get_width()*merchant_scale), int(self.merchant_image.get_height()*merchant_scale)))
+        self.merchant_image = display.retain(pygame.transform.scale(self.merchant_image, (int(self.merchant_image.get_width()*merchant_scale), int(self.merchant_image.get_height()*merchant_scale))))
         
         self.merchant_base_pos = (SCREEN_WIDTH - self.merchant_image.get_width() - 50, SCREEN_HEIGHT - self.merchant_image.get_height() - 40)
         
         self._create_ui()
         
+        self.text_layout = TextLayout(self.body_font, WHITE, self.dialogue_panel.rect.width - 40, self.line_height)
+        
         self._start_dialogue(0)
 
     def _create_demo_cards(self):
@@ -284,6 +285,7 @@ class TutorialState(GameState):
         if index < len(self.dialogues):
             self.current_dialogue_index = index
             self.target_text = self.dialogues[index]["text"]
+            self.text_layout.set_text(self.target_text)
             self.current_text = ""
             self.char_index = 0
             self.typing_timer = 0
@@ -322,9 +324,9 @@ class TutorialState(GameState):
         elif graphic_type == "show 4 cards and run button":
             self._create_demo_cards()
             run_rect = pygame.Rect(
-                self.demo_position[0] - 45,
-                self.demo_position[1] - 90,
-                90, 45
+                self.demo_position[0] - RUN_BUTTON_WIDTH // 2,
+                self.demo_position[1] - 2 * RUN_BUTTON_HEIGHT,
+                RUN_BUTTON_WIDTH, RUN_BUTTON_HEIGHT
             )
             self.demo_run_button = Button(
                 run_rect,
@@ -433,7 +435,7 @@ class TutorialState(GameState):
         self.name_panel.draw(surface)
         
         speaker_name = self.dialogues[self.current_dialogue_index]["speaker"]
-        name_text = self.name_font.render(speaker_name, True, WHITE)
+        name_text = TextCache.render(self.name_font, speaker_name, True, WHITE)
         name_rect = name_text.get_rect(center=self.name_panel.rect.center)
         surface.blit(name_text, name_rect)
         
@@ -443,7 +445,7 @@ class TutorialState(GameState):
             cursor_x, cursor_y = self._get_cursor_position()
             if pygame.time.get_ticks() % 1000 < 500:  # Blinking cursor
                 cursor_rect = pygame.Rect(cursor_x, cursor_y, 2, 20)
-                pygame.draw.rect(surface, WHITE, cursor_rect)
+                canvas_draw.rect(surface, WHITE, cursor_rect)
                 
         if self.typing_complete:
             self.next_button.draw(surface)
@@ -479,7 +481,7 @@ class TutorialState(GameState):
                         max_x - min_x + padding * 2,
                         max_y - min_y + padding * 2
                     )
-                    pygame.draw.rect(surface, (255, 215, 0), highlight_rect, 3, border_radius=5)
+                    canvas_draw.rect(surface, (255, 215, 0), highlight_rect, 3, border_radius=5)
                     
         if self.demo_weapon:
             self.demo_weapon.draw(surface)
@@ -491,66 +493,28 @@ class TutorialState(GameState):
         if self.demo_run_button:
             highlight_padding = 8
             highlight_rect = self.demo_run_button.rect.inflate(highlight_padding * 2, highlight_padding * 2)
-            pygame.draw.rect(surface, (255, 215, 0), highlight_rect, 3, border_radius=8)
+            canvas_draw.rect(surface, (255, 215, 0), highlight_rect, 3, border_radius=8)
             
             self.demo_run_button.draw(surface)
             
         if self.demo_inventory_panel:
             self.demo_inventory_panel.draw(surface)
             
-            inv_title = self.body_font.render("Inventory", True, WHITE)
+            inv_title = TextCache.render(self.body_font, "Inventory", True, WHITE)
             title_rect = inv_title.get_rect(
                 centerx=self.demo_inventory_panel.rect.centerx,
                 centery=self.demo_inventory_panel.rect.centery - 70
             )
             surface.blit(inv_title, title_rect)
                 
-    def _draw_wrapped_text(self, surface, text):
-        """Draw text with word wrapping inside the dialogue panel."""
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        max_width = self.dialogue_panel.rect.width - 40
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            text_surface = self.body_font.render(test_line, True, WHITE)
-            
-            if text_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(word)
-                    
-        if current_line:
-            lines.append(' '.join(current_line))
-            
-        y_offset = self.dialogue_panel.rect.top + 30
-        
-        for line in lines:
-            text_surface = self.body_font.render(line, True, WHITE)
-            text_rect = text_surface.get_rect(
-                left=self.dialogue_panel.rect.left + 20,
-                top=y_offset
-            )
-            surface.blit(text_surface, text_rect)
-            y_offset += self.line_height
-        
-        if self.text_line_num != len(lines):
-            self.text_line_num = len(lines)
+    def _text_origin(self):
+        """Top-left of the dialogue text."""
+        return (self.dialogue_panel.rect.left + 20, self.dialogue_panel.rect.top + 30)
         
-        self.final_line_str = lines[-1]
+    def _draw_wrapped_text(self, surface, text):
+        """Draw the typed part of the dialogue, wrapped inside the dialogue panel."""
+        self.text_layout.draw(surface, self._text_origin(), len(text))
 
     def _get_cursor_position(self):
         """Calculate cursor position for typing effect."""
-        text_start_x = self.dialogue_panel.rect.left + 20
-        text_start_y = self.dialogue_panel.rect.top + 30
-        
-        x = self.body_font.render(self.final_line_str, True, WHITE).get_width() + text_start_x if self.current_text else text_start_x
-        y = self.line_height * (self.text_line_num - 1) + text_start_y if self.current_text else text_start_y
-        
-        return (x, y)
\ No newline at end of file
+        return self.text_layout.cursor_position(self._text_origin(), len(self.current_text))
\ No newline at end of file
@@ -6,6 +6,7 @@ from .button import Button
 from .panel import Panel
 from .hud import HUD
 from .status_ui import StatusUI
+from .text_layout import TextLayout
 from .ui_factory import UIFactory
 from .ui_renderer import UIRenderer
 
@@ -14,6 +15,7 @@ __all__ = [
     'Panel',
     'HUD',
     'StatusUI',
+    'TextLayout',
     'UIFactory',
     'UIRenderer',
 ]
\ No newline at end of file
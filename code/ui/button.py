@@ -2,6 +2,9 @@ import pygame
 
 from config import *
 
+from core.display import canvas_draw
+from core.text_cache import TextCache
+
 from ui.panel import Panel
 
 class Button:
@@ -25,7 +28,7 @@ class Button:
         self.panel = None
         self.callback = callback
 
-        self.text_surface = font.render(text, True, text_colour)
+        self.text_surface = TextCache.render(font, text, True, text_colour)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
 
         if self.dungeon_style:
@@ -51,7 +54,7 @@ class Button:
 
     def update_text(self, text):
         self.text = text
-        self.text_surface = self.font.render(text, True, self.text_colour)
+        self.text_surface = TextCache.render(self.font, text, True, self.text_colour)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
 
     def check_hover(self, mouse_pos):
@@ -109,8 +112,8 @@ class Button:
             surface.blit(self.text_surface, self.text_rect)
         else:
 
-            pygame.draw.rect(surface, self.bg_colour, self.rect, border_radius=BUTTON_ROUND_CORNER)
+            canvas_draw.rect(surface, self.bg_colour, self.rect, border_radius=BUTTON_ROUND_CORNER)
 
-            pygame.draw.rect(surface, self.border_colour, self.rect, 2, border_radius=BUTTON_ROUND_CORNER)
+            canvas_draw.rect(surface, self.border_colour, self.rect, 2, border_radius=BUTTON_ROUND_CORNER)
 
             surface.blit(self.text_surface, self.text_rect)
\ No newline at end of file
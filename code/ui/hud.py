@@ -1,5 +1,7 @@
 from config import *
+from core.display import canvas_draw
 from core.resource_loader import ResourceLoader
+from core.text_cache import TextCache
 
 class HUD:
     """Heads-up display for showing active effects and status."""
@@ -18,6 +20,7 @@ class HUD:
         self.last_particle_time = 0
 
         self.health_panel = None
+        self.symbol_font = None
 
     def update_fonts(self, normal_font, small_font=None):
         """Update fonts if they are loaded after initialization."""
@@ -113,22 +116,24 @@ class HUD:
 
                 for r in range(glow_radius, 0, -1):
                     alpha = max(0, 150 - (glow_radius - r) * 20)
-                    pygame.draw.circle(
+                    canvas_draw.circle(
                         surface, (*effect_colour, alpha),
                         (center_x, center_y), r
                     )
 
-                symbol_font = pygame.font.SysFont(None, int(self.effect_icon_size * 0.6))
-                symbol_text = symbol_font.render(icon_symbol, True, WHITE)
+                # One font object, so the text cache can reuse its renderings
+                if self.symbol_font is None:
+                    self.symbol_font = pygame.font.SysFont(None, int(self.effect_icon_size * 0.6))
+                symbol_text = TextCache.render(self.symbol_font, icon_symbol, True, WHITE)
                 symbol_rect = symbol_text.get_rect(center=(center_x, center_y))
                 surface.blit(symbol_text, symbol_rect)
             else:
 
-                pygame.draw.rect(surface, effect_colour, effect_rect)
-                pygame.draw.rect(surface, BLACK, effect_rect, 2)
+                canvas_draw.rect(surface, effect_colour, effect_rect)
+                canvas_draw.rect(surface, BLACK, effect_rect, 2)
 
             if effect['value'] is not None:
-                value_text = self.normal_font.render(str(effect['value']), True, WHITE)
+                value_text = TextCache.render(self.normal_font, str(effect['value']), True, WHITE)
                 value_rect = value_text.get_rect(center=effect_rect.center)
 
                 if using_panels:
@@ -138,7 +143,7 @@ class HUD:
 
             if effect['duration'] is not None:
                 remaining = max(0, effect['duration'] - (pygame.time.get_ticks() - effect['start_time']))
-                remaining_text = self.small_font.render(f"{remaining//1000}s", True, WHITE)
+                remaining_text = TextCache.render(self.small_font, f"{remaining//1000}s", True, WHITE)
 
                 if effect['value'] is not None and using_panels:
 
@@ -159,7 +164,7 @@ class HUD:
 
                 if remaining < EFFECT_EXPIRE_THRESHOLD:
 
-                    remaining_text = self.small_font.render(f"{remaining//1000}s", True, (255, 100, 100))
+                    remaining_text = TextCache.render(self.small_font, f"{remaining//1000}s", True, (255, 100, 100))
 
                     pulse = 0.8 + 0.2 * math.sin(pygame.time.get_ticks() / 100)
                     scaled_size = int(remaining_text.get_width() * pulse), int(remaining_text.get_height() * pulse)
@@ -224,25 +229,25 @@ class HUD:
             )
             surface.blit(glow_surface, (x, y))
 
-            pygame.draw.rect(surface, health_colour, health_rect, border_radius=4)
+            canvas_draw.rect(surface, health_colour, health_rect, border_radius=4)
 
             if health_width > 4:
                 highlight_colour = self._lighten_colour(health_colour, 0.3)
-                pygame.draw.rect(
+                canvas_draw.rect(
                     surface, highlight_colour,
                     (x + 5, y + 5, health_width, 2), border_radius=2
                 )
         else:
 
             bg_rect = pygame.Rect(x, y, bar_width, bar_height)
-            pygame.draw.rect(surface, GRAY, bg_rect, border_radius=5)
+            canvas_draw.rect(surface, GRAY, bg_rect, border_radius=5)
 
             health_rect = pygame.Rect(x, y, health_width, bar_height)
-            pygame.draw.rect(surface, health_colour, health_rect, border_radius=5)
-            pygame.draw.rect(surface, BLACK, bg_rect, 2, border_radius=5)
+            canvas_draw.rect(surface, health_colour, health_rect, border_radius=5)
+            canvas_draw.rect(surface, BLACK, bg_rect, 2, border_radius=5)
 
         text_colour = WHITE
-        health_text = self.normal_font.render(f"{playing_state.life_points}/{playing_state.max_life}", True, text_colour)
+        health_text = TextCache.render(self.normal_font, f"{playing_state.life_points}/{playing_state.max_life}", True, text_colour)
         health_text_rect = health_text.get_rect(center=(x + bar_width//2, y + bar_height//2))
         surface.blit(health_text, health_text_rect)
 
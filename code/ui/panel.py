@@ -2,6 +2,11 @@ import pygame
 import random
 
 from config import *
+from core.display import display
+
+# Noise has a generator of its own, so however much of it the preloader has
+# rendered by the time a run is dealt, a seeded run deals the same cards
+_noise_random = random.Random()
 
 class Panel:
     def __init__(self, width_height, top_left, colour=DARK_GRAY, alpha=None, border_radius=None,
@@ -31,27 +36,79 @@ class Panel:
 
         self._create_surface()
 
+    # Noise textures rendered ahead of time (e.g. by the title screen's
+    # preloader), keyed by size; each one is used up by a single panel
+    _prepared_noise = {}
+
+    @classmethod
+    def prepare_noise(cls, size, texture=None):
+        """Keep a noise texture ready for the next dungeon-style panel of this size"""
+        size = (int(size[0]), int(size[1]))
+        if texture is None:
+            texture = cls.render_noise(size)
+        cls._prepared_noise.setdefault(size, []).append(texture)
+
+    @classmethod
+    def has_prepared_noise(cls, size):
+        """Check whether a noise texture of this size is waiting to be used"""
+        return bool(cls._prepared_noise.get((int(size[0]), int(size[1]))))
+
     def _create_noise_texture(self):
         """Create a subtle noise texture for the panel background"""
-        width, height = self.rect.size
-        self.noise_texture = pygame.Surface((width, height), pygame.SRCALPHA)
+        prepared = self._prepared_noise.get(tuple(self.rect.size))
+        if prepared:
+            self.noise_texture = prepared.pop()
+        else:
+            self.noise_texture = self.render_noise(self.rect.size)
+
+    @staticmethod
+    def render_noise(size):
+        """Render a noise texture in one go"""
+        steps = Panel.render_noise_steps(size)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+
+    @staticmethod
+    def render_noise_steps(size):
+        """
+        Render a noise texture a band of grains at a time, yielding between
+        bands so a preloader can spread it over frames; returns the texture.
+        Each grain is dark at a random strength, or now and then faintly light.
+        """
+        width, height = size
 
         grain_size = 3
+        band_rows = 8
+        columns = -(-width // grain_size)
+        rows = -(-height // grain_size)
+
+        # Drawn a whole number of grains big, then cut down to size
+        noise_texture = pygame.Surface((columns * grain_size, rows * grain_size), pygame.SRCALPHA)
+        darkness = range(26)
+
+        for row in range(0, rows, band_rows):
+            band_height = min(band_rows, rows - row)
+            count = columns * band_height
 
-        for x in range(0, width, grain_size):
-            for y in range(0, height, grain_size):
+            # One RGBA pixel per grain: black at a random alpha, a few white
+            pixels = bytearray(count * 4)
+            pixels[3::4] = bytes(_noise_random.choices(darkness, k=count))
+            for index in _noise_random.sample(range(count), round(count * 0.05)):
+                pixels[index * 4:index * 4 + 4] = bytes((255, 255, 255, _noise_random.randint(5, 15)))
 
-                darkness = random.randint(0, 25)
+            # Scaled straight into place, so the alpha is copied, not blended
+            band = pygame.image.frombuffer(pixels, (columns, band_height), "RGBA")
+            target = noise_texture.subsurface((0, row * grain_size, columns * grain_size, band_height * grain_size))
+            pygame.transform.scale(band, target.get_size(), target)
 
-                pygame.draw.rect(self.noise_texture, (0, 0, 0, darkness),
-                                (x, y, grain_size, grain_size))
+            yield
 
-                if random.random() < 0.05:
-                    lightness = random.randint(5, 15)
-                    pygame.draw.rect(
-                        self.noise_texture, (255, 255, 255, lightness),
-                        (x, y, grain_size, grain_size)
-                    )
+        if noise_texture.get_size() != (width, height):
+            noise_texture = noise_texture.subsurface((0, 0, width, height)).copy()
+        return noise_texture
 
     def _draw_decorative_border(self, surface, rect, border_radius):
         """Draw a decorative border with corner details for a dungeon feel"""
@@ -90,7 +147,7 @@ class Panel:
     def _create_surface(self):
         """Create the panel surface with desired style"""
 
-        self.surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        self.surface = display.retain(pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA))
 
         rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
         pygame.draw.rect(self.surface, self.colour, rect, border_radius=self.border_radius)
@@ -1,7 +1,9 @@
 import pygame
 
 from config import *
+from core.display import display
 from core.resource_loader import ResourceLoader
+from core.text_cache import TextCache
 
 from ui.panel import Panel
 
@@ -12,12 +14,33 @@ class StatusUI:
         self.game_manager = game_manager
         self.header_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 28)
         self.normal_font = ResourceLoader.load_font("fonts/Pixel Times.ttf", 16)
-        self.panel_rect = None
+
+        self.panel_rect = pygame.Rect(
+            (SCREEN_WIDTH//2 - STATUS_PANEL_WIDTH//2, 50),
+            (STATUS_PANEL_WIDTH, STATUS_PANEL_HEIGHT)
+        )
+
+        self.styled_panel = Panel(
+            (self.panel_rect.width, self.panel_rect.height),
+            (self.panel_rect.left, self.panel_rect.top),
+            colour=(70, 60, 45),
+            alpha=230,
+            border_radius=8,
+            dungeon_style=True,
+            border_width=3,
+            border_colour=(110, 90, 50)
+        )
+
+        # Retained text, rebuilt when the floor or room changes
+        self._floor_key = None
+        self._room_key = None
 
     def update_fonts(self, header_font, normal_font):
         """Update fonts if they are loaded after initialization."""
         self.header_font = header_font
         self.normal_font = normal_font
+        self._floor_key = None
+        self._room_key = None
 
     def update_status(self):
         """Update the status UI with current room/floor information."""
@@ -27,6 +50,28 @@ class StatusUI:
         """Draw the status UI with a dungeon-themed panel."""
 
         floor_manager = self.game_manager.floor_manager
+
+        # The header and its glow only change between floors and the room
+        # line once per room, so both are kept until their values change
+        floor_key = (floor_manager.current_floor_index, floor_manager.get_current_floor(), self.header_font)
+        if floor_key != self._floor_key:
+            self._compose_floor_header(floor_manager)
+            self._floor_key = floor_key
+
+        room_key = (floor_manager.current_room, self.normal_font)
+        if room_key != self._room_key:
+            self.room_text = TextCache.render(self.normal_font, f"Room {floor_manager.current_room}", True, (220, 220, 200))
+            self.room_rect = self.room_text.get_rect(centerx=self.panel_rect.centerx, top=self.floor_rect.bottom + 10)
+            self._room_key = room_key
+
+        self.styled_panel.draw(surface)
+        surface.blit(self.glow_surface, self.glow_rect)
+        surface.blit(self.floor_text, self.floor_rect)
+        surface.blit(self.room_text, self.room_rect)
+
+    def _compose_floor_header(self, floor_manager):
+        """Render the floor title and the glow behind it."""
+
         current_floor = floor_manager.get_current_floor()
 
         if "'" in current_floor:
@@ -38,45 +83,13 @@ class StatusUI:
             current_floor = current_floor.title()
         current_floor_index = max(1, floor_manager.current_floor_index + 1)
 
-        current_room = floor_manager.current_room
+        self.floor_text = TextCache.render(self.header_font, f"Floor {current_floor_index}: {current_floor}", True, WHITE)
+        self.floor_rect = self.floor_text.get_rect(centerx=self.panel_rect.centerx, top=self.panel_rect.top + 15)
 
-        total_rooms = FLOOR_TOTAL
-
-        floor_text = self.header_font.render(f"Floor {current_floor_index}: {current_floor}", True, WHITE)
-
-        panel_width = 650
-
-        panel_padding = 60
-        self.panel_rect = pygame.Rect(
-            (SCREEN_WIDTH//2 - panel_width//2, 50),
-            (650, 90)
-        )
-
-        if not hasattr(self, 'styled_panel'):
-
-            self.styled_panel = Panel(
-                (self.panel_rect.width, self.panel_rect.height),
-                (self.panel_rect.left, self.panel_rect.top),
-                colour=(70, 60, 45),
-                alpha=230,
-                border_radius=8,
-                dungeon_style=True,
-                border_width=3,
-                border_colour=(110, 90, 50)
-            )
-
-        self.styled_panel.draw(surface)
-
-        floor_rect = floor_text.get_rect(centerx=self.panel_rect.centerx, top=self.panel_rect.top + 15)
-
-        glow_surface = pygame.Surface((floor_text.get_width() + 10, floor_text.get_height() + 10), pygame.SRCALPHA)
+        self.glow_surface = display.retain(pygame.Surface((self.floor_text.get_width() + 10, self.floor_text.get_height() + 10), pygame.SRCALPHA))
         glow_colour = (230, 220, 170, 30)
-        pygame.draw.ellipse(glow_surface, glow_colour, glow_surface.get_rect())
-        glow_rect = glow_surface.get_rect(center=floor_rect.center)
-
-        surface.blit(glow_surface, glow_rect)
-        surface.blit(floor_text, floor_rect)
+        pygame.draw.ellipse(self.glow_surface, glow_colour, self.glow_surface.get_rect())
+        self.glow_rect = self.glow_surface.get_rect(center=self.floor_rect.center)
 
-        room_text = self.normal_font.render(f"Room {current_room}", True, (220, 220, 200))
-        room_rect = room_text.get_rect(centerx=self.panel_rect.centerx, top=floor_rect.bottom + 10)
-        surface.blit(room_text, room_rect)
\ No newline at end of file
+        # The room line sits under the header, so it has to be placed again
+        self._room_key = None
@@ -0,0 +1,159 @@
+"""
+ui/text_layout.py
+
+Word-wrapped text that is revealed a character at a time.
+The whole text is wrapped once, when it is set, into lines that already
+know where each of their characters goes. Drawing a partly revealed text
+then blits the finished lines from TextCache and one buffer holding the
+line being typed, which is extended glyph by glyph as characters appear.
+The cost of a frame does not depend on how much text there is.
+"""
+
+import pygame
+
+from core.display import display
+from core.text_cache import TextCache
+
+
+class TextLine:
+    """One wrapped line and where its characters sit."""
+
+    __slots__ = ("text", "start", "offsets")
+
+    def __init__(self, text, start, offsets):
+        self.text = text
+        # Index of the line's first character in the whole text
+        self.start = start
+        # x of each character, and of the end of the line, from its left edge
+        self.offsets = offsets
+
+
+class TextLayout:
+    """Wraps a text once and draws any amount of it."""
+
+    def __init__(self, font, colour, max_width, line_height):
+        """
+        Create an empty layout.
+
+        Args:
+            font: Font to draw with
+            colour: Text colour
+            max_width: Widest a line may be, in pixels
+            line_height: Distance between the tops of lines
+        """
+        self.font = font
+        self.colour = tuple(colour)
+        self.max_width = max_width
+        self.line_height = line_height
+
+        self.text = ""
+        self.lines = []
+
+        # The line being typed, drawn up to _typed_count characters
+        self._typed_line = None
+        self._typed_count = 0
+        self._typed_surface = None
+
+    def set_text(self, text):
+        """Wrap a new text, word by word, to the layout's width."""
+        self.text = text
+        self.lines = []
+        self._typed_line = None
+
+        current_line = []
+        wrapped = []
+        for word in text.split(' '):
+            test_line = ' '.join(current_line + [word])
+            if self.font.size(test_line)[0] <= self.max_width:
+                current_line.append(word)
+            else:
+                if current_line:
+                    wrapped.append(' '.join(current_line))
+                    current_line = [word]
+                else:
+                    wrapped.append(word)
+        if current_line:
+            wrapped.append(' '.join(current_line))
+
+        # Lines were split on single spaces, so each starts one past the last
+        start = 0
+        for line in wrapped:
+            offsets = tuple(self.font.size(line[:i])[0] for i in range(len(line) + 1))
+            self.lines.append(TextLine(line, start, offsets))
+            start += len(line) + 1
+
+    def _locate(self, count):
+        """The line index and column after the first count characters."""
+        for index in range(len(self.lines) - 1, -1, -1):
+            line = self.lines[index]
+            if count >= line.start:
+                return index, min(count - line.start, len(line.text))
+        return 0, 0
+
+    def cursor_position(self, origin, count):
+        """
+        Where a cursor after the first count characters goes.
+
+        Args:
+            origin: Top-left of the text
+            count: Characters revealed
+
+        Returns:
+            (x, y) of the cursor's top
+        """
+        if not self.lines or count <= 0:
+            return origin
+        index, column = self._locate(count)
+        return (origin[0] + self.lines[index].offsets[column], origin[1] + index * self.line_height)
+
+    def draw(self, surface, origin, count=None):
+        """
+        Draw the first count characters.
+
+        Args:
+            surface: Surface to draw on
+            origin: Top-left of the text
+            count: Characters revealed; all of them if None
+        """
+        if not self.lines:
+            return
+        if count is None:
+            count = len(self.text)
+
+        index, column = self._locate(count) if count > 0 else (0, 0)
+        x, y = origin
+        for line in self.lines[:index]:
+            surface.blit(TextCache.render(self.font, line.text, True, self.colour), (x, y))
+            y += self.line_height
+
+        line = self.lines[index]
+        if column == len(line.text):
+            surface.blit(TextCache.render(self.font, line.text, True, self.colour), (x, y))
+        elif column:
+            surface.blit(self._typed(line, column), (x, y))
+
+    def _typed(self, line, column):
+        """The buffer for a partly typed line, extended to column characters."""
+        if self._typed_line is not line or column < self._typed_count:
+            # Sized as the whole line renders, descenders included
+            width, height = self.font.size(line.text)
+            size = (max(1, width), height)
+            if self._typed_surface is None or self._typed_surface.get_size() != size:
+                self._typed_surface = display.retain(pygame.Surface(size, pygame.SRCALPHA))
+            else:
+                self._typed_surface.fill((0, 0, 0, 0))
+            self._typed_line = line
+            self._typed_count = 0
+
+        for i in range(self._typed_count, column):
+            glyph, advance = TextCache.glyph(self.font, line.text[i], self.colour)
+            # Measured back from the end of the glyph, which takes in any
+            # kerning against the one before it
+            x = line.offsets[i + 1] - advance
+            # Glyphs do not overlap, so taking the maximum copies them exactly
+            self._typed_surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        if column != self._typed_count:
+            display.changed(self._typed_surface)
+        self._typed_count = column
+
+        return self._typed_surface
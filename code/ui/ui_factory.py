@@ -16,8 +16,8 @@ class UIFactory:
     def create_run_button(self):
         """Create the run button with dungeon styling."""
 
-        run_width = 90
-        run_height = 45
+        run_width = RUN_BUTTON_WIDTH
+        run_height = RUN_BUTTON_HEIGHT
 
         run_x = SCREEN_WIDTH // 2
         run_y = 170
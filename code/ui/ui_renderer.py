@@ -3,6 +3,9 @@ import random
 
 from config import *
 
+from core.display import canvas_draw
+from core.text_cache import TextCache
+
 from ui.panel import Panel
 
 class UIRenderer:
@@ -22,8 +25,8 @@ class UIRenderer:
 
         health_display_x = 40
         health_display_y = SCREEN_HEIGHT - self.session.deck.rect.y
-        health_bar_width = 140
-        health_bar_height = 40
+        health_bar_width = HEALTH_PANEL_WIDTH - 20
+        health_bar_height = HEALTH_PANEL_HEIGHT - 20
 
         if not hasattr(self, 'health_panel'):
             panel_rect = pygame.Rect(
@@ -86,7 +89,7 @@ class UIRenderer:
                 health_bar_height
             )
 
-            pygame.draw.rect(surface, health_colour, health_rect, border_radius=5)
+            canvas_draw.rect(surface, health_colour, health_rect, border_radius=5)
 
             glow_surf = pygame.Surface((health_width, health_bar_height), pygame.SRCALPHA)
             pygame.draw.rect(glow_surf, glow_colour, pygame.Rect(0, 0, health_width, health_bar_height), border_radius=5)
@@ -114,7 +117,7 @@ class UIRenderer:
             highlight_surface.fill((255, 255, 255, 60))
             surface.blit(highlight_surface, highlight_rect)
 
-        health_text = self.playing_state.body_font.render(f"{self.session.life_points}/{self.session.max_life}", True, WHITE)
+        health_text = TextCache.render(self.playing_state.body_font, f"{self.session.life_points}/{self.session.max_life}", True, WHITE)
         health_text_rect = health_text.get_rect(center=bar_bg_rect.center)
 
         glow_surf = pygame.Surface((health_text.get_width() + 10, health_text.get_height() + 10), pygame.SRCALPHA)
@@ -127,8 +130,8 @@ class UIRenderer:
     def draw_deck_count(self, surface):
         """Draw deck card counter display with current and total cards."""
 
-        count_panel_width = 80
-        count_panel_height = 40
+        count_panel_width = DECK_COUNT_PANEL_WIDTH
+        count_panel_height = DECK_COUNT_PANEL_HEIGHT
         count_panel_x = 87 + CARD_WIDTH//2 - count_panel_width//2
         count_panel_y = 35 + (len(self.session.deck.cards)-1)*3 + CARD_HEIGHT//2 - count_panel_height//2
 
@@ -156,7 +159,7 @@ class UIRenderer:
 
         self.count_panel.draw(surface)
 
-        count_text = self.playing_state.caption_font.render(f"{len(self.session.deck.cards)}/{DECK_TOTAL_COUNT}", True, WHITE)
+        count_text = TextCache.render(self.playing_state.caption_font, f"{len(self.session.deck.cards)}/{DECK_TOTAL_COUNT}", True, WHITE)
         count_text_rect = count_text.get_rect(center=self.count_panel.rect.center)
         surface.blit(count_text, count_text_rect)
 